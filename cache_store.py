@@ -6,12 +6,12 @@ class CacheStore:
         self.store: Dict[str, Any] = {}
         self.ttl = ttl
     
-    def key_from_payload(self, target: str, user_agent: str) -> str:
-        combined = f"{target}:{user_agent}"
+    def key_from_payload(self, target: str, caller_mask: int) -> str:
+        combined = f"{target}:{caller_mask}"
         return hashlib.sha256(combined.encode()).hexdigest()[:16]
     
-    def get(self, key: str) -> Optional[Any]:
-        return self.store.get(key)
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        return self.store.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         self.store[key] = value
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 from core.loader import TypeLoader
 from nodes.resolver import TypeResolverNode
 from nodes.detection import MaskDetectorNode
@@ -9,7 +9,7 @@ from nodes.caching import CacheNode
 from nodes.response import ResponseBuilderNode
 
 class Pipeline:
-    def __init__(self, yaml_path: str):
+    def __init__(self, yaml_path: str, cache_store: Optional[Any] = None):
         self.loader = TypeLoader(yaml_path)
         
         self.resolver = TypeResolverNode(self.loader)
@@ -18,22 +18,32 @@ class Pipeline:
         self.sanitizer = SanitizerNode()
         self.swap = SwapNode(self.loader)
         self.transformer = TransformerNode()
-        self.cache = CacheNode()
+        self.cache = CacheNode(store=cache_store)
         self.response = ResponseBuilderNode()
         
         self._build_chain()
     
     def _build_chain(self) -> None:
-        self.resolver.next_nodes = [self.detector]
         self.detector.next_nodes = [self.validator]
-        self.validator.next_nodes = [self.sanitizer]
+        self.validator.next_nodes = [self.cache]
+        self.cache.next_nodes = [self.resolver]
+        self.resolver.next_nodes = [self.sanitizer]
         self.sanitizer.next_nodes = [self.swap]
         self.swap.next_nodes = [self.transformer]
-        self.transformer.next_nodes = [self.cache]
-        self.cache.next_nodes = [self.response]
+        self.transformer.next_nodes = [self.response]
     
     def execute(self, payload: dict, user_agent: str = '', auth_token: str = '') -> dict:
-        request_data = {
+        return self.detector.execute(self._request(payload, user_agent, auth_token))
+    
+    def execute_batch(self, payloads: List[dict], user_agent: str = '', auth_token: str = '') -> List[dict]:
+        items = [self._request(payload, user_agent, auth_token) for payload in payloads]
+        for data in items:
+            self.detector.process(data)
+            self.validator.process(data)
+        return self.cache.execute_batch(items)
+    
+    def _request(self, payload: dict, user_agent: str, auth_token: str) -> Dict[str, Any]:
+        return {
             'target': payload.get('target'),
             'payload': payload.get('payload'),
             'user_agent': user_agent,
@@ -41,5 +51,3 @@ class Pipeline:
             'mask': 0x0000,
             'valid': True
         }
-        
-        return self.resolver.execute(request_data)
@@ -1,12 +1,17 @@
 import os
-from registry import MasterRegistry
-from universal_resolver import UniversalResolver
-from middleware import ValueSwapMiddleware
+from functools import lru_cache
 
 yaml_path = os.path.join(os.path.dirname(__file__), '..', 'master_registry.yaml')
-registry = MasterRegistry(yaml_path)
-resolver = UniversalResolver(registry)
-middleware = ValueSwapMiddleware(resolver)
+
+@lru_cache(maxsize=None)
+def get_middleware():
+    from registry import MasterRegistry
+    from universal_resolver import UniversalResolver
+    from middleware import ValueSwapMiddleware
+    
+    registry = MasterRegistry(yaml_path)
+    resolver = UniversalResolver(registry)
+    return ValueSwapMiddleware(resolver)
 
 def handle_request(payload_dict: dict, user_agent: str = '', auth_token: str = '') -> dict:
-    return middleware.process(payload_dict, user_agent, auth_token)
+    return get_middleware().process(payload_dict, user_agent, auth_token)
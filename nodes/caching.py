@@ -1,22 +1,67 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from nodes.base import Node
 import hashlib
 
+_MISS = object()
+
 class CacheNode(Node):
-    def __init__(self, ttl: int = 300):
+    def __init__(self, ttl: int = 300, store: Optional[Any] = None):
         super().__init__('cache')
-        self.store: Dict[str, Any] = {}
+        self.store: Any = store if store is not None else {}
         self.ttl = ttl
     
     def process(self, data: Any) -> Dict[str, Any]:
-        target = data.get('target', '')
-        ua = data.get('user_agent', '')
-        key = hashlib.sha256(f"{target}:{ua}".encode()).hexdigest()[:16]
+        return self.process_batch([data])[0]
+    
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        keys = [self._key(data) for data in items]
+        get_many = getattr(self.store, 'get_many', None)
+        cached = get_many(keys) if get_many else {key: self.store.get(key, _MISS) for key in keys}
         
-        if key in self.store:
-            data['cached'] = self.store[key]
-        else:
-            data['cached'] = None
+        for data, key in zip(items, keys):
+            value = cached.get(key, _MISS) if data.get('valid') else _MISS
+            data['cache_key'] = key
+            data['cache_hit'] = value is not _MISS
+            data['cached'] = None if value is _MISS else value
+            if data['cache_hit'] and value is None:
+                data['resolved'] = False
+        return items
+    
+    def execute(self, data: Any) -> Any:
+        return self.execute_batch([data])[0]
+    
+    def execute_batch(self, items: List[Dict[str, Any]]) -> List[Any]:
+        self.process_batch(items)
         
-        data['cache_key'] = key
-        return data
+        results = []
+        writes = {}
+        for data in items:
+            if data['cached'] is not None:
+                results.append(data['cached'])
+                continue
+            
+            result = data
+            for node in self.next_nodes:
+                result = node.execute(result)
+            results.append(result)
+            
+            if data.get('valid') and not data['cache_hit']:
+                writes[data['cache_key']] = result if data.get('coord_def') else None
+        
+        self._store_many(writes)
+        return results
+    
+    def _store_many(self, writes: Dict[str, Any]) -> None:
+        if not writes:
+            return
+        set_many = getattr(self.store, 'set_many', None)
+        if set_many:
+            set_many(writes)
+        else:
+            for key, value in writes.items():
+                self.store[key] = value
+    
+    def _key(self, data: Dict[str, Any]) -> str:
+        target = data.get('target', '')
+        mask = data.get('mask', 0x0000)
+        return hashlib.sha256(f"{target}:{mask}".encode()).hexdigest()[:16]
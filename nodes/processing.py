@@ -1,5 +1,7 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping
 from nodes.base import Node
+from transformer import Transformer
+from types import Mask
 
 class SanitizerNode(Node):
     def __init__(self, max_len: int = 1000):
@@ -22,18 +24,33 @@ class SanitizerNode(Node):
 class TransformerNode(Node):
     def __init__(self):
         super().__init__('transformer')
-        self.transforms: Dict[int, Any] = {}
+        self.transformer = Transformer()
+        self.transforms: Mapping[int, Any] = self.transformer.transforms
     
     def register(self, mask_bits: int, fn: Any) -> None:
-        self.transforms[mask_bits] = fn
+        self.transformer.register_transform(mask_bits, fn)
+    
+    def add_rule(self, fn: Any, required: int = 0, forbidden: int = 0, priority: int = 0) -> Any:
+        return self.transformer.add_rule(fn, required, forbidden, priority)
     
     def process(self, data: Any) -> Dict[str, Any]:
-        mask = data.get('mask', 0x0000)
-        payload = data.get('payload')
-        
-        if mask & 0x0800:
-            fn = self.transforms.get(mask)
-            if fn:
-                data['payload'] = fn(payload)
+        chain = self.transformer.dispatch(data.get('mask', 0x0000))
+        if chain:
+            payload = data.get('payload')
+            for fn in chain:
+                payload = fn(payload)
+            data['payload'] = payload
         
         return data
+    
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        by_mask: Dict[int, List[Dict[str, Any]]] = {}
+        for data in items:
+            by_mask.setdefault(data.get('mask', 0x0000), []).append(data)
+        
+        for mask, group in by_mask.items():
+            payloads = self.transformer.transform_many([data.get('payload') for data in group], Mask(mask))
+            for data, payload in zip(group, payloads):
+                data['payload'] = payload
+        
+        return items
@@ -12,6 +12,12 @@ class TypeResolverNode(Node):
         self.l3 = Layer3(loader)
     
     def process(self, data: Any) -> Dict[str, Any]:
+        if data.get('resolved') is False:
+            data['coord_def'] = {}
+            data['coord_addr'] = ''
+            data['coord_mask'] = 0x0000
+            return data
+        
         target = data.get('target')
         data['coord_def'] = self.l1.resolve(target)
         data['coord_addr'] = self.l2.resolve(target)
@@ -1,13 +1,22 @@
 from node import Node
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, List, Mapping, Optional
+from transformer import Transformer
+from types import Mask
 from type_loader import TypeLoader
 
+_MISS = object()
+
 class TypeResolverNode(Node):
     def __init__(self, type_loader: TypeLoader):
         super().__init__('type_resolver')
         self.loader = type_loader
     
     def process(self, data: Any) -> Dict[str, Any]:
+        if data.get('resolved') is False:
+            data['coord_def'] = {}
+            data['coord_mask'] = 0x0000
+            return data
+        
         target = data.get('target')
         layer1 = self.loader.get_layer('layer1_human_map')
         layer3 = self.loader.get_layer('layer3_bitmask_core')
@@ -91,42 +100,100 @@ class SwapNode(Node):
 class TransformerNode(Node):
     def __init__(self):
         super().__init__('transformer')
-        self.transforms: Dict[int, Callable] = {}
+        self.transformer = Transformer()
+        self.transforms: Mapping[int, Callable] = self.transformer.transforms
     
     def register_transform(self, mask_bits: int, fn: Callable) -> None:
-        self.transforms[mask_bits] = fn
+        self.transformer.register_transform(mask_bits, fn)
+    
+    def add_rule(self, fn: Callable, required: int = 0, forbidden: int = 0, priority: int = 0) -> Any:
+        return self.transformer.add_rule(fn, required, forbidden, priority)
     
     def process(self, data: Any) -> Dict[str, Any]:
-        mask = data.get('mask', 0x0000)
-        payload = data.get('payload')
-        
-        if mask & 0x0800:
-            fn = self.transforms.get(mask)
-            if fn:
-                data['payload'] = fn(payload)
+        chain = self.transformer.dispatch(data.get('mask', 0x0000))
+        if chain:
+            payload = data.get('payload')
+            for fn in chain:
+                payload = fn(payload)
+            data['payload'] = payload
         
         return data
+    
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        by_mask: Dict[int, List[Dict[str, Any]]] = {}
+        for data in items:
+            by_mask.setdefault(data.get('mask', 0x0000), []).append(data)
+        
+        for mask, group in by_mask.items():
+            payloads = self.transformer.transform_many([data.get('payload') for data in group], Mask(mask))
+            for data, payload in zip(group, payloads):
+                data['payload'] = payload
+        
+        return items
 
 class CacheNode(Node):
-    def __init__(self, ttl: int = 300):
+    def __init__(self, ttl: int = 300, store: Optional[Any] = None):
         super().__init__('cache')
-        self.store: Dict[str, Any] = {}
+        self.store: Any = store if store is not None else {}
         self.ttl = ttl
     
     def process(self, data: Any) -> Dict[str, Any]:
-        import hashlib
+        return self.process_batch([data])[0]
+    
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        keys = [self._key(data) for data in items]
+        get_many = getattr(self.store, 'get_many', None)
+        cached = get_many(keys) if get_many else {key: self.store.get(key, _MISS) for key in keys}
         
-        target = data.get('target', '')
-        ua = data.get('user_agent', '')
-        key = hashlib.sha256(f"{target}:{ua}".encode()).hexdigest()[:16]
+        for data, key in zip(items, keys):
+            value = cached.get(key, _MISS) if data.get('valid') else _MISS
+            data['cache_key'] = key
+            data['cache_hit'] = value is not _MISS
+            data['cached'] = None if value is _MISS else value
+            if data['cache_hit'] and value is None:
+                data['resolved'] = False
+        return items
+    
+    def execute(self, data: Any) -> Any:
+        return self.execute_batch([data])[0]
+    
+    def execute_batch(self, items: List[Dict[str, Any]]) -> List[Any]:
+        self.process_batch(items)
+        
+        results = []
+        writes = {}
+        for data in items:
+            if data['cached'] is not None:
+                results.append(data['cached'])
+                continue
+            
+            result = data
+            for node in self.next_nodes:
+                result = node.execute(result)
+            results.append(result)
+            
+            if data.get('valid') and not data['cache_hit']:
+                writes[data['cache_key']] = result if data.get('coord_def') else None
         
-        if key in self.store:
-            data['cached'] = self.store[key]
+        self._store_many(writes)
+        return results
+    
+    def _store_many(self, writes: Dict[str, Any]) -> None:
+        if not writes:
+            return
+        set_many = getattr(self.store, 'set_many', None)
+        if set_many:
+            set_many(writes)
         else:
-            data['cached'] = None
+            for key, value in writes.items():
+                self.store[key] = value
+    
+    def _key(self, data: Dict[str, Any]) -> str:
+        import hashlib
         
-        data['cache_key'] = key
-        return data
+        target = data.get('target', '')
+        mask = data.get('mask', 0x0000)
+        return hashlib.sha256(f"{target}:{mask}".encode()).hexdigest()[:16]
 
 class ResponseBuilderNode(Node):
     def __init__(self):
@@ -1,4 +1,5 @@
 import os
+from typing import Any, Dict, List, Optional
 from type_loader import TypeLoader
 from nodes_core import (
     TypeResolverNode, MaskDetectorNode, ValidatorNode,
@@ -6,7 +7,7 @@ from nodes_core import (
 )
 
 class Pipeline:
-    def __init__(self, yaml_path: str):
+    def __init__(self, yaml_path: str, cache_store: Optional[Any] = None):
         self.type_loader = TypeLoader(yaml_path)
         self.type_resolver = TypeResolverNode(self.type_loader)
         self.mask_detector = MaskDetectorNode()
@@ -14,22 +15,32 @@ class Pipeline:
         self.sanitizer = SanitizerNode()
         self.swap = SwapNode(self.type_loader)
         self.transformer = TransformerNode()
-        self.cache = CacheNode()
+        self.cache = CacheNode(store=cache_store)
         self.response_builder = ResponseBuilderNode()
         
         self._build_chain()
     
     def _build_chain(self) -> None:
-        self.type_resolver.next_nodes = [self.mask_detector]
         self.mask_detector.next_nodes = [self.validator]
-        self.validator.next_nodes = [self.sanitizer]
+        self.validator.next_nodes = [self.cache]
+        self.cache.next_nodes = [self.type_resolver]
+        self.type_resolver.next_nodes = [self.sanitizer]
         self.sanitizer.next_nodes = [self.swap]
         self.swap.next_nodes = [self.transformer]
-        self.transformer.next_nodes = [self.cache]
-        self.cache.next_nodes = [self.response_builder]
+        self.transformer.next_nodes = [self.response_builder]
     
     def execute(self, payload: dict, user_agent: str = '', auth_token: str = '') -> dict:
-        request_data = {
+        return self.mask_detector.execute(self._request(payload, user_agent, auth_token))
+    
+    def execute_batch(self, payloads: List[dict], user_agent: str = '', auth_token: str = '') -> List[dict]:
+        items = [self._request(payload, user_agent, auth_token) for payload in payloads]
+        for data in items:
+            self.mask_detector.process(data)
+            self.validator.process(data)
+        return self.cache.execute_batch(items)
+    
+    def _request(self, payload: dict, user_agent: str, auth_token: str) -> Dict[str, Any]:
+        return {
             'target': payload.get('target'),
             'payload': payload.get('payload'),
             'user_agent': user_agent,
@@ -37,5 +48,3 @@ class Pipeline:
             'mask': 0x0000,
             'valid': True
         }
-        
-        return self.type_resolver.execute(request_data)
@@ -0,0 +1,81 @@
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from clc.services.coordinate_resolver import CoordinateResolver
+from clc.storage.compact_registry import CompactRegistry
+
+SCHEMA_TYPES = ["Person", "Dataset", "Product", "SiteNavigationElement", "Article"]
+VOCABULARY = [f"term{i}" for i in range(2_000)]
+
+
+def build_registry(coordinates, seed=0):
+    rng = random.Random(seed)
+    keys = [f"COORD_{i:07d}" for i in range(coordinates)]
+    return {
+        "layer1_human_map": {
+            key: {
+                "label": f"Label_{i % 50_000}",
+                "description": f"Generated coordinate {i}",
+                "seo_keywords": ["".join(rng.choice(VOCABULARY)) for _ in range(3)],
+                "schema_type": "".join(rng.choice(SCHEMA_TYPES)),
+            }
+            for i, key in enumerate(keys)
+        },
+        "layer2_coordinate_registry": {
+            key: f"{i % 16:x}{i % 4096:03x}.{i // 4096 % 65536:04x}@"
+            for i, key in enumerate(keys)
+        },
+        "layer3_bitmask_core": {key: i & 0xFFFF for i, key in enumerate(keys)},
+    }
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current
+
+
+def time_resolve(registry, keys):
+    resolver = CoordinateResolver(registry)
+    started = time.perf_counter()
+    for key in keys:
+        resolver.resolve(key)
+    return (time.perf_counter() - started) / len(keys) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'layout':>8} {'memory':>12} {'per coord':>10} {'resolve':>12}")
+    for size in args.sizes:
+        registry, dict_bytes = traced(lambda: build_registry(size))
+        rng = random.Random(size)
+        keys = [f"COORD_{rng.randrange(size):07d}" for _ in range(args.lookups)]
+        dict_us = time_resolve(registry, keys)
+
+        compact, compact_bytes = traced(lambda: CompactRegistry.from_registry(build_registry(size)))
+        compact_us = time_resolve(compact, keys)
+
+        for layout, used, per_lookup in (
+            ("dict", dict_bytes, dict_us),
+            ("compact", compact_bytes, compact_us),
+        ):
+            print(
+                f"{size:>10} {layout:>8} {used / 2**20:>10.1f}MB "
+                f"{used / size:>9.0f}B {per_lookup:>10.2f}us"
+            )
+        del registry, compact
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from clc.enums import BitPosition
+from clc.storage.entity_store import EntityStore, entities, to_signed, to_unsigned
+from sqlalchemy import and_, select, update
+
+
+def read_modify_write(store, ops):
+    started = time.perf_counter()
+    with store.engine.begin() as conn:
+        for entity_id, set_mask, clear_mask in ops:
+            where = and_(entities.c.entity_type == "user", entities.c.entity_id == entity_id)
+            flags = to_unsigned(conn.execute(select(entities.c.status_flags).where(where)).scalar_one())
+            flags = (flags | set_mask) & ~clear_mask
+            conn.execute(update(entities).where(where).values(status_flags=to_signed(flags)))
+    return time.perf_counter() - started
+
+
+def batched(store, ops):
+    started = time.perf_counter()
+    for entity_id, set_mask, clear_mask in ops:
+        store.queue("user", entity_id, set_mask=set_mask, clear_mask=clear_mask)
+    store.flush()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=200_000)
+    args = parser.parse_args()
+
+    positions = list(BitPosition)
+    rng = random.Random(7)
+    ops = [
+        (
+            str(rng.randrange(args.entities)),
+            rng.choice(positions).mask(),
+            rng.choice(positions).mask(),
+        )
+        for _ in range(args.updates)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, runner in (("read-modify-write", read_modify_write), ("batched", batched)):
+            path = os.path.join(tmp, f"{name}.db")
+            store = EntityStore(f"sqlite:///{path}", flush_window=3600, max_pending=len(ops))
+            store.create_many(("user", str(i), 0, None) for i in range(args.entities))
+
+            elapsed = runner(store, ops)
+            print(f"{name:>18}: {len(ops) / elapsed:12,.0f} updates/s ({elapsed:.2f}s)")
+            if name == "batched":
+                stats = store.stats()
+                print(
+                    f"{'':>18}  {stats['rows_flushed']:,} coalesced rows, "
+                    f"{stats['rows_per_second']:,.0f} rows/s in UPDATE executemany"
+                )
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from clc.enums import BitPosition
+from clc.storage.flag_column import FlagColumnStore
+
+QUERIES = {
+    "all_of active+verified": {
+        "all_of": BitPosition.IS_ACTIVE.mask() | BitPosition.IS_VERIFIED.mask()
+    },
+    "any_of admin|moderate": {
+        "any_of": BitPosition.CAN_ADMIN.mask() | BitPosition.CAN_MODERATE.mask()
+    },
+    "active, none_of banned": {
+        "all_of": BitPosition.IS_ACTIVE.mask(),
+        "none_of": BitPosition.IS_BANNED.mask(),
+    },
+}
+
+
+def build(store, rows, batch_rows):
+    rng = np.random.default_rng(11)
+    started = time.perf_counter()
+    for start in range(0, rows, batch_rows):
+        count = min(batch_rows, rows - start)
+        ids = np.arange(start, start + count, dtype=np.uint64)
+        flags = rng.integers(0, 1 << 48, size=count, dtype=np.uint64)
+        store.append(ids, flags)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000_000, 100_000_000])
+    parser.add_argument("--batch-rows", type=int, default=1 << 24)
+    parser.add_argument("--dir", default=None)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+            store = FlagColumnStore(tmp, segment_rows=args.batch_rows)
+            elapsed = build(store, rows, args.batch_rows)
+            print(f"{rows:,} rows: appended in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s)")
+
+            for name, query in QUERIES.items():
+                started = time.perf_counter()
+                matched = store.count(**query)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"  {name:<24} {matched:>12,} matches  "
+                    f"{rows / elapsed / 1e6:8.1f} M rows/s"
+                )
+
+            started = time.perf_counter()
+            for entity_id in range(0, rows, max(rows // 1000, 1)):
+                store.get(entity_id)
+            elapsed = time.perf_counter() - started
+            print(f"  point lookups: {elapsed / 1000 * 1e6:.1f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import os
+import random
+import tempfile
+import tracemalloc
+
+from clc.storage.entity_store import EntityStore
+from clc.storage.flag_transfer import FlagSchema, export_flags, import_flags
+
+COLUMNS = ["is_active", "is_vip", "is_verified", "is_banned", "can_read", "can_write"]
+
+
+def write_source(path, rows, seed=0):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",".join(["entity_type", "entity_id", *COLUMNS]) + "\n")
+        for i in range(rows):
+            bits = [rng.choice(("1", "0", "true", "false", "")) for _ in COLUMNS]
+            f.write(",".join(["user", str(i), *bits]) + "\n")
+
+
+def traced(run):
+    tracemalloc.start()
+    result = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    schema = FlagSchema.parse(COLUMNS)
+    print(f"{'rows':>10} {'direction':>9} {'rows/s':>12} {'peak memory':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            source = os.path.join(tmp, f"source-{rows}.csv")
+            write_source(source, rows)
+            store = EntityStore(f"sqlite:///{os.path.join(tmp, f'entities-{rows}.db')}")
+
+            for direction, run in (
+                ("import", lambda: import_flags(store, source, schema, chunk_size=args.chunk_size)),
+                (
+                    "export",
+                    lambda: export_flags(
+                        store, os.path.join(tmp, f"out-{rows}.jsonl"), schema,
+                        chunk_size=args.chunk_size,
+                    ),
+                ),
+            ):
+                result, peak = traced(run)
+                print(
+                    f"{rows:>10,} {direction:>9} {result.rows_per_second:>12,.0f} "
+                    f"{peak / 1e6:>10.1f}MB"
+                )
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
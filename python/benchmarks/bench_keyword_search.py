@@ -0,0 +1,63 @@
+import argparse
+import random
+import time
+
+from clc.services.coordinate_resolver import CoordinateResolver
+
+VOCABULARY = [
+    "user", "profile", "name", "dashboard", "stats", "navigation", "billing",
+    "invoice", "payment", "order", "cart", "product", "search", "settings",
+    "account", "security", "session", "report", "export", "admin",
+]
+
+
+def build_registry(coordinates, seed=5):
+    rng = random.Random(seed)
+    layer1 = {}
+    for i in range(coordinates):
+        words = rng.sample(VOCABULARY, 3)
+        layer1[f"COORD_{i:07d}"] = {
+            "label": f"{words[0].title()}_{words[1].title()}_{i}",
+            "description": f"{words[2]} entry {i}",
+            "seo_keywords": words + [f"sku{i}"],
+        }
+    return {"layer1_human_map": layer1}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--coordinates", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    registry = build_registry(args.coordinates)
+    resolver = CoordinateResolver(registry)
+
+    started = time.perf_counter()
+    index = resolver.build_keyword_index()
+    print(
+        f"{args.coordinates:,} coordinates: indexed {len(index):,} tokens "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+
+    rng = random.Random(9)
+    workloads = {
+        "exact keyword": lambda: rng.choice(VOCABULARY),
+        "prefix": lambda: rng.choice(VOCABULARY)[:3],
+        "unique sku": lambda: f"sku{rng.randrange(args.coordinates)}",
+        "two terms": lambda: " ".join(rng.sample(VOCABULARY, 2)),
+    }
+    for name, make_query in workloads.items():
+        queries = [make_query() for _ in range(args.queries)]
+        for query in queries[:50]:
+            resolver.search(query)
+
+        started = time.perf_counter()
+        for query in queries:
+            resolver.search(query)
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<14} {elapsed / len(queries) * 1e6:10.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import yaml
+
+from clc.services.coordinate_resolver import CoordinateResolver
+from clc.services.sqlite_resolver import SQLiteCoordinateResolver
+from clc.storage.sqlite_registry import import_registry
+
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
+
+
+def build_registry(coordinates):
+    keys = [f"COORD_{i:07d}" for i in range(coordinates)]
+    return {
+        "layer1_human_map": {
+            key: {"label": f"Label_{i}", "seo_keywords": ["bench", f"k{i}"]}
+            for i, key in enumerate(keys)
+        },
+        "layer2_coordinate_registry": {
+            key: f"{i % 16:x}{i % 4096:03x}.{i // 4096 % 65536:04x}@"
+            for i, key in enumerate(keys)
+        },
+        "layer3_bitmask_core": {key: i & 0xFFFF for i, key in enumerate(keys)},
+    }
+
+
+def time_lookups(resolver, keys):
+    for key in keys[:1000]:
+        resolver.resolve(key)
+
+    started = time.perf_counter()
+    for key in keys:
+        resolver.resolve(key)
+    resolve_us = (time.perf_counter() - started) / len(keys) * 1e6
+
+    started = time.perf_counter()
+    for key in keys:
+        resolver.resolve_mask(key)
+    mask_us = (time.perf_counter() - started) / len(keys) * 1e6
+    return resolve_us, mask_us
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'backend':>8} {'startup':>10} {'resolve':>12} {'mask':>12}")
+    for size in args.sizes:
+        registry = build_registry(size)
+        rng = random.Random(size)
+        keys = [f"COORD_{rng.randrange(size):07d}" for _ in range(args.lookups)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            yaml_path = os.path.join(tmp, "registry.yaml")
+            db_path = os.path.join(tmp, "registry.db")
+            with open(yaml_path, "w", encoding="utf-8") as f:
+                yaml.dump(registry, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
+            import_registry(registry, db_path)
+            del registry
+
+            started = time.perf_counter()
+            with open(yaml_path, "r", encoding="utf-8") as f:
+                yaml_resolver = CoordinateResolver(yaml.load(f, Loader=Loader))
+            yaml_startup = time.perf_counter() - started
+
+            started = time.perf_counter()
+            sqlite_resolver = SQLiteCoordinateResolver(db_path)
+            sqlite_resolver.resolve_mask(keys[0])
+            sqlite_startup = time.perf_counter() - started
+
+            for name, resolver, startup in (
+                ("yaml", yaml_resolver, yaml_startup),
+                ("sqlite", sqlite_resolver, sqlite_startup),
+            ):
+                resolve_us, mask_us = time_lookups(resolver, keys)
+                print(
+                    f"{size:>10,} {name:>8} {startup * 1e3:>8.1f}ms "
+                    f"{resolve_us:>10.1f}us {mask_us:>10.1f}us"
+                )
+            sqlite_resolver.close()
+
+
+if __name__ == "__main__":
+    main()
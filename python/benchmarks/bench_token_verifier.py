@@ -0,0 +1,51 @@
+import argparse
+import random
+import time
+
+from clc.services.caller_detector import CallerDetector
+from clc.services.token_verifier import HMACTokenVerifier
+
+
+def workload(verifier, callers, requests, forged_rate, seed=0):
+    rng = random.Random(seed)
+    tokens = [verifier.issue(f"user-{i}") for i in range(callers)]
+    headers = []
+    for _ in range(requests):
+        if rng.random() < forged_rate:
+            headers.append(f"Bearer forged-{rng.randrange(callers)}.sig")
+        else:
+            headers.append(f"Bearer {tokens[min(int(rng.paretovariate(1.2)) - 1, callers - 1)]}")
+    return headers
+
+
+def run(detector, headers):
+    started = time.perf_counter()
+    for header in headers:
+        detector.detect("Mozilla/5.0", header)
+    return len(headers) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--callers", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--forged-rate", type=float, default=0.1)
+    parser.add_argument("--cache-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    verifier = HMACTokenVerifier(b"benchmark-secret")
+    print(f"{'callers':>10} {'mode':>10} {'detects/s':>12} {'hit rate':>9}")
+    for callers in args.callers:
+        headers = workload(verifier, callers, args.requests, args.forged_rate)
+        for mode, detector in (
+            ("pattern", CallerDetector()),
+            ("uncached", CallerDetector(verifier, token_cache_size=0)),
+            ("cached", CallerDetector(verifier, token_cache_size=args.cache_size)),
+        ):
+            rate = run(detector, headers)
+            hit_rate = detector.token_stats().get("hit_rate", 0.0)
+            print(f"{callers:>10,} {mode:>10} {rate:>12,.0f} {hit_rate:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
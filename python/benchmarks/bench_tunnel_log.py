@@ -0,0 +1,59 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from clc.enums import CallerType, ProjectionType
+from clc.storage.tunnel_log import TunnelLogWriter
+from clc.tools.logs import summarize
+
+CALLERS = [CallerType.BOT.value, CallerType.AUTHENTICATED.value, CallerType.ATTACKER.value]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=2_000_000)
+    parser.add_argument("--segment-records", type=int, default=1 << 18)
+    parser.add_argument("--coordinates", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    keys = [f"COORD_{i:06d}" for i in range(args.coordinates)]
+    request_id = uuid.uuid4().bytes
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = TunnelLogWriter(tmp, segment_records=args.segment_records)
+        started = time.perf_counter()
+        for _ in range(args.records):
+            caller = rng.choice(CALLERS)
+            writer.log(
+                request_id,
+                rng.choice(keys),
+                caller,
+                200,
+                rng.expovariate(1000.0),
+                ProjectionType.DECEPTION if caller == CallerType.ATTACKER.value else None,
+            )
+        writer.close()
+        elapsed = time.perf_counter() - started
+        size = sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp))
+        print(
+            f"write: {args.records / elapsed:,.0f} records/s, "
+            f"{size / args.records:.1f} bytes/record, {writer.segments_written} segments"
+        )
+
+        for workers in args.workers:
+            started = time.perf_counter()
+            report = summarize(tmp, workers=workers).report()
+            elapsed = time.perf_counter() - started
+            print(
+                f"query (workers={workers}): {report['records'] / elapsed:,.0f} records/s, "
+                f"p99 {report['latency_ms']['p99']}ms, "
+                f"deception rate {report['deception_rate']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import random
+import time
+
+from clc.services.bitmask_engine import BitMaskEngine
+from clc.services.wide_bitset import (
+    WideBitSet,
+    count_set_bits_many,
+    has_mask_many,
+    pack_many,
+)
+
+
+def rate(run, count):
+    started = time.perf_counter()
+    run()
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scalar", type=int, default=200_000)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    engine = BitMaskEngine()
+    flags64 = [rng.getrandbits(64) for _ in range(args.scalar)]
+    mask64 = sum(1 << position for position in range(0, 64, 16))
+    print(f"{'width':>6} {'operation':>16} {'ops/s':>14}")
+    print(
+        f"{64:>6} {'has_mask':>16} "
+        f"{rate(lambda: [engine.has_mask(f, mask64) for f in flags64], args.scalar):>14,.0f}"
+    )
+
+    for width in (128, 256, 512):
+        bitsets = [WideBitSet(rng.getrandbits(width), width) for _ in range(args.scalar)]
+        mask = WideBitSet.from_positions(range(0, width, width // 4), width)
+        print(
+            f"{width:>6} {'has_mask':>16} "
+            f"{rate(lambda: [b.has_mask(mask) for b in bitsets], args.scalar):>14,.0f}"
+        )
+
+        rows = pack_many(
+            (rng.getrandbits(width) for _ in range(args.rows)), width
+        )
+        print(
+            f"{width:>6} {'has_mask_many':>16} "
+            f"{rate(lambda: has_mask_many(rows, mask), args.rows):>14,.0f}"
+        )
+        print(
+            f"{width:>6} {'popcount_many':>16} "
+            f"{rate(lambda: count_set_bits_many(rows), args.rows):>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
-from clc.app import create_app
-
 __version__ = "1.0.0"
 
 __all__ = ["create_app"]
+
+
+def __getattr__(name):
+    if name == "create_app":
+        from clc.app import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,65 +1,283 @@
+import atexit
 import os
 import uuid
 import yaml
 import time
-from typing import Dict, Any
-from flask import Flask, request, jsonify
+from typing import Any, Mapping, Optional
+from flask import Flask, Response, g, request, jsonify
 from pydantic import ValidationError
 
 from clc.services import (
     BitMaskEngine,
     CoordinateResolver,
+    SQLiteCoordinateResolver,
     CallerDetector,
     ProjectionRenderer,
+    AdmissionController,
+    BitHeatmap,
+    VariantCache,
 )
-from clc.models import TunnelRequest, TunnelResponse, ErrorResponse
+from clc.services.bit_heatmap import CALLER_BIT_NAMES
+from clc.services.compression import negotiate
+from clc.enums import AdmissionDecision, CallerType, ProjectionType
+from clc.models import BatchTunnelRequest, TunnelRequest, TunnelResponse, ErrorResponse
 from clc.exceptions import CoordinateResolutionException, InvalidBitmaskException
+from clc.storage.compact_registry import CompactRegistry
+from clc.storage.content_hash import (
+    HashedRegistry,
+    bytes_content_hash,
+    registry_content_hash,
+)
+from clc.storage.partitioned_registry import PartitionedRegistry
+from clc.storage.tunnel_log import TunnelLogWriter
+from clc.tools.profiler import SamplingProfiler
+
+
+def load_registry(registry_path: Optional[str] = None) -> Mapping[str, Any]:
+    registry_path = registry_path or os.getenv(
+        "REGISTRY_PATH", "../master_registry.yaml"
+    )
+    if os.path.isdir(registry_path):
+        return PartitionedRegistry(
+            registry_path,
+            max_resident_bytes=int(
+                os.getenv("CLC_REGISTRY_MAX_RESIDENT_BYTES", str(64 << 20))
+            ),
+        )
 
+    with open(registry_path, "rb") as f:
+        document = f.read()
+    registry_data = HashedRegistry(
+        yaml.safe_load(document) or {}, bytes_content_hash(document)
+    )
+    if os.getenv("CLC_REGISTRY_COMPACT", "false").lower() in ("1", "true"):
+        return CompactRegistry.from_registry(registry_data)
+    return registry_data
 
-def create_app(config_path: str = "config.yaml") -> Flask:
+
+def create_app(
+    config_path: str = "config.yaml",
+    registry_data: Optional[Mapping[str, Any]] = None,
+) -> Flask:
     app = Flask(__name__)
+    profiler = SamplingProfiler.from_env()
+    app.extensions["clc.profiler"] = profiler
 
-    registry_path = os.getenv("REGISTRY_PATH", "../master_registry.yaml")
-    with open(registry_path, "r", encoding="utf-8") as f:
-        registry_data = yaml.safe_load(f)
+    if registry_data is None:
+        registry_data = load_registry()
 
-    projection_data = {
-        coord: registry_data.get("projections", {}).get(coord, {})
-        for coord in registry_data.get("layer1_human_map", {}).keys()
-    }
+    partitioned = isinstance(registry_data, PartitionedRegistry)
+    if partitioned:
+        projection_data = registry_data.get("projections", {})
+    else:
+        projection_data = {
+            coord: registry_data.get("projections", {}).get(coord, {})
+            for coord in registry_data.get("layer1_human_map", {}).keys()
+        }
 
-    resolver = CoordinateResolver(registry_data)
-    detector = CallerDetector()
-    renderer = ProjectionRenderer(projection_data)
+    registry_db = os.getenv("CLC_REGISTRY_DB")
+    false_positive_rate = float(os.getenv("CLC_LOOKUP_FILTER_FPR", "0.01"))
+    if registry_db:
+        resolver = SQLiteCoordinateResolver(
+            registry_db, false_positive_rate=false_positive_rate
+        )
+    else:
+        resolver = CoordinateResolver(registry_data, false_positive_rate)
+    if registry_db or partitioned:
+        resolver.build_membership_filter()
+    detector = CallerDetector.from_env()
+    registry_version = os.getenv("CLC_REGISTRY_VERSION") or registry_content_hash(
+        registry_data
+    )
+    renderer = ProjectionRenderer(
+        projection_data,
+        registry_version,
+        VariantCache(
+            min_size=int(os.getenv("CLC_COMPRESS_MIN_SIZE", "1024")),
+            max_bytes=int(os.getenv("CLC_COMPRESS_CACHE_BYTES", str(64 << 20))),
+        ),
+    )
+    compression = os.getenv("CLC_COMPRESSION", "true").lower() in ("1", "true")
+    cache_max_age = int(os.getenv("CLC_CACHE_MAX_AGE", "300"))
+    public_cache_control = f"public, max-age={cache_max_age}"
+    if not partitioned:
+        renderer.precompute()
+    if not partitioned and not registry_db:
+        resolver.build_keyword_index()
     engine = BitMaskEngine()
+    admission = AdmissionController.from_env()
+    caller_heatmap = BitHeatmap(
+        bucket_seconds=float(os.getenv("CLC_HEATMAP_BUCKET_SECONDS", "60")),
+        buckets=int(os.getenv("CLC_HEATMAP_BUCKETS", "60")),
+        names=CALLER_BIT_NAMES,
+    )
+    tunnel_log = TunnelLogWriter.from_env()
+    app.extensions["clc.tunnel_log"] = tunnel_log
+    static_deception = {
+        "type": ProjectionType.DECEPTION.value,
+        "data": {"error": "INVALID_COORDINATE"},
+        "mask": hex(CallerType.ATTACKER.value),
+    }
+
+    def json_member(key: str, value: Any) -> bytes:
+        return app.json.dumps({key: value}, separators=(",", ":"))[1:-1].encode()
+
+    def json_key(key: str) -> bytes:
+        return app.json.dumps(key).encode() + b":"
+
+    not_found_prefix = (
+        b"{" + json_member("data", None) + b"," + json_key("request_id") + b'"'
+    )
+    not_found_suffix = b'",' + json_member("status", 404) + b"}\n"
+    envelope_head = b"{" + json_key("data")
+    envelope_middle = b"," + json_key("request_id") + b'"'
+    envelope_tail = b'",' + json_member("status", 200) + b"}\n"
+
+    def log_tunnel(
+        request_id: str,
+        start_time: float,
+        caller_mask: int,
+        status: int,
+        target: Optional[str] = None,
+        projection_type: Optional[ProjectionType] = None,
+        resolved: bool = False,
+    ) -> None:
+        tunnel_log.log(
+            uuid.UUID(request_id).bytes,
+            target,
+            caller_mask,
+            status,
+            time.time() - start_time,
+            projection_type,
+            intern=resolved,
+            timestamp=start_time,
+        )
+
+    if tunnel_log is not None:
+        atexit.register(tunnel_log.close)
+
+        @app.after_request
+        def log_sync(response: Response) -> Response:
+            entry = g.pop("tunnel", None)
+            if entry is not None:
+                log_tunnel(status=response.status_code, **entry)
+            return response
 
     @app.route("/api/sync", methods=["POST"])
     def sync():
         start_time = time.time()
         request_id = str(uuid.uuid4())
 
+        user_agent = request.headers.get("User-Agent", "")
+        auth_token = request.headers.get("Authorization", "")
+        caller_mask = detector.detect(user_agent, auth_token)
+        caller_heatmap.record(caller_mask, start_time)
+        g.tunnel = tunnel = {
+            "request_id": request_id,
+            "start_time": start_time,
+            "caller_mask": caller_mask,
+        }
+
+        decision = admission.admit(
+            caller_mask,
+            AdmissionController.queue_latency_from_header(
+                request.headers.get("X-Request-Start"), start_time
+            ),
+        )
+        if decision is AdmissionDecision.STATIC:
+            tunnel["projection_type"] = ProjectionType.DECEPTION
+            return jsonify(
+                {
+                    "status": 200,
+                    "request_id": request_id,
+                    "data": static_deception,
+                }
+            ), 200
+
+        if decision is AdmissionDecision.SHED:
+            return jsonify(
+                {
+                    "status": 503,
+                    "request_id": request_id,
+                    "data": None,
+                }
+            ), 503, {"Retry-After": "1"}
+
         try:
             payload = request.get_json()
             tunnel_request = TunnelRequest(**payload or {})
 
-            user_agent = request.headers.get("User-Agent", "")
-            auth_token = request.headers.get("Authorization", "")
+            projection_type = renderer.projection_type(caller_mask)
+            tunnel["target"] = tunnel_request.target
+            tunnel["projection_type"] = projection_type
+            etag = renderer.etag(tunnel_request.target, projection_type)
+            encoding = (
+                negotiate(request.headers.get("Accept-Encoding", ""))
+                if compression
+                else None
+            )
+            validators = (etag, f"{etag}-{encoding}") if encoding else (etag,)
+            cache_headers = {
+                "Cache-Control": public_cache_control
+                if renderer.is_public(projection_type)
+                else "private, no-cache",
+                "Vary": "User-Agent, Authorization, Accept-Encoding",
+                "X-Registry-Version": registry_version,
+            }
+            for validator in validators:
+                if request.if_none_match.contains_weak(validator):
+                    not_modified = Response(status=304, headers=cache_headers)
+                    not_modified.set_etag(validator, weak=True)
+                    return not_modified
+
+            coordinate_data = resolver.lookup(tunnel_request.target)
+            tunnel["resolved"] = coordinate_data is not None
+            if coordinate_data is None:
+                return Response(
+                    not_found_prefix + request_id.encode() + not_found_suffix,
+                    404,
+                    mimetype="application/json",
+                )
 
-            caller_mask = detector.detect(user_agent, auth_token)
-            coordinate_data = resolver.resolve(tunnel_request.target)
             projection = renderer.render(
                 tunnel_request.target, coordinate_data, caller_mask
             )
 
             execution_time = int((time.time() - start_time) * 1000)
 
-            return jsonify(
+            segment = None
+            if encoding:
+                segment = renderer.compressed(
+                    tunnel_request.target,
+                    caller_mask,
+                    encoding,
+                    lambda: envelope_head
+                    + app.json.dumps(projection, separators=(",", ":")).encode()
+                    + envelope_middle,
+                )
+            if segment is not None:
+                tail = request_id.encode() + envelope_tail
+                response = Response(
+                    segment.finish(tail), 200, mimetype="application/json"
+                )
+                renderer.variants.record(
+                    segment.size + len(tail), response.content_length
+                )
+                response.headers.update(cache_headers)
+                response.headers["Content-Encoding"] = encoding
+                response.set_etag(f"{etag}-{encoding}", weak=True)
+                return response
+
+            response = jsonify(
                 {
                     "status": 200,
                     "request_id": request_id,
                     "data": projection,
                 }
-            ), 200
+            )
+            response.headers.update(cache_headers)
+            response.set_etag(etag, weak=True)
+            return response, 200
 
         except ValidationError as e:
             return jsonify(
@@ -91,6 +309,172 @@ def create_app(config_path: str = "config.yaml") -> Flask:
                 }
             ), 500
 
+        finally:
+            admission.release()
+
+    @app.route("/api/sync/batch", methods=["POST"])
+    def sync_batch():
+        start_time = time.time()
+        request_id = str(uuid.uuid4())
+
+        caller_mask = detector.detect(
+            request.headers.get("User-Agent", ""),
+            request.headers.get("Authorization", ""),
+        )
+        caller_heatmap.record(caller_mask, start_time)
+
+        try:
+            batch = BatchTunnelRequest(**request.get_json(silent=True) or {})
+        except (TypeError, ValidationError):
+            return jsonify(
+                {
+                    "status": 400,
+                    "request_id": request_id,
+                    "error": "Invalid request format",
+                }
+            ), 400
+
+        decision = admission.admit(
+            caller_mask,
+            AdmissionController.queue_latency_from_header(
+                request.headers.get("X-Request-Start"), start_time
+            ),
+        )
+        if decision is AdmissionDecision.SHED:
+            return jsonify(
+                {
+                    "status": 503,
+                    "request_id": request_id,
+                    "data": None,
+                }
+            ), 503, {"Retry-After": "1"}
+
+        batch_headers = {
+            "Cache-Control": "private, no-cache",
+            "X-Registry-Version": registry_version,
+        }
+        if decision is AdmissionDecision.STATIC:
+            return jsonify(
+                {
+                    "status": 200,
+                    "request_id": request_id,
+                    "registry_version": registry_version,
+                    "max_age": 0,
+                    "results": {
+                        target: {"status": 200, "data": static_deception}
+                        for target in batch.targets
+                    },
+                }
+            ), 200, batch_headers
+
+        projection_type = renderer.projection_type(caller_mask)
+        results = {}
+        try:
+            for target in batch.targets:
+                etag = renderer.etag(target, projection_type)
+                if batch.etags.get(target) == etag:
+                    results[target] = {"status": 304, "etag": etag}
+                    continue
+
+                try:
+                    coordinate_data = resolver.lookup(target)
+                except CoordinateResolutionException:
+                    coordinate_data = None
+                if coordinate_data is None:
+                    results[target] = {"status": 404, "data": None}
+                    continue
+
+                results[target] = {
+                    "status": 200,
+                    "etag": etag,
+                    "data": renderer.render(target, coordinate_data, caller_mask),
+                }
+        finally:
+            admission.release()
+
+        if tunnel_log is not None:
+            for target, result in results.items():
+                log_tunnel(
+                    request_id,
+                    start_time,
+                    caller_mask,
+                    result["status"],
+                    target,
+                    projection_type,
+                    resolved=result["status"] == 200,
+                )
+
+        return jsonify(
+            {
+                "status": 200,
+                "request_id": request_id,
+                "registry_version": registry_version,
+                "max_age": cache_max_age if renderer.is_public(projection_type) else 0,
+                "results": results,
+            }
+        ), 200, batch_headers
+
+    @app.route("/api/admission", methods=["GET"])
+    def admission_stats():
+        return jsonify(admission.stats()), 200
+
+    @app.route("/api/tunnel-log", methods=["GET"])
+    def tunnel_log_stats():
+        if tunnel_log is None:
+            return jsonify({"enabled": False}), 200
+        return jsonify({"enabled": True, **tunnel_log.stats()}), 200
+
+    @app.route("/api/token-cache", methods=["GET"])
+    def token_cache_stats():
+        return jsonify(detector.token_stats()), 200
+
+    @app.route("/api/compression", methods=["GET"])
+    def compression_stats():
+        return jsonify(renderer.variants.stats()), 200
+
+    @app.route("/api/search", methods=["GET"])
+    def search():
+        if partitioned:
+            return jsonify({"status": 404, "error": "Not found"}), 404
+        query = request.args.get("q", "")
+        limit = min(request.args.get("limit", 10, type=int), 100)
+        results = resolver.search(query, limit)
+        return jsonify(
+            {
+                "query": query,
+                "results": [
+                    {"coordinate_key": coordinate_key, "score": score}
+                    for coordinate_key, score in results
+                ],
+            }
+        ), 200
+
+    @app.route("/api/lookup-filter", methods=["GET"])
+    def lookup_filter_stats():
+        return jsonify(resolver.membership_stats()), 200
+
+    @app.route("/api/profile", methods=["GET"])
+    def profile():
+        if not detector.verifies_tokens:
+            return jsonify({"status": 404, "error": "Not found"}), 404
+        caller_mask = detector.detect(
+            request.headers.get("User-Agent", ""),
+            request.headers.get("Authorization", ""),
+        )
+        if not CallerType.AUTHENTICATED.matches(caller_mask):
+            return jsonify({"status": 404, "error": "Not found"}), 404
+
+        if request.args.get("format") == "json":
+            return jsonify(profiler.stats()), 200
+
+        window = request.args.get("window", -1, type=int)
+        return Response(profiler.collapsed(window), 200, mimetype="text/plain")
+
+    @app.route("/api/heatmap", methods=["GET"])
+    def heatmap():
+        window = request.args.get("window", type=float)
+        return jsonify(caller_heatmap.report(window_seconds=window)), 200
+
     @app.route("/", methods=["GET"])
     def index():
         return """
@@ -122,9 +506,15 @@ def create_app(config_path: str = "config.yaml") -> Flask:
     def server_error(error):
         return jsonify({"status": 500, "error": "Internal server error"}), 500
 
+    if profiler.enabled:
+        profiler.start()
+
     return app
 
 
 if __name__ == "__main__":
+    import signal
+
     app = create_app()
+    app.extensions["clc.profiler"].install_signal_handler(signal.SIGUSR2)
     app.run(debug=os.getenv("APP_DEBUG", "false").lower() == "true")
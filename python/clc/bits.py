@@ -0,0 +1,20 @@
+from clc.exceptions import InvalidBitmaskException
+
+FLAG_WIDTH = 64
+FLAG_MASK = (1 << FLAG_WIDTH) - 1
+SIGN_BIT = 1 << (FLAG_WIDTH - 1)
+
+
+def to_signed(flags: int) -> int:
+    return flags - (1 << FLAG_WIDTH) if flags & SIGN_BIT else flags
+
+
+def to_unsigned(flags: int) -> int:
+    return flags & FLAG_MASK
+
+
+def validate_mask(mask: int) -> None:
+    if mask < 0:
+        raise InvalidBitmaskException.negative_flag_value(mask)
+    if mask > FLAG_MASK:
+        raise InvalidBitmaskException.invalid_mask_value(mask)
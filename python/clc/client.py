@@ -0,0 +1,331 @@
+import asyncio
+import gzip
+import http.client
+import json
+import queue
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from clc.exceptions import TunnelClientException
+
+BATCH_PATH = "/api/sync/batch"
+MAX_BATCH = 100
+RETRYABLE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class ConnectionPool:
+    def __init__(self, url: str, size: int = 8, timeout: float = 10.0):
+        parts = urlsplit(url)
+        self.url = url
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.prefix = parts.path.rstrip("/")
+        self.secure = parts.scheme == "https"
+        self.timeout = timeout
+        self.opened = 0
+
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: Dict[str, str]
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        if self._closed:
+            raise TunnelClientException.client_closed()
+
+        with self._slots:
+            for attempt in range(2):
+                conn, reused = self._checkout()
+                try:
+                    conn.request(method, self.prefix + path, body=body, headers=headers)
+                    response = conn.getresponse()
+                    data = response.read()
+                except RETRYABLE_ERRORS as e:
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise TunnelClientException.connection_failed(self.url, e) from e
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    raise TunnelClientException.connection_failed(self.url, e) from e
+
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+                return response.status, response.headers, _decode(response.headers, data)
+
+        raise TunnelClientException.connection_failed(self.url, ConnectionError("retry"))
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            pass
+
+        connection_class = (
+            http.client.HTTPSConnection if self.secure else http.client.HTTPConnection
+        )
+        self.opened += 1
+        return connection_class(self.host, self.port, timeout=self.timeout), False
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.registry_version: Optional[str] = None
+        self._entries: "OrderedDict[str, Tuple[str, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fresh(self, target: str, now: float) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(target)
+            if entry is None or entry[2] <= now:
+                return False, None
+            self._entries.move_to_end(target)
+            return True, entry[1]
+
+    def etag(self, target: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(target)
+            return entry[0] if entry is not None else None
+
+    def revalidated(self, target: str, expires: float) -> Any:
+        with self._lock:
+            etag, data, _ = self._entries[target]
+            self._entries[target] = (etag, data, expires)
+            self._entries.move_to_end(target)
+            return data
+
+    def store(self, target: str, etag: str, data: Any, expires: float) -> None:
+        with self._lock:
+            self._entries[target] = (etag, data, expires)
+            self._entries.move_to_end(target)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def observe_version(self, version: Optional[str]) -> None:
+        with self._lock:
+            if version and version != self.registry_version:
+                self._entries.clear()
+                self.registry_version = version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TunnelClient:
+    def __init__(
+        self,
+        url: str,
+        user_agent: str = "clc-client/1.0",
+        auth_token: Optional[str] = None,
+        timeout: float = 10.0,
+        pool_size: int = 8,
+        batch_window: float = 0.002,
+        max_batch: int = MAX_BATCH,
+        cache_entries: int = 4096,
+    ):
+        self.pool = ConnectionPool(url, pool_size, timeout)
+        self.cache = ResponseCache(cache_entries)
+        self.batch_window = batch_window
+        self.max_batch = min(max_batch, MAX_BATCH)
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": user_agent,
+        }
+        if auth_token:
+            self.headers["Authorization"] = auth_token
+
+        self.requests = 0
+        self.cache_hits = 0
+        self.revalidations = 0
+
+        self._pending: "OrderedDict[str, List[Future]]" = OrderedDict()
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._batcher: Optional[threading.Thread] = None
+        self._senders = ThreadPoolExecutor(pool_size, thread_name_prefix="clc-client")
+        self._closed = False
+
+    def __enter__(self) -> "TunnelClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def sync(self, target: str) -> Optional[Dict[str, Any]]:
+        return self.submit(target).result()
+
+    def sync_many(self, targets: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        futures = {target: self.submit(target) for target in targets}
+        return {target: future.result() for target, future in futures.items()}
+
+    def submit(self, target: str) -> "Future[Optional[Dict[str, Any]]]":
+        if self._closed:
+            raise TunnelClientException.client_closed()
+
+        future: Future = Future()
+        hit, data = self.cache.fresh(target, time.monotonic())
+        if hit:
+            self.cache_hits += 1
+            future.set_result(data)
+            return future
+
+        with self._pending_lock:
+            self._pending.setdefault(target, []).append(future)
+            if self._batcher is None:
+                self._batcher = threading.Thread(
+                    target=self._run_batcher, name="clc-client-batcher", daemon=True
+                )
+                self._batcher.start()
+        self._wakeup.set()
+        return future
+
+    def fetch(self, targets: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        etags = {}
+        for target in targets:
+            etag = self.cache.etag(target)
+            if etag is not None:
+                etags[target] = etag
+
+        body = json.dumps({"targets": targets, "etags": etags}).encode()
+        self.requests += 1
+        status, headers, data = self.pool.request("POST", BATCH_PATH, body, self.headers)
+        if status != 200:
+            raise TunnelClientException.unexpected_status(status, BATCH_PATH)
+
+        document = json.loads(data)
+        self.cache.observe_version(document.get("registry_version"))
+        expires = time.monotonic() + document.get("max_age", 0)
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for target in targets:
+            entry = document["results"].get(target, {"status": 404})
+            if entry["status"] == 304:
+                self.revalidations += 1
+                try:
+                    results[target] = self.cache.revalidated(target, expires)
+                    continue
+                except KeyError:
+                    entry = self._refetch(target)
+            if entry["status"] == 200:
+                results[target] = entry["data"]
+                if entry.get("etag"):
+                    self.cache.store(target, entry["etag"], entry["data"], expires)
+            else:
+                results[target] = None
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.pool.opened,
+            "cache_entries": len(self.cache),
+            "cache_hits": self.cache_hits,
+            "revalidations": self.revalidations,
+            "registry_version": self.cache.registry_version,
+        }
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+        if self._batcher is not None:
+            self._batcher.join()
+        self._senders.shutdown()
+        self.pool.close()
+
+    def _refetch(self, target: str) -> Dict[str, Any]:
+        body = json.dumps({"targets": [target]}).encode()
+        status, _, data = self.pool.request("POST", BATCH_PATH, body, self.headers)
+        if status != 200:
+            raise TunnelClientException.unexpected_status(status, BATCH_PATH)
+        return json.loads(data)["results"][target]
+
+    def _run_batcher(self) -> None:
+        while True:
+            self._wakeup.wait()
+            if self.batch_window:
+                time.sleep(self.batch_window)
+            with self._pending_lock:
+                self._wakeup.clear()
+                batches = []
+                while self._pending:
+                    batch = []
+                    while self._pending and len(batch) < self.max_batch:
+                        batch.append(self._pending.popitem(last=False))
+                    batches.append(batch)
+
+            for batch in batches:
+                self._senders.submit(self._dispatch, batch)
+            if self._closed:
+                with self._pending_lock:
+                    if not self._pending:
+                        return
+
+    def _dispatch(self, batch: List[Tuple[str, List[Future]]]) -> None:
+        try:
+            results = self.fetch([target for target, _ in batch])
+        except Exception as e:
+            for _, futures in batch:
+                for future in futures:
+                    future.set_exception(e)
+            return
+
+        for target, futures in batch:
+            for future in futures:
+                future.set_result(results[target])
+
+
+class AsyncTunnelClient:
+    def __init__(self, url: str, **options: Any):
+        self.client = TunnelClient(url, **options)
+
+    async def __aenter__(self) -> "AsyncTunnelClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def sync(self, target: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.wrap_future(self.client.submit(target))
+
+    async def sync_many(self, targets: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        targets = list(targets)
+        results = await asyncio.gather(*(self.sync(target) for target in targets))
+        return dict(zip(targets, results))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.client.stats()
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.client.close)
+
+
+def _decode(headers: http.client.HTTPMessage, data: bytes) -> bytes:
+    encoding = headers.get("Content-Encoding", "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        return zlib.decompress(data)
+    return data
@@ -1,4 +1,4 @@
-from enum import IntEnum, Enum
+from enum import IntEnum, IntFlag, Enum
 
 
 class BitPosition(IntEnum):
@@ -55,8 +55,8 @@ class BitPosition(IntEnum):
         return 1 << self.value
 
     @staticmethod
-    def is_valid(position: int) -> bool:
-        return 0 <= position <= 63
+    def is_valid(position: int, width: int = 64) -> bool:
+        return 0 <= position < width
 
 
 class CallerType(IntEnum):
@@ -75,6 +75,26 @@ class CallerType(IntEnum):
         }.get(self.value, "Unknown Type")
 
 
+class TypeBit(IntFlag):
+    STRING = 0x01
+    SECRET = 0x02
+    ACTIVE = 0x04
+    EXPERIMENTAL = 0x08
+
+
+class SubtypeBit(IntFlag):
+    PERSISTENT = 0x10
+    VISIBLE = 0x20
+    TRANSFORMED = 0x40
+    HYDRATED = 0x80
+
+
+class AdmissionDecision(str, Enum):
+    ADMIT = "admit"
+    STATIC = "static"
+    SHED = "shed"
+
+
 class ProjectionType(str, Enum):
     GLOSSARY = "glossary"
     PRIVATE = "private"
@@ -1,11 +1,13 @@
-from typing import Optional
+from typing import List, Optional
 
 
 class InvalidBitmaskException(Exception):
     @staticmethod
-    def invalid_bit_position(position: int) -> "InvalidBitmaskException":
+    def invalid_bit_position(
+        position: int, max_position: int = 63
+    ) -> "InvalidBitmaskException":
         return InvalidBitmaskException(
-            f"Invalid bit position: {position}. Must be between 0 and 63."
+            f"Invalid bit position: {position}. Must be between 0 and {max_position}."
         )
 
     @staticmethod
@@ -20,6 +22,24 @@ class InvalidBitmaskException(Exception):
             f"Invalid flag value: {flags}. Flags must be non-negative."
         )
 
+    @staticmethod
+    def unsupported_width(width: int) -> "InvalidBitmaskException":
+        return InvalidBitmaskException(
+            f"Unsupported bitset width: {width}. Must be one of 128, 256 or 512."
+        )
+
+    @staticmethod
+    def flags_exceed_width(flags: int, width: int) -> "InvalidBitmaskException":
+        return InvalidBitmaskException(
+            f"Invalid flag value: {hex(flags)}. Flags must fit in {width} bits."
+        )
+
+    @staticmethod
+    def word_count_mismatch(count: int, width: int) -> "InvalidBitmaskException":
+        return InvalidBitmaskException(
+            f"Expected {width // 64} words for a {width}-bit set, got {count}."
+        )
+
 
 class CoordinateResolutionException(Exception):
     @staticmethod
@@ -41,3 +61,57 @@ class CoordinateResolutionException(Exception):
         return CoordinateResolutionException(
             f"Layer {layer} resolution failed for coordinate: {coordinate_key}"
         )
+
+    @staticmethod
+    def duplicate_address(
+        address: str, coordinate_keys: List[str]
+    ) -> "CoordinateResolutionException":
+        return CoordinateResolutionException(
+            f"Duplicate coordinate address {address}: {', '.join(coordinate_keys)}"
+        )
+
+
+class TunnelClientException(Exception):
+    @staticmethod
+    def connection_failed(url: str, error: Exception) -> "TunnelClientException":
+        return TunnelClientException(f"Tunnel connection to {url} failed: {error}")
+
+    @staticmethod
+    def unexpected_status(status: int, path: str) -> "TunnelClientException":
+        return TunnelClientException(f"Tunnel returned HTTP {status} for {path}")
+
+    @staticmethod
+    def client_closed() -> "TunnelClientException":
+        return TunnelClientException("Tunnel client is closed")
+
+
+class FlagTransferException(Exception):
+    @staticmethod
+    def missing_column(column: str, source: str) -> "FlagTransferException":
+        return FlagTransferException(f"Column {column!r} not found in {source}")
+
+    @staticmethod
+    def invalid_boolean(
+        column: str, value: object, record: int
+    ) -> "FlagTransferException":
+        return FlagTransferException(
+            f"Invalid boolean {value!r} in column {column!r} at record {record}"
+        )
+
+    @staticmethod
+    def unknown_bit(name: str) -> "FlagTransferException":
+        return FlagTransferException(f"Unknown bit position: {name}")
+
+    @staticmethod
+    def unknown_format(path: str) -> "FlagTransferException":
+        return FlagTransferException(
+            f"Cannot infer format of {path}. Expected .csv or .jsonl"
+        )
+
+    @staticmethod
+    def checkpoint_mismatch(
+        name: str, position: int, size: int
+    ) -> "FlagTransferException":
+        return FlagTransferException(
+            f"Checkpoint {name!r} is at byte {position} but the file has {size} bytes"
+        )
@@ -1,12 +1,19 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Any
+from typing import Annotated, Dict, List, Optional, Any
+
+Target = Annotated[str, Field(min_length=1, max_length=64)]
 
 
 class TunnelRequest(BaseModel):
-    target: str = Field(..., min_length=1, max_length=64)
+    target: Target
     payload: Optional[Any] = None
 
 
+class BatchTunnelRequest(BaseModel):
+    targets: List[Target] = Field(..., min_length=1, max_length=100)
+    etags: Dict[str, str] = Field(default_factory=dict)
+
+
 class TunnelResponse(BaseModel):
     status: int
     request_id: str
@@ -1,11 +1,23 @@
-from clc.services.bitmask_engine import BitMaskEngine
-from clc.services.coordinate_resolver import CoordinateResolver
-from clc.services.caller_detector import CallerDetector
-from clc.services.projection_renderer import ProjectionRenderer
-
-__all__ = [
-    "BitMaskEngine",
-    "CoordinateResolver",
-    "CallerDetector",
-    "ProjectionRenderer",
-]
+import importlib
+
+_SERVICES = {
+    "BitMaskEngine": "clc.services.bitmask_engine",
+    "CoordinateResolver": "clc.services.coordinate_resolver",
+    "SQLiteCoordinateResolver": "clc.services.sqlite_resolver",
+    "CallerDetector": "clc.services.caller_detector",
+    "ProjectionRenderer": "clc.services.projection_renderer",
+    "AdmissionController": "clc.services.admission_controller",
+    "BitHeatmap": "clc.services.bit_heatmap",
+    "VariantCache": "clc.services.compression",
+    "HMACTokenVerifier": "clc.services.token_verifier",
+    "VerifiedTokenCache": "clc.services.token_verifier",
+    "WideBitSet": "clc.services.wide_bitset",
+}
+
+__all__ = list(_SERVICES)
+
+
+def __getattr__(name):
+    if name in _SERVICES:
+        return getattr(importlib.import_module(_SERVICES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from clc.enums import AdmissionDecision, CallerType
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        reserved_in_flight: int = 16,
+        max_queue_latency_ms: float = 250.0,
+        latency_smoothing: float = 0.2,
+    ):
+        self.max_in_flight = max_in_flight
+        self.reserved_in_flight = min(reserved_in_flight, max_in_flight)
+        self.max_queue_latency_ms = max_queue_latency_ms
+        self.latency_smoothing = latency_smoothing
+
+        self.in_flight = 0
+        self.queue_latency_ms = 0.0
+        self._lock = threading.Lock()
+        self._counters: Dict[AdmissionDecision, Dict[CallerType, int]] = {
+            decision: {caller: 0 for caller in CallerType}
+            for decision in AdmissionDecision
+        }
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        return cls(
+            max_in_flight=int(os.getenv("CLC_ADMISSION_MAX_IN_FLIGHT", "64")),
+            reserved_in_flight=int(os.getenv("CLC_ADMISSION_RESERVED", "16")),
+            max_queue_latency_ms=float(os.getenv("CLC_ADMISSION_MAX_QUEUE_MS", "250")),
+        )
+
+    def admit(self, caller_mask: int, queue_latency_ms: float = 0.0) -> AdmissionDecision:
+        caller = self._caller_class(caller_mask)
+
+        with self._lock:
+            self.queue_latency_ms += (
+                queue_latency_ms - self.queue_latency_ms
+            ) * self.latency_smoothing
+
+            if caller is CallerType.ATTACKER:
+                decision = self._admit_attacker()
+            elif self.in_flight < self.max_in_flight:
+                decision = AdmissionDecision.ADMIT
+            else:
+                decision = AdmissionDecision.SHED
+
+            if decision is AdmissionDecision.ADMIT:
+                self.in_flight += 1
+            self._counters[decision][caller] += 1
+
+        return decision
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "queue_latency_ms": round(self.queue_latency_ms, 3),
+                "limits": {
+                    "max_in_flight": self.max_in_flight,
+                    "reserved_in_flight": self.reserved_in_flight,
+                    "max_queue_latency_ms": self.max_queue_latency_ms,
+                },
+                **{
+                    decision.value: {
+                        caller.name.lower(): count for caller, count in counts.items()
+                    }
+                    for decision, counts in self._counters.items()
+                },
+            }
+
+    @staticmethod
+    def queue_latency_from_header(header: Optional[str], now: Optional[float] = None) -> float:
+        if not header:
+            return 0.0
+
+        try:
+            started = float(header.strip().removeprefix("t="))
+        except ValueError:
+            return 0.0
+
+        now = time.time() if now is None else now
+        while started > now * 10:
+            started /= 1000.0
+
+        return max(0.0, (now - started) * 1000.0)
+
+    def _admit_attacker(self) -> AdmissionDecision:
+        if self.in_flight >= self.max_in_flight:
+            return AdmissionDecision.SHED
+
+        if (
+            self.in_flight >= self.max_in_flight - self.reserved_in_flight
+            or self.queue_latency_ms > self.max_queue_latency_ms
+        ):
+            return AdmissionDecision.STATIC
+
+        return AdmissionDecision.ADMIT
+
+    def _caller_class(self, caller_mask: int) -> CallerType:
+        if CallerType.BOT.matches(caller_mask):
+            return CallerType.BOT
+
+        if CallerType.AUTHENTICATED.matches(caller_mask):
+            return CallerType.AUTHENTICATED
+
+        return CallerType.ATTACKER
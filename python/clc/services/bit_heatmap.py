@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from clc.enums import BitPosition, CallerType
+from clc.bits import FLAG_WIDTH, validate_mask
+
+BIT_NAMES = {position.value: position.name for position in BitPosition}
+CALLER_BIT_NAMES = {caller.value.bit_length() - 1: caller.name for caller in CallerType}
+
+
+def unpack_bits(masks: np.ndarray) -> np.ndarray:
+    masks = np.ascontiguousarray(masks, dtype="<u8")
+    return np.unpackbits(masks.view(np.uint8), bitorder="little").reshape(-1, FLAG_WIDTH)
+
+
+class BitHeatmap:
+    MATMUL_ROWS = 1 << 16
+
+    def __init__(
+        self,
+        bucket_seconds: float = 60.0,
+        buckets: int = 60,
+        buffer_size: int = 1024,
+        names: Optional[Dict[int, str]] = None,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = buckets
+        self.buffer_size = buffer_size
+        self.names = BIT_NAMES if names is None else names
+
+        self._counts = np.zeros((buckets, FLAG_WIDTH), dtype=np.uint64)
+        self._pairs = np.zeros((buckets, FLAG_WIDTH, FLAG_WIDTH), dtype=np.uint64)
+        self._observations = np.zeros(buckets, dtype=np.uint64)
+        self._epochs = np.full(buckets, -1, dtype=np.int64)
+        self._buffer: List[int] = []
+        self._buffer_epoch = -1
+        self._lock = threading.Lock()
+
+    def record(self, mask: int, timestamp: Optional[float] = None) -> None:
+        validate_mask(mask)
+        epoch = self._epoch(timestamp)
+
+        with self._lock:
+            if epoch != self._buffer_epoch:
+                self._drain()
+                self._buffer_epoch = epoch
+            self._buffer.append(mask)
+            if len(self._buffer) >= self.buffer_size:
+                self._drain()
+
+    def observe(
+        self, masks: Union[np.ndarray, Iterable[int]], timestamp: Optional[float] = None
+    ) -> int:
+        if not isinstance(masks, np.ndarray):
+            masks = list(masks)
+            for mask in masks:
+                validate_mask(mask)
+        masks = np.asarray(masks, dtype=np.uint64).ravel()
+
+        with self._lock:
+            self._accumulate(self._epoch(timestamp), masks)
+        return len(masks)
+
+    def snapshot(
+        self, window_seconds: Optional[float] = None, now: Optional[float] = None
+    ) -> Tuple[int, np.ndarray, np.ndarray]:
+        current = self._epoch(now)
+        span = self.buckets if window_seconds is None else max(
+            1, min(self.buckets, int(np.ceil(window_seconds / self.bucket_seconds)))
+        )
+
+        with self._lock:
+            self._drain()
+            live = (self._epochs > current - span) & (self._epochs <= current)
+            return (
+                int(self._observations[live].sum()),
+                self._counts[live].sum(axis=0),
+                self._pairs[live].sum(axis=0),
+            )
+
+    def report(
+        self,
+        window_seconds: Optional[float] = None,
+        now: Optional[float] = None,
+        top_pairs: int = 10,
+    ) -> Dict[str, Any]:
+        observations, counts, pairs = self.snapshot(window_seconds, now)
+        rates = counts / observations if observations else np.zeros(FLAG_WIDTH)
+
+        upper = np.triu(pairs, k=1)
+        order = np.argsort(upper, axis=None)[::-1][:top_pairs]
+        hottest = [
+            {
+                "bits": [self._name(a), self._name(b)],
+                "count": int(upper[a, b]),
+            }
+            for a, b in zip(*np.unravel_index(order, upper.shape))
+            if upper[a, b]
+        ]
+
+        return {
+            "observations": observations,
+            "window_seconds": (
+                window_seconds
+                if window_seconds is not None
+                else self.bucket_seconds * self.buckets
+            ),
+            "bits": {
+                self._name(position): {
+                    "count": int(counts[position]),
+                    "rate": round(float(rates[position]), 6),
+                }
+                for position in range(FLAG_WIDTH)
+                if counts[position]
+            },
+            "dead": [self._name(position) for position in self.names if not counts[position]],
+            "top_pairs": hottest,
+        }
+
+    def _epoch(self, timestamp: Optional[float]) -> int:
+        timestamp = time.time() if timestamp is None else timestamp
+        return int(timestamp // self.bucket_seconds)
+
+    def _drain(self) -> None:
+        if self._buffer:
+            masks = np.fromiter(self._buffer, dtype=np.uint64, count=len(self._buffer))
+            self._buffer = []
+            self._accumulate(self._buffer_epoch, masks)
+
+    def _accumulate(self, epoch: int, masks: np.ndarray) -> None:
+        if not len(masks):
+            return
+
+        slot = epoch % self.buckets
+        if self._epochs[slot] != epoch:
+            if self._epochs[slot] > epoch:
+                return
+            self._counts[slot] = 0
+            self._pairs[slot] = 0
+            self._observations[slot] = 0
+            self._epochs[slot] = epoch
+
+        for start in range(0, len(masks), self.MATMUL_ROWS):
+            bits = unpack_bits(masks[start:start + self.MATMUL_ROWS]).astype(np.float32)
+            self._counts[slot] += bits.sum(axis=0).astype(np.uint64)
+            self._pairs[slot] += (bits.T @ bits).astype(np.uint64)
+        self._observations[slot] += np.uint64(len(masks))
+
+    def _name(self, position: int) -> str:
+        return self.names.get(int(position), f"BIT_{int(position)}")
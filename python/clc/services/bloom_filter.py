@@ -0,0 +1,90 @@
+import hashlib
+import math
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+
+HASH_MASK = (1 << 64) - 1
+
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.capacity = max(1, capacity)
+        self.false_positive_rate = false_positive_rate
+        self.size_bits = max(
+            64,
+            math.ceil(-self.capacity * math.log(false_positive_rate) / math.log(2) ** 2),
+        )
+        self.hashes = max(1, round(self.size_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self.set_bits = 0
+        self._bits = bytearray((self.size_bits + 7) // 8)
+
+    @classmethod
+    def from_keys(
+        cls, keys: Iterable[str], capacity: int, false_positive_rate: float = 0.01
+    ) -> "BloomFilter":
+        bloom = cls(capacity, false_positive_rate)
+        bloom.add_many(keys)
+        return bloom
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+
+        h1, h2 = _hash_pair(key)
+        bits = self._bits
+        for i in range(self.hashes):
+            position = ((h1 + i * h2) & HASH_MASK) % self.size_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, key: str) -> None:
+        h1, h2 = _hash_pair(key)
+        bits = self._bits
+        for i in range(self.hashes):
+            position = ((h1 + i * h2) & HASH_MASK) % self.size_bits
+            bit = 1 << (position & 7)
+            if not bits[position >> 3] & bit:
+                bits[position >> 3] |= bit
+                self.set_bits += 1
+        self.count += 1
+
+    def add_many(self, keys: Iterable[str]) -> int:
+        pairs = np.array([_hash_pair(key) for key in keys], dtype=np.uint64).reshape(-1, 2)
+        if not len(pairs):
+            return 0
+
+        marked = np.unpackbits(
+            np.frombuffer(bytes(self._bits), dtype=np.uint8), bitorder="little"
+        )[: self.size_bits].astype(bool)
+        size = np.uint64(self.size_bits)
+        for i in range(self.hashes):
+            marked[(pairs[:, 0] + np.uint64(i) * pairs[:, 1]) % size] = True
+
+        self._bits = bytearray(np.packbits(marked, bitorder="little").tobytes())
+        self.set_bits = int(np.count_nonzero(marked))
+        self.count += len(pairs)
+        return len(pairs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "count": self.count,
+            "size_bits": self.size_bits,
+            "size_bytes": len(self._bits),
+            "hashes": self.hashes,
+            "target_false_positive_rate": self.false_positive_rate,
+            "estimated_false_positive_rate": round(
+                (self.set_bits / self.size_bits) ** self.hashes, 6
+            ),
+        }
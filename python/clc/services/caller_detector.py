@@ -1,7 +1,14 @@
+import os
+import re
+from typing import Any, Dict, Optional
+
 from clc.enums import CallerType
+from clc.services.token_verifier import HMACTokenVerifier, TokenVerifier, VerifiedTokenCache
 
 
 class CallerDetector:
+    AUTH_TOKEN_PATTERN = re.compile(r"^(Bearer|Token)\s+(\S+)$", re.IGNORECASE)
+
     SEO_BOT_PATTERNS = [
         "googlebot",
         "bingbot",
@@ -17,6 +24,40 @@ class CallerDetector:
         "pinterestbot",
     ]
 
+    def __init__(
+        self,
+        token_verifier: Optional[TokenVerifier] = None,
+        token_cache_size: int = 10_000,
+        negative_ttl: float = 60.0,
+    ):
+        self.token_cache = (
+            VerifiedTokenCache(
+                token_verifier,
+                max_entries=token_cache_size,
+                max_negative_entries=token_cache_size,
+                negative_ttl=negative_ttl,
+            )
+            if token_verifier is not None
+            else None
+        )
+
+    @classmethod
+    def from_env(cls) -> "CallerDetector":
+        return cls(
+            HMACTokenVerifier.from_env(),
+            token_cache_size=int(os.getenv("CLC_TOKEN_CACHE_SIZE", "10000")),
+            negative_ttl=float(os.getenv("CLC_TOKEN_NEGATIVE_TTL", "60")),
+        )
+
+    @property
+    def verifies_tokens(self) -> bool:
+        return self.token_cache is not None
+
+    def token_stats(self) -> Dict[str, Any]:
+        if self.token_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.token_cache.stats()}
+
     def detect(self, user_agent: str = "", auth_token: str = "") -> int:
         if self._is_seo_bot(user_agent):
             return CallerType.BOT.value
@@ -42,7 +83,9 @@ class CallerDetector:
         if not auth_token:
             return False
 
-        import re
-
-        pattern = r"^(Bearer|Token)\s+\S+$"
-        return bool(re.match(pattern, auth_token, re.IGNORECASE))
+        match = self.AUTH_TOKEN_PATTERN.match(auth_token)
+        if match is None:
+            return False
+        if self.token_cache is None:
+            return True
+        return self.token_cache.verify(match.group(2))
@@ -0,0 +1,124 @@
+import struct
+import threading
+import zlib
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+ENCODINGS = ("gzip", "deflate")
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+ZLIB_HEADER = b"\x78\x9c"
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    offered: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        offered[name.strip()] = quality
+
+    wildcard = offered.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = offered.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressedSegment:
+    __slots__ = ("encoding", "data", "checksum", "size")
+
+    def __init__(self, encoding: str, data: bytes, checksum: int, size: int):
+        self.encoding = encoding
+        self.data = data
+        self.checksum = checksum
+        self.size = size
+
+    @classmethod
+    def compress(cls, raw: bytes, encoding: str, level: int = 6) -> "CompressedSegment":
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        data = compressor.compress(raw) + compressor.flush(zlib.Z_FULL_FLUSH)
+        checksum = zlib.crc32(raw) if encoding == "gzip" else zlib.adler32(raw)
+        return cls(encoding, data, checksum, len(raw))
+
+    def finish(self, tail: bytes) -> bytes:
+        compressor = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+        body = self.data + compressor.compress(tail) + compressor.flush()
+        if self.encoding == "gzip":
+            trailer = struct.pack(
+                "<II", zlib.crc32(tail, self.checksum), (self.size + len(tail)) & 0xFFFFFFFF
+            )
+            return GZIP_HEADER + body + trailer
+        return ZLIB_HEADER + body + struct.pack(">I", zlib.adler32(tail, self.checksum))
+
+
+class VariantCache:
+    def __init__(self, min_size: int = 1024, max_bytes: int = 64 << 20, level: int = 6):
+        self.min_size = min_size
+        self.max_bytes = max_bytes
+        self.level = level
+
+        self._segments: Dict[Tuple[Hashable, str], Optional[CompressedSegment]] = {}
+        self._lock = threading.Lock()
+        self._raw_bytes = 0
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._below_threshold = 0
+        self._served_raw = 0
+        self._served_compressed = 0
+
+    def get(
+        self, key: Hashable, encoding: str, build: Callable[[], bytes]
+    ) -> Optional[CompressedSegment]:
+        slot = (key, encoding)
+        with self._lock:
+            if slot in self._segments:
+                self._hits += 1
+                return self._segments[slot]
+            full = self._cached_bytes >= self.max_bytes
+
+        raw = build()
+        segment = None
+        if len(raw) >= self.min_size and not full:
+            segment = CompressedSegment.compress(raw, encoding, self.level)
+
+        with self._lock:
+            self._misses += 1
+            if segment is None:
+                if len(raw) < self.min_size:
+                    self._below_threshold += 1
+                    self._segments[slot] = None
+                return None
+            if slot not in self._segments:
+                self._segments[slot] = segment
+                self._raw_bytes += segment.size
+                self._cached_bytes += len(segment.data)
+        return segment
+
+    def record(self, raw_size: int, sent_size: int) -> None:
+        with self._lock:
+            self._served_raw += raw_size
+            self._served_compressed += sent_size
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "min_size": self.min_size,
+                "entries": sum(1 for s in self._segments.values() if s is not None),
+                "below_threshold": self._below_threshold,
+                "raw_bytes": self._raw_bytes,
+                "cache_bytes": self._cached_bytes,
+                "compression_ratio": round(self._cached_bytes / self._raw_bytes, 4)
+                if self._raw_bytes
+                else 0.0,
+                "hits": self._hits,
+                "misses": self._misses,
+                "bytes_saved": self._served_raw - self._served_compressed,
+            }
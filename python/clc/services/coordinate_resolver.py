@@ -1,7 +1,11 @@
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from pydantic import BaseModel
 
+from clc.enums import SubtypeBit, TypeBit
+from clc.services.bloom_filter import BloomFilter
+from clc.services.keyword_index import KeywordIndex
+
 
 class CoordinateData(BaseModel):
     coordinate_key: str
@@ -10,6 +14,8 @@ class CoordinateData(BaseModel):
     seo_keywords: Optional[list[str]] = None
     schema_type: Optional[str] = None
     coordinate_address: str
+    type_bits: int = 0
+    subtype_bits: int = 0
     bitmask_policy: int
     version: int
     is_active: bool
@@ -24,10 +30,18 @@ class CoordinateData(BaseModel):
 class CoordinateResolver:
     COORDINATE_FORMAT = r"^[0-9a-f]{4}\.[0-9a-f]{4}@$"
     
-    def __init__(self, registry_data: Dict[str, Any]):
+    def __init__(
+        self, registry_data: Mapping[str, Any], false_positive_rate: float = 0.01
+    ):
         self.layer1 = registry_data.get("layer1_human_map", {})
         self.layer2 = registry_data.get("layer2_coordinate_registry", {})
         self.layer3 = registry_data.get("layer3_bitmask_core", {})
+        self.false_positive_rate = false_positive_rate
+        self._address_index: Optional["AddressIndex"] = None
+        self._keyword_index: Optional[KeywordIndex] = None
+        self._membership_filter: Optional[BloomFilter] = None
+        self._filter_rejects = 0
+        self._filter_false_positives = 0
 
     def resolve(self, coordinate_key: str) -> CoordinateData:
         from clc.exceptions import CoordinateResolutionException
@@ -39,22 +53,24 @@ class CoordinateResolver:
         address = self.layer2.get(coordinate_key)
         mask = self.layer3.get(coordinate_key, 0)
 
-        if not address:
-            raise CoordinateResolutionException.layer_resolution_failed(2, coordinate_key)
+        return self._coordinate_data(coordinate_key, glossary, address, mask)
 
-        self._validate_coordinate_address(address)
+    def lookup(self, coordinate_key: str) -> Optional[CoordinateData]:
+        if isinstance(self.layer1, dict) or getattr(self.layer1, "in_memory", False):
+            if coordinate_key not in self.layer1:
+                self._filter_rejects += 1
+                return None
+            return self.resolve(coordinate_key)
 
-        return CoordinateData(
-            coordinate_key=coordinate_key,
-            label=glossary.get("label", ""),
-            description=glossary.get("description"),
-            seo_keywords=glossary.get("seo_keywords"),
-            schema_type=glossary.get("schema_type"),
-            coordinate_address=address,
-            bitmask_policy=mask,
-            version=1,
-            is_active=True,
-        )
+        if coordinate_key not in self.membership_filter:
+            self._filter_rejects += 1
+            return None
+
+        if coordinate_key not in self.layer1:
+            self._filter_false_positives += 1
+            return None
+
+        return self.resolve(coordinate_key)
 
     def resolve_mask(self, coordinate_key: str) -> int:
         from clc.exceptions import CoordinateResolutionException
@@ -89,8 +105,142 @@ class CoordinateResolver:
     def exists(self, coordinate_key: str) -> bool:
         return coordinate_key in self.layer1
 
-    def _validate_coordinate_address(self, address: str) -> None:
+    @property
+    def address_index(self) -> "AddressIndex":
+        if self._address_index is None:
+            self._address_index = AddressIndex(self.layer2)
+        return self._address_index
+
+    @property
+    def membership_filter(self) -> BloomFilter:
+        if self._membership_filter is None:
+            return self.build_membership_filter()
+        return self._membership_filter
+
+    def build_membership_filter(self) -> BloomFilter:
+        self._membership_filter = BloomFilter.from_keys(
+            self.layer1, len(self.layer1), self.false_positive_rate
+        )
+        return self._membership_filter
+
+    def membership_stats(self) -> Dict[str, Any]:
+        return {
+            **self.membership_filter.stats(),
+            "rejected": self._filter_rejects,
+            "false_positives": self._filter_false_positives,
+        }
+
+    @property
+    def keyword_index(self) -> KeywordIndex:
+        if self._keyword_index is None:
+            return self.build_keyword_index()
+        return self._keyword_index
+
+    def build_keyword_index(self) -> KeywordIndex:
+        self._keyword_index = KeywordIndex(self.layer1)
+        return self._keyword_index
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Tuple[str, int]]:
+        return self.keyword_index.search(query, limit, prefix)
+
+    def resolve_atom(self, coordinate_key: str) -> Tuple[TypeBit, SubtypeBit]:
+        from clc.exceptions import CoordinateResolutionException
+
+        atom = self.address_index.atoms.get(coordinate_key)
+        if atom is None:
+            if coordinate_key in self.layer2:
+                raise CoordinateResolutionException.invalid_coordinate_format(
+                    self.layer2[coordinate_key]
+                )
+            raise CoordinateResolutionException.coordinate_not_found(coordinate_key)
+
+        return (
+            TypeBit(atom & AddressIndex.TYPE_MASK),
+            SubtypeBit(atom & AddressIndex.SUBTYPE_MASK),
+        )
+
+    def find_by_atom(self, all_of: int = 0, any_of: int = 0, none_of: int = 0) -> List[str]:
+        return self.address_index.find(all_of, any_of, none_of)
+
+    def validate_unique_addresses(self) -> None:
+        from clc.exceptions import CoordinateResolutionException
+
+        for address, coordinate_keys in self.address_index.duplicates.items():
+            raise CoordinateResolutionException.duplicate_address(address, coordinate_keys)
+
+    def _coordinate_data(
+        self,
+        coordinate_key: str,
+        glossary: Dict[str, Any],
+        address: Optional[str],
+        mask: int,
+        version: int = 1,
+        is_active: bool = True,
+    ) -> CoordinateData:
+        from clc.exceptions import CoordinateResolutionException
+
+        if not address:
+            raise CoordinateResolutionException.layer_resolution_failed(2, coordinate_key)
+
+        atom = decode_address(address)
+
+        return CoordinateData(
+            coordinate_key=coordinate_key,
+            label=glossary.get("label", ""),
+            description=glossary.get("description"),
+            seo_keywords=glossary.get("seo_keywords"),
+            schema_type=glossary.get("schema_type"),
+            coordinate_address=address,
+            type_bits=atom & AddressIndex.TYPE_MASK,
+            subtype_bits=atom & AddressIndex.SUBTYPE_MASK,
+            bitmask_policy=mask,
+            version=version,
+            is_active=is_active,
+        )
+
+
+def decode_address(address: str) -> int:
+    from clc.exceptions import CoordinateResolutionException
+
+    if not re.match(CoordinateResolver.COORDINATE_FORMAT, address):
+        raise CoordinateResolutionException.invalid_coordinate_format(address)
+
+    return int(address[0], 16) | int(address[5], 16) << 4
+
+
+class AddressIndex:
+    ATOMS = 256
+    TYPE_MASK = 0x0F
+    SUBTYPE_MASK = 0xF0
+
+    def __init__(self, layer2: Dict[str, str]):
         from clc.exceptions import CoordinateResolutionException
 
-        if not re.match(self.COORDINATE_FORMAT, address):
-            raise CoordinateResolutionException.invalid_coordinate_format(address)
+        self.atoms: Dict[str, int] = {}
+        self.buckets: List[List[str]] = [[] for _ in range(self.ATOMS)]
+        self.invalid: List[str] = []
+
+        by_address: Dict[str, List[str]] = {}
+        for coordinate_key, address in layer2.items():
+            by_address.setdefault(address, []).append(coordinate_key)
+            try:
+                atom = decode_address(address)
+            except CoordinateResolutionException:
+                self.invalid.append(coordinate_key)
+                continue
+            self.atoms[coordinate_key] = atom
+            self.buckets[atom].append(coordinate_key)
+
+        self.duplicates = {
+            address: coordinate_keys
+            for address, coordinate_keys in by_address.items()
+            if len(coordinate_keys) > 1
+        }
+
+    def find(self, all_of: int = 0, any_of: int = 0, none_of: int = 0) -> List[str]:
+        checked = int(all_of) | int(none_of)
+        coordinate_keys: List[str] = []
+        for atom, bucket in enumerate(self.buckets):
+            if bucket and atom & checked == all_of and (not any_of or atom & any_of):
+                coordinate_keys.extend(bucket)
+        return coordinate_keys
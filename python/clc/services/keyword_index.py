@@ -0,0 +1,108 @@
+import bisect
+import heapq
+import re
+from typing import Any, Dict, List, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+FIELD_WEIGHTS = {"seo_keywords": 3, "label": 2, "description": 1}
+# A prefix query matches at most this many index tokens (in sorted order), so
+# a one-letter prefix cannot fan out over the whole vocabulary.
+MAX_PREFIX_EXPANSION = 64
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordIndex:
+    def __init__(self, layer1: Dict[str, Dict[str, Any]]):
+        postings: Dict[str, Dict[str, int]] = {}
+        for coordinate_key, glossary in layer1.items():
+            for field, weight in FIELD_WEIGHTS.items():
+                value = glossary.get(field)
+                if not value:
+                    continue
+                for text in value if isinstance(value, list) else [value]:
+                    for token in tokenize(str(text)):
+                        scores = postings.setdefault(token, {})
+                        scores[coordinate_key] = scores.get(coordinate_key, 0) + weight
+
+        self.postings = postings
+        self.tokens = sorted(postings)
+        self._ranked: Dict[str, List[Tuple[int, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def expand(self, prefix: str, limit: int = MAX_PREFIX_EXPANSION) -> List[str]:
+        start = bisect.bisect_left(self.tokens, prefix)
+        matches = []
+        for token in self.tokens[start:start + limit]:
+            if not token.startswith(prefix):
+                break
+            matches.append(token)
+        return matches
+
+    def search(
+        self, query: str, limit: int = 10, prefix: bool = True
+    ) -> List[Tuple[str, int]]:
+        terms = [[token] for token in tokenize(query)]
+        if not terms or limit <= 0:
+            return []
+        if prefix:
+            terms[-1] = self.expand(terms[-1][0])
+        terms = [
+            [token for token in tokens if token in self.postings] for tokens in terms
+        ]
+        if not all(terms):
+            return []
+
+        terms.sort(key=self._size)
+        driver, rest = terms[0], terms[1:]
+        rest_bound = sum(self._best(tokens) for tokens in rest)
+
+        kth: List[int] = []
+        scored: List[Tuple[str, int]] = []
+        seen = set()
+        for neg_score, coordinate_key in heapq.merge(*(self._ranking(t) for t in driver)):
+            if len(kth) == limit and -neg_score + rest_bound <= kth[0]:
+                break
+            if coordinate_key in seen:
+                continue
+            seen.add(coordinate_key)
+
+            score = -neg_score
+            for tokens in rest:
+                term_score = self._score(tokens, coordinate_key)
+                if not term_score:
+                    break
+                score += term_score
+            else:
+                scored.append((coordinate_key, score))
+                if len(kth) < limit:
+                    heapq.heappush(kth, score)
+                elif score > kth[0]:
+                    heapq.heapreplace(kth, score)
+
+        return heapq.nsmallest(limit, scored, key=lambda item: (-item[1], item[0]))
+
+    def _size(self, tokens: List[str]) -> int:
+        return sum(len(self.postings.get(token, ())) for token in tokens)
+
+    def _best(self, tokens: List[str]) -> int:
+        return max(-self._ranking(token)[0][0] for token in tokens)
+
+    def _score(self, tokens: List[str], coordinate_key: str) -> int:
+        return max(self.postings[token].get(coordinate_key, 0) for token in tokens)
+
+    def _ranking(self, token: str) -> List[Tuple[int, str]]:
+        ranked = self._ranked.get(token)
+        if ranked is None:
+            scores = self.postings.get(token)
+            if scores is None:
+                return []
+            ranked = sorted(
+                (-score, coordinate_key) for coordinate_key, score in scores.items()
+            )
+            self._ranked[token] = ranked
+        return ranked
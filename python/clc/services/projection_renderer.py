@@ -1,11 +1,33 @@
-from typing import Any, Dict
+import hashlib
+from typing import Any, Callable, Dict, Optional, Tuple
 from clc.enums import CallerType, ProjectionType
+from clc.services.compression import CompressedSegment, VariantCache
 from clc.services.coordinate_resolver import CoordinateData
 
 
+PUBLIC_PROJECTIONS = frozenset({ProjectionType.GLOSSARY})
+
+
 class ProjectionRenderer:
-    def __init__(self, projection_data: Dict[str, Dict[str, Any]]):
+    def __init__(
+        self,
+        projection_data: Dict[str, Dict[str, Any]],
+        registry_version: Optional[str] = None,
+        variants: Optional[VariantCache] = None,
+    ):
         self.projections = projection_data
+        self.registry_version = registry_version or ""
+        self.variants = variants if variants is not None else VariantCache()
+        self._payloads: Dict[Tuple[str, ProjectionType], Any] = {}
+
+    def precompute(self) -> None:
+        self._payloads = {
+            (coordinate_key, projection_type): self._lookup_payload(
+                coordinate_key, projection_type
+            )
+            for coordinate_key in self.projections
+            for projection_type in ProjectionType
+        }
 
     def render(
         self, coordinate_key: str, coordinate_data: CoordinateData, caller_mask: int
@@ -19,6 +41,29 @@ class ProjectionRenderer:
             "mask": hex(caller_mask),
         }
 
+    def projection_type(self, caller_mask: int) -> ProjectionType:
+        return self._select_projection_type(caller_mask)
+
+    def etag(self, coordinate_key: str, projection_type: ProjectionType) -> str:
+        digest = hashlib.blake2b(
+            f"{self.registry_version}:{coordinate_key}:{projection_type.value}".encode(),
+            digest_size=12,
+        )
+        return digest.hexdigest()
+
+    def compressed(
+        self,
+        coordinate_key: str,
+        caller_mask: int,
+        encoding: str,
+        build: Callable[[], bytes],
+    ) -> Optional[CompressedSegment]:
+        return self.variants.get((coordinate_key, caller_mask), encoding, build)
+
+    @staticmethod
+    def is_public(projection_type: ProjectionType) -> bool:
+        return projection_type in PUBLIC_PROJECTIONS
+
     def render_glossary(self, coordinate_data: CoordinateData) -> Dict[str, Any]:
         return {
             "label": coordinate_data.label,
@@ -52,6 +97,14 @@ class ProjectionRenderer:
 
     def _get_projection_payload(
         self, coordinate_key: str, projection_type: ProjectionType
+    ) -> Any:
+        payload = self._payloads.get((coordinate_key, projection_type))
+        if payload is not None:
+            return payload
+        return self._lookup_payload(coordinate_key, projection_type)
+
+    def _lookup_payload(
+        self, coordinate_key: str, projection_type: ProjectionType
     ) -> Any:
         payload = self.projections.get(coordinate_key, {}).get(projection_type.value)
         return payload or {"error": "PROJECTION_NOT_FOUND"}
@@ -0,0 +1,134 @@
+from collections.abc import ItemsView
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from clc.bits import to_unsigned
+from clc.services.coordinate_resolver import CoordinateData, CoordinateResolver
+from clc.storage.sqlite_registry import ConnectionPool, glossary_from_row
+
+GLOSSARY_COLUMNS = "label, description, seo_keywords, schema_type"
+
+
+class _LayerItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        yield from self._mapping.rows()
+
+
+class SQLiteLayer(Mapping):
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        columns: str,
+        condition: str,
+        decode: Callable[[Any], Any],
+    ):
+        self.pool = pool
+        self.decode = decode
+        self._get_sql = (
+            f"SELECT {columns} FROM coordinate_mappings "
+            f"WHERE coordinate_key = ? AND {condition}"
+        )
+        self._rows_sql = (
+            f"SELECT coordinate_key, {columns} FROM coordinate_mappings "
+            f"WHERE {condition} ORDER BY rowid"
+        )
+        self._count_sql = f"SELECT COUNT(*) FROM coordinate_mappings WHERE {condition}"
+
+    def __getitem__(self, coordinate_key: str) -> Any:
+        row = self.pool.execute(self._get_sql, (coordinate_key,)).fetchone()
+        if row is None:
+            raise KeyError(coordinate_key)
+        return self.decode(row)
+
+    def __contains__(self, coordinate_key: object) -> bool:
+        return self.pool.execute(self._get_sql, (coordinate_key,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for coordinate_key, _ in self.rows():
+            yield coordinate_key
+
+    def __len__(self) -> int:
+        return self.pool.execute(self._count_sql).fetchone()[0]
+
+    def items(self) -> _LayerItems:
+        return _LayerItems(self)
+
+    def rows(self) -> Iterator[Tuple[str, Any]]:
+        for row in self.pool.iterate(self._rows_sql):
+            yield row["coordinate_key"], self.decode(row)
+
+
+class SQLiteCoordinateResolver(CoordinateResolver):
+    RESOLVE_SQL = (
+        f"SELECT has_glossary, {GLOSSARY_COLUMNS}, coordinate_address, bitmask_policy, "
+        "version, is_active FROM coordinate_mappings WHERE coordinate_key = ?"
+    )
+
+    def __init__(
+        self, path: str, cached_statements: int = 64, false_positive_rate: float = 0.01
+    ):
+        self.path = path
+        self.pool = ConnectionPool(path, cached_statements)
+        super().__init__(
+            {
+                "layer1_human_map": SQLiteLayer(
+                    self.pool, GLOSSARY_COLUMNS, "has_glossary = 1", glossary_from_row
+                ),
+                "layer2_coordinate_registry": SQLiteLayer(
+                    self.pool,
+                    "coordinate_address",
+                    "coordinate_address IS NOT NULL",
+                    lambda row: row["coordinate_address"],
+                ),
+                "layer3_bitmask_core": SQLiteLayer(
+                    self.pool,
+                    "bitmask_policy",
+                    "bitmask_policy IS NOT NULL",
+                    lambda row: to_unsigned(row["bitmask_policy"]),
+                ),
+            },
+            false_positive_rate,
+        )
+
+    def resolve(self, coordinate_key: str) -> CoordinateData:
+        from clc.exceptions import CoordinateResolutionException
+
+        row = self.pool.execute(self.RESOLVE_SQL, (coordinate_key,)).fetchone()
+        if row is None or not row["has_glossary"]:
+            raise CoordinateResolutionException.coordinate_not_found(coordinate_key)
+
+        mask = row["bitmask_policy"]
+        return self._coordinate_data(
+            coordinate_key,
+            glossary_from_row(row),
+            row["coordinate_address"],
+            0 if mask is None else to_unsigned(mask),
+            version=row["version"],
+            is_active=bool(row["is_active"]),
+        )
+
+    def resolve_mask(self, coordinate_key: str) -> int:
+        return self._require(self.layer3, coordinate_key)
+
+    def resolve_glossary(self, coordinate_key: str) -> Dict[str, Any]:
+        glossary = self._require(self.layer1, coordinate_key)
+        return {
+            "label": glossary.get("label", ""),
+            "description": glossary.get("description"),
+            "seo_keywords": glossary.get("seo_keywords"),
+            "schema_type": glossary.get("schema_type"),
+        }
+
+    def resolve_address(self, coordinate_key: str) -> str:
+        return self._require(self.layer2, coordinate_key)
+
+    def close(self) -> None:
+        self.pool.close()
+
+    @staticmethod
+    def _require(layer: Mapping[str, Any], coordinate_key: str) -> Any:
+        from clc.exceptions import CoordinateResolutionException
+
+        value: Optional[Any] = layer.get(coordinate_key)
+        if value is None:
+            raise CoordinateResolutionException.coordinate_not_found(coordinate_key)
+        return value
@@ -0,0 +1,165 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol
+
+
+class TokenVerifier(Protocol):
+    def verify(self, token: str) -> Optional[float]:
+        ...
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class HMACTokenVerifier:
+    def __init__(self, secret: bytes, digest: str = "sha256", leeway: float = 0.0):
+        self.secret = secret
+        self.digest = digest
+        self.leeway = leeway
+
+    @classmethod
+    def from_env(cls) -> Optional["HMACTokenVerifier"]:
+        secret = os.getenv("CLC_TOKEN_SECRET")
+        if not secret:
+            return None
+        return cls(
+            secret.encode(),
+            digest=os.getenv("CLC_TOKEN_DIGEST", "sha256"),
+            leeway=float(os.getenv("CLC_TOKEN_LEEWAY", "0")),
+        )
+
+    def issue(
+        self, subject: str, ttl: float = 3600.0, now: Optional[float] = None
+    ) -> str:
+        expires = int((time.time() if now is None else now) + ttl)
+        claims = _b64encode(
+            json.dumps({"sub": subject, "exp": expires}, separators=(",", ":")).encode()
+        )
+        return f"{claims}.{self._sign(claims)}"
+
+    def verify(self, token: str) -> Optional[float]:
+        if not token.isascii():
+            return None
+        claims, _, signature = token.partition(".")
+        if not claims or not signature:
+            return None
+        if not hmac.compare_digest(signature, self._sign(claims)):
+            return None
+
+        try:
+            expires = float(json.loads(_b64decode(claims))["exp"])
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            return None
+        if expires + self.leeway <= time.time():
+            return None
+        return expires + self.leeway
+
+    def _sign(self, claims: str) -> str:
+        return _b64encode(
+            hmac.new(self.secret, claims.encode("ascii"), self.digest).digest()
+        )
+
+
+class VerifiedTokenCache:
+    def __init__(
+        self,
+        verifier: TokenVerifier,
+        max_entries: int = 10_000,
+        max_negative_entries: int = 10_000,
+        negative_ttl: float = 60.0,
+        max_ttl: float = 3600.0,
+    ):
+        self.verifier = verifier
+        self.max_entries = max_entries
+        self.max_negative_entries = max_negative_entries
+        self.negative_ttl = negative_ttl
+        self.max_ttl = max_ttl
+
+        self._valid: "OrderedDict[bytes, float]" = OrderedDict()
+        self._invalid: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._verify_seconds = 0.0
+
+    def verify(self, token: str) -> bool:
+        digest = hashlib.blake2b(
+            token.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        now = time.time()
+
+        with self._lock:
+            for entries, valid in ((self._valid, True), (self._invalid, False)):
+                expires = entries.get(digest)
+                if expires is None:
+                    continue
+                if expires > now:
+                    entries.move_to_end(digest)
+                    if valid:
+                        self._hits += 1
+                    else:
+                        self._negative_hits += 1
+                    return valid
+                del entries[digest]
+                self._expired += 1
+            self._misses += 1
+
+        started = time.perf_counter()
+        expires = self.verifier.verify(token)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._verify_seconds += elapsed
+            if expires is None:
+                self._store(self._invalid, self.max_negative_entries, digest, now + self.negative_ttl)
+                return False
+            self._store(self._valid, self.max_entries, digest, min(expires, now + self.max_ttl))
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._valid.clear()
+            self._invalid.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._negative_hits + self._misses
+            return {
+                "valid_entries": len(self._valid),
+                "invalid_entries": len(self._invalid),
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits + self._negative_hits) / lookups, 4)
+                if lookups
+                else 0.0,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "avg_verify_us": round(self._verify_seconds * 1e6 / self._misses, 2)
+                if self._misses
+                else 0.0,
+            }
+
+    def _store(
+        self, entries: "OrderedDict[bytes, float]", limit: int, digest: bytes, expires: float
+    ) -> None:
+        entries[digest] = expires
+        entries.move_to_end(digest)
+        while len(entries) > limit:
+            entries.popitem(last=False)
+            self._evictions += 1
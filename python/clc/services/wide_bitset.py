@@ -0,0 +1,210 @@
+from typing import Iterable, Iterator, List, Sequence, Union
+
+import numpy as np
+
+from clc.exceptions import InvalidBitmaskException
+
+WIDTHS = (128, 256, 512)
+WORD_BITS = 64
+WORD_DTYPE = np.dtype("<u8")
+POPCOUNT_TABLE = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+class WideBitSet:
+    __slots__ = ("value", "width")
+
+    def __init__(self, value: int = 0, width: int = 256):
+        if width not in WIDTHS:
+            raise InvalidBitmaskException.unsupported_width(width)
+        if value < 0:
+            raise InvalidBitmaskException.negative_flag_value(value)
+        if value >> width:
+            raise InvalidBitmaskException.flags_exceed_width(value, width)
+        self.value = value
+        self.width = width
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[int], width: int = 256) -> "WideBitSet":
+        value = 0
+        for position in positions:
+            _validate_position(position, width)
+            value |= 1 << position
+        return cls(value, width)
+
+    @classmethod
+    def from_words(cls, words: Sequence[int], width: int = 256) -> "WideBitSet":
+        if len(words) != width // WORD_BITS:
+            raise InvalidBitmaskException.word_count_mismatch(len(words), width)
+        return cls(
+            int.from_bytes(np.asarray(words, dtype=WORD_DTYPE).tobytes(), "little"), width
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "WideBitSet":
+        return cls(int.from_bytes(data, "little"), len(data) * 8)
+
+    @property
+    def word_count(self) -> int:
+        return self.width // WORD_BITS
+
+    def set_bit(self, position: int) -> "WideBitSet":
+        _validate_position(position, self.width)
+        return WideBitSet(self.value | (1 << position), self.width)
+
+    def clear_bit(self, position: int) -> "WideBitSet":
+        _validate_position(position, self.width)
+        return WideBitSet(self.value & ~(1 << position), self.width)
+
+    def toggle_bit(self, position: int) -> "WideBitSet":
+        _validate_position(position, self.width)
+        return WideBitSet(self.value ^ (1 << position), self.width)
+
+    def has_bit(self, position: int) -> bool:
+        _validate_position(position, self.width)
+        return bool((self.value >> position) & 1)
+
+    def apply_mask(self, mask: Union["WideBitSet", int]) -> "WideBitSet":
+        return WideBitSet(self.value & self._mask(mask), self.width)
+
+    def has_mask(self, mask: Union["WideBitSet", int]) -> bool:
+        mask = self._mask(mask)
+        return (self.value & mask) == mask
+
+    def has_any_mask(self, mask: Union["WideBitSet", int]) -> bool:
+        return (self.value & self._mask(mask)) != 0
+
+    def set_mask(self, mask: Union["WideBitSet", int]) -> "WideBitSet":
+        return WideBitSet(self.value | self._mask(mask), self.width)
+
+    def clear_mask(self, mask: Union["WideBitSet", int]) -> "WideBitSet":
+        return WideBitSet(self.value & ~self._mask(mask), self.width)
+
+    def count_set_bits(self) -> int:
+        return self.value.bit_count()
+
+    def iter_set_bits(self) -> Iterator[int]:
+        value = self.value
+        while value:
+            lowest = value & -value
+            yield lowest.bit_length() - 1
+            value ^= lowest
+
+    def words(self) -> np.ndarray:
+        return np.frombuffer(self.pack(), dtype=WORD_DTYPE)
+
+    def pack(self) -> bytes:
+        return self.value.to_bytes(self.width // 8, "little")
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __index__(self) -> int:
+        return self.value
+
+    def __iter__(self) -> Iterator[int]:
+        return self.iter_set_bits()
+
+    def __contains__(self, position: int) -> bool:
+        return 0 <= position < self.width and bool((self.value >> position) & 1)
+
+    def __and__(self, other: Union["WideBitSet", int]) -> "WideBitSet":
+        return self.apply_mask(other)
+
+    def __or__(self, other: Union["WideBitSet", int]) -> "WideBitSet":
+        return self.set_mask(other)
+
+    def __xor__(self, other: Union["WideBitSet", int]) -> "WideBitSet":
+        return WideBitSet(self.value ^ self._mask(other), self.width)
+
+    def __invert__(self) -> "WideBitSet":
+        return WideBitSet(self.value ^ ((1 << self.width) - 1), self.width)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WideBitSet):
+            return NotImplemented
+        return self.value == other.value and self.width == other.width
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.width))
+
+    def __repr__(self) -> str:
+        return f"WideBitSet({hex(self.value)}, width={self.width})"
+
+    def _mask(self, mask: Union["WideBitSet", int]) -> int:
+        mask = int(mask)
+        if mask < 0:
+            raise InvalidBitmaskException.invalid_mask_value(mask)
+        if mask >> self.width:
+            raise InvalidBitmaskException.flags_exceed_width(mask, self.width)
+        return mask
+
+
+def _validate_position(position: int, width: int) -> None:
+    if position < 0 or position >= width:
+        raise InvalidBitmaskException.invalid_bit_position(position, width - 1)
+
+
+def _mask_words(mask: Union[WideBitSet, int], width: int) -> np.ndarray:
+    if not isinstance(mask, WideBitSet) or mask.width != width:
+        mask = WideBitSet(int(mask), width)
+    return mask.words()
+
+
+def pack_many(bitsets: Iterable[Union[WideBitSet, int]], width: int = 256) -> np.ndarray:
+    size = width // 8
+    bitsets = list(bitsets)
+    try:
+        data = b"".join(int(bitset).to_bytes(size, "little") for bitset in bitsets)
+    except OverflowError:
+        for bitset in bitsets:
+            WideBitSet(int(bitset), width)
+        raise
+    return np.frombuffer(data, dtype=WORD_DTYPE).reshape(-1, width // WORD_BITS).copy()
+
+
+def unpack_many(words: np.ndarray) -> List[WideBitSet]:
+    words = np.ascontiguousarray(words, dtype=WORD_DTYPE)
+    width = words.shape[1] * WORD_BITS
+    data = words.tobytes()
+    size = width // 8
+    return [
+        WideBitSet(int.from_bytes(data[start : start + size], "little"), width)
+        for start in range(0, len(data), size)
+    ]
+
+
+def has_bit_many(words: np.ndarray, position: int) -> np.ndarray:
+    _validate_position(position, words.shape[1] * WORD_BITS)
+    column = words[:, position // WORD_BITS]
+    return ((column >> np.uint64(position % WORD_BITS)) & np.uint64(1)).astype(bool)
+
+
+def has_mask_many(words: np.ndarray, mask: Union[WideBitSet, int]) -> np.ndarray:
+    mask = _mask_words(mask, words.shape[1] * WORD_BITS)
+    return ((words & mask) == mask).all(axis=1)
+
+
+def has_any_mask_many(words: np.ndarray, mask: Union[WideBitSet, int]) -> np.ndarray:
+    mask = _mask_words(mask, words.shape[1] * WORD_BITS)
+    return (words & mask).any(axis=1)
+
+
+def apply_mask_many(words: np.ndarray, mask: Union[WideBitSet, int]) -> np.ndarray:
+    return words & _mask_words(mask, words.shape[1] * WORD_BITS)
+
+
+def set_mask_many(words: np.ndarray, mask: Union[WideBitSet, int]) -> np.ndarray:
+    return words | _mask_words(mask, words.shape[1] * WORD_BITS)
+
+
+def clear_mask_many(words: np.ndarray, mask: Union[WideBitSet, int]) -> np.ndarray:
+    return words & ~_mask_words(mask, words.shape[1] * WORD_BITS)
+
+
+def count_set_bits_many(words: np.ndarray) -> np.ndarray:
+    words = np.ascontiguousarray(words, dtype=WORD_DTYPE)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return POPCOUNT_TABLE[words.view(np.uint8)].reshape(len(words), -1).sum(
+        axis=1, dtype=np.int64
+    )
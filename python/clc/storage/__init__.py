@@ -0,0 +1,19 @@
+import importlib
+
+_STORAGE = {
+    "CompactRegistry": "clc.storage.compact_registry",
+    "EntityStore": "clc.storage.entity_store",
+    "FlagDelta": "clc.storage.entity_store",
+    "FlagColumnStore": "clc.storage.flag_column",
+    "FlagSchema": "clc.storage.flag_transfer",
+    "PartitionedRegistry": "clc.storage.partitioned_registry",
+    "TunnelLogWriter": "clc.storage.tunnel_log",
+}
+
+__all__ = list(_STORAGE)
+
+
+def __getattr__(name):
+    if name in _STORAGE:
+        return getattr(importlib.import_module(_STORAGE[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
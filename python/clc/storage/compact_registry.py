@@ -0,0 +1,220 @@
+import re
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+HAS_GLOSSARY = 0x01
+HAS_ADDRESS = 0x02
+HAS_MASK = 0x04
+RAW_ADDRESS = 0x08
+
+ADDRESS_PATTERN = re.compile(r"^([0-9a-f]{4})\.([0-9a-f]{4})@$")
+GLOSSARY_FIELDS = ("label", "description", "seo_keywords", "schema_type")
+
+
+class GlossaryRecord(Mapping):
+    __slots__ = GLOSSARY_FIELDS
+
+    def __init__(
+        self,
+        label: Optional[str],
+        description: Optional[str],
+        seo_keywords: Optional[Tuple[str, ...]],
+        schema_type: Optional[str],
+    ):
+        self.label = label
+        self.description = description
+        self.seo_keywords = seo_keywords
+        self.schema_type = schema_type
+
+    def __getitem__(self, field: str) -> Any:
+        value = getattr(self, field, None) if field in GLOSSARY_FIELDS else None
+        if value is None:
+            raise KeyError(field)
+        return list(value) if field == "seo_keywords" else value
+
+    def __iter__(self) -> Iterator[str]:
+        return (field for field in GLOSSARY_FIELDS if getattr(self, field) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"GlossaryRecord({dict(self)!r})"
+
+
+class CompactSection(Mapping):
+    in_memory = True
+
+    def __init__(
+        self,
+        registry: "CompactRegistry",
+        flag: int,
+        decode: Callable[[int], Any],
+    ):
+        self.registry = registry
+        self.flag = flag
+        self.decode = decode
+
+    def __getitem__(self, coordinate_key: str) -> Any:
+        ordinal = self.registry.ordinals.get(coordinate_key)
+        if ordinal is None or not self.registry.flags[ordinal] & self.flag:
+            raise KeyError(coordinate_key)
+        return self.decode(ordinal)
+
+    def __contains__(self, coordinate_key: object) -> bool:
+        ordinal = self.registry.ordinals.get(coordinate_key)
+        return ordinal is not None and bool(self.registry.flags[ordinal] & self.flag)
+
+    def __iter__(self) -> Iterator[str]:
+        flags = self.registry.flags
+        for ordinal, coordinate_key in enumerate(self.registry.keys):
+            if flags[ordinal] & self.flag:
+                yield coordinate_key
+
+    def __len__(self) -> int:
+        return self.registry.counts[self.flag]
+
+
+class CompactRegistry(Mapping):
+    def __init__(self) -> None:
+        self.keys: List[str] = []
+        self.ordinals: Dict[str, int] = {}
+        self.flags = bytearray()
+        self.glossaries: List[Optional[GlossaryRecord]] = []
+        self.addresses = array("I")
+        self.masks = array("Q")
+        self.raw_addresses: Dict[int, str] = {}
+        self.projections: Dict[int, Any] = {}
+        self.counts = {HAS_GLOSSARY: 0, HAS_ADDRESS: 0, HAS_MASK: 0}
+        self.extra: Dict[str, Any] = {}
+        self.source_hash: Optional[str] = None
+        self._strings: Dict[str, str] = {}
+
+        self.views: Dict[str, Mapping] = {
+            "layer1_human_map": CompactSection(self, HAS_GLOSSARY, self._glossary),
+            "layer2_coordinate_registry": CompactSection(self, HAS_ADDRESS, self._address),
+            "layer3_bitmask_core": CompactSection(self, HAS_MASK, self.masks.__getitem__),
+            "projections": _ProjectionSection(self),
+        }
+
+    @classmethod
+    def from_registry(cls, registry_data: Mapping[str, Any]) -> "CompactRegistry":
+        registry = cls()
+        for coordinate_key, glossary in (registry_data.get("layer1_human_map") or {}).items():
+            registry.set_glossary(coordinate_key, glossary or {})
+        for coordinate_key, address in (
+            registry_data.get("layer2_coordinate_registry") or {}
+        ).items():
+            registry.set_address(coordinate_key, address)
+        for coordinate_key, mask in (registry_data.get("layer3_bitmask_core") or {}).items():
+            registry.set_mask(coordinate_key, mask)
+        for coordinate_key, projection in (registry_data.get("projections") or {}).items():
+            registry.projections[registry._ordinal(coordinate_key)] = projection
+
+        registry.extra = {
+            name: value for name, value in registry_data.items() if name not in registry.views
+        }
+        source_hash = getattr(registry_data, "content_hash", None)
+        registry.source_hash = source_hash() if source_hash is not None else None
+        registry._strings.clear()
+        return registry
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self.views:
+            return self.views[name]
+        return self.extra[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.views
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self.views) + len(self.extra)
+
+    def content_hash(self) -> str:
+        if self.source_hash is None:
+            from clc.storage.content_hash import registry_content_hash
+
+            self.source_hash = registry_content_hash(self.views | self.extra)
+        return self.source_hash
+
+    def set_glossary(self, coordinate_key: str, glossary: Mapping[str, Any]) -> None:
+        keywords = glossary.get("seo_keywords")
+        ordinal = self._ordinal(coordinate_key)
+        self.glossaries[ordinal] = GlossaryRecord(
+            self._intern(glossary.get("label")),
+            self._intern(glossary.get("description")),
+            None if keywords is None else tuple(self._intern(k) for k in keywords),
+            self._intern(glossary.get("schema_type")),
+        )
+        self._mark(ordinal, HAS_GLOSSARY)
+
+    def set_address(self, coordinate_key: str, address: str) -> None:
+        ordinal = self._ordinal(coordinate_key)
+        match = ADDRESS_PATTERN.match(address) if isinstance(address, str) else None
+        if match:
+            self.addresses[ordinal] = int(match.group(1), 16) << 16 | int(match.group(2), 16)
+            self.flags[ordinal] &= ~RAW_ADDRESS
+            self.raw_addresses.pop(ordinal, None)
+        else:
+            self.raw_addresses[ordinal] = address
+            self.flags[ordinal] |= RAW_ADDRESS
+        self._mark(ordinal, HAS_ADDRESS)
+
+    def set_mask(self, coordinate_key: str, mask: int) -> None:
+        ordinal = self._ordinal(coordinate_key)
+        self.masks[ordinal] = mask
+        self._mark(ordinal, HAS_MASK)
+
+    def _ordinal(self, coordinate_key: str) -> int:
+        ordinal = self.ordinals.get(coordinate_key)
+        if ordinal is None:
+            ordinal = len(self.keys)
+            coordinate_key = self._intern(coordinate_key)
+            self.keys.append(coordinate_key)
+            self.ordinals[coordinate_key] = ordinal
+            self.flags.append(0)
+            self.glossaries.append(None)
+            self.addresses.append(0)
+            self.masks.append(0)
+        return ordinal
+
+    def _mark(self, ordinal: int, flag: int) -> None:
+        self.source_hash = None
+        if not self.flags[ordinal] & flag:
+            self.counts[flag] += 1
+            self.flags[ordinal] |= flag
+
+    def _intern(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def _glossary(self, ordinal: int) -> GlossaryRecord:
+        return self.glossaries[ordinal]
+
+    def _address(self, ordinal: int) -> str:
+        if self.flags[ordinal] & RAW_ADDRESS:
+            return self.raw_addresses[ordinal]
+        packed = self.addresses[ordinal]
+        return f"{packed >> 16:04x}.{packed & 0xFFFF:04x}@"
+
+
+class _ProjectionSection(Mapping):
+    in_memory = True
+
+    def __init__(self, registry: CompactRegistry):
+        self.registry = registry
+
+    def __getitem__(self, coordinate_key: str) -> Any:
+        ordinal = self.registry.ordinals.get(coordinate_key)
+        if ordinal is None or ordinal not in self.registry.projections:
+            raise KeyError(coordinate_key)
+        return self.registry.projections[ordinal]
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self.registry.keys
+        return (keys[ordinal] for ordinal in self.registry.projections)
+
+    def __len__(self) -> int:
+        return len(self.registry.projections)
@@ -0,0 +1,51 @@
+import hashlib
+import itertools
+import json
+from collections.abc import Mapping
+from typing import Any
+
+BATCH_SIZE = 10_000
+
+
+class HashedRegistry(dict):
+    def __init__(self, registry_data: Mapping, digest: str):
+        super().__init__(registry_data)
+        self.digest = digest
+
+    def content_hash(self) -> str:
+        return self.digest
+
+
+def bytes_content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def registry_content_hash(registry_data: Mapping) -> str:
+    content_hash = getattr(registry_data, "content_hash", None)
+    if content_hash is not None:
+        return content_hash()
+
+    encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=_plain)
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(registry_data):
+        section = registry_data[name]
+        if isinstance(section, Mapping) and not section:
+            continue
+        digest.update(encoder.encode(name).encode())
+        if not isinstance(section, Mapping):
+            digest.update(encoder.encode(section).encode())
+            continue
+
+        items = iter(section.items())
+        while True:
+            batch = dict(itertools.islice(items, BATCH_SIZE))
+            if not batch:
+                break
+            digest.update(encoder.encode(batch).encode())
+    return digest.hexdigest()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
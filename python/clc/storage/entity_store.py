@@ -0,0 +1,336 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    and_,
+    bindparam,
+    create_engine,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.pool import StaticPool
+
+from clc.bits import FLAG_MASK, to_signed, to_unsigned, validate_mask
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+entities = Table(
+    "entities",
+    metadata,
+    Column("id", BigInteger().with_variant(Integer, "sqlite"), primary_key=True),
+    Column("entity_type", String(64), nullable=False),
+    Column("entity_id", String(128), nullable=False),
+    Column("status_flags", BigInteger, nullable=False, default=0),
+    Column("coordinate_key", String(64)),
+    Column("created_at", DateTime, server_default=func.current_timestamp()),
+    Column("updated_at", DateTime, server_default=func.current_timestamp()),
+    UniqueConstraint("entity_type", "entity_id", name="unique_entity"),
+    Index("idx_status_flags", "status_flags"),
+    Index("idx_coordinate_key", "coordinate_key"),
+)
+
+
+@dataclass(frozen=True)
+class FlagDelta:
+    keep: int = FLAG_MASK
+    value: int = 0
+
+    @classmethod
+    def of(cls, set_mask: int = 0, clear_mask: int = 0, toggle_mask: int = 0) -> "FlagDelta":
+        for mask in (set_mask, clear_mask, toggle_mask):
+            validate_mask(mask)
+
+        return cls(
+            keep=~(set_mask | clear_mask) & FLAG_MASK,
+            value=(set_mask & ~clear_mask) ^ toggle_mask,
+        )
+
+    def then(self, other: "FlagDelta") -> "FlagDelta":
+        return FlagDelta(
+            keep=self.keep & other.keep,
+            value=(self.value & other.keep) ^ other.value,
+        )
+
+    def apply(self, flags: int) -> int:
+        return (flags & self.keep) ^ self.value
+
+    @property
+    def set_mask(self) -> int:
+        return ~self.keep & self.value & FLAG_MASK
+
+    @property
+    def clear_mask(self) -> int:
+        return ~self.keep & ~self.value & FLAG_MASK
+
+    @property
+    def toggle_mask(self) -> int:
+        return self.keep & self.value
+
+
+def _flag_update_expression(with_toggle: bool) -> Any:
+    flags = entities.c.status_flags
+    applied = flags.bitwise_or(bindparam("b_set")).bitwise_and(
+        bindparam("b_clear").bitwise_not()
+    )
+    if not with_toggle:
+        return applied
+
+    toggle = bindparam("b_toggle")
+    return applied.bitwise_or(toggle).bitwise_and(
+        applied.bitwise_and(toggle).bitwise_not()
+    )
+
+
+def _create_engine(url: str) -> Engine:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return create_engine(
+            parsed, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+    return create_engine(parsed)
+
+
+class EntityStore:
+    def __init__(
+        self,
+        engine: Union[str, Engine] = "sqlite://",
+        flush_window: float = 0.05,
+        max_pending: int = 10_000,
+    ):
+        self.engine = _create_engine(engine) if isinstance(engine, str) else engine
+        self.flush_window = flush_window
+        self.max_pending = max_pending
+
+        self._pending: Dict[Tuple[str, str], FlagDelta] = {}
+        self._in_flight = 0
+        self._window_started: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._statements = {
+            with_toggle: self._build_update(with_toggle) for with_toggle in (False, True)
+        }
+        self._flushes = 0
+        self._rows_flushed = 0
+        self._flush_seconds = 0.0
+        self._flush_errors = 0
+
+        metadata.create_all(self.engine)
+
+    def create(
+        self,
+        entity_type: str,
+        entity_id: str,
+        status_flags: int = 0,
+        coordinate_key: Optional[str] = None,
+    ) -> None:
+        self.create_many([(entity_type, entity_id, status_flags, coordinate_key)])
+
+    def create_many(
+        self,
+        rows: Iterable[Tuple[str, str, int, Optional[str]]],
+        connection: Optional[Connection] = None,
+    ) -> int:
+        params = []
+        for entity_type, entity_id, status_flags, coordinate_key in rows:
+            validate_mask(status_flags)
+            params.append(
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "status_flags": to_signed(status_flags),
+                    "coordinate_key": coordinate_key,
+                }
+            )
+
+        if not params:
+            return 0
+
+        with self._transaction(connection) as conn:
+            conn.execute(insert(entities), params)
+        return len(params)
+
+    def get_flags(self, entity_type: str, entity_id: str) -> Optional[int]:
+        with self.engine.connect() as conn:
+            flags = conn.execute(
+                select(entities.c.status_flags).where(
+                    and_(
+                        entities.c.entity_type == entity_type,
+                        entities.c.entity_id == entity_id,
+                    )
+                )
+            ).scalar_one_or_none()
+        return None if flags is None else to_unsigned(flags)
+
+    def set_mask(self, entity_type: str, entity_id: str, mask: int) -> int:
+        return self.apply(entity_type, entity_id, FlagDelta.of(set_mask=mask))
+
+    def clear_mask(self, entity_type: str, entity_id: str, mask: int) -> int:
+        return self.apply(entity_type, entity_id, FlagDelta.of(clear_mask=mask))
+
+    def toggle_mask(self, entity_type: str, entity_id: str, mask: int) -> int:
+        return self.apply(entity_type, entity_id, FlagDelta.of(toggle_mask=mask))
+
+    def apply(self, entity_type: str, entity_id: str, delta: FlagDelta) -> int:
+        return self._execute({(entity_type, entity_id): delta})
+
+    def apply_many(
+        self,
+        deltas: Dict[Tuple[str, str], FlagDelta],
+        connection: Optional[Connection] = None,
+    ) -> int:
+        return self._execute(deltas, connection) if deltas else 0
+
+    def queue(
+        self,
+        entity_type: str,
+        entity_id: str,
+        set_mask: int = 0,
+        clear_mask: int = 0,
+        toggle_mask: int = 0,
+    ) -> None:
+        delta = FlagDelta.of(set_mask, clear_mask, toggle_mask)
+        key = (entity_type, entity_id)
+
+        with self._lock:
+            pending = self._pending.get(key)
+            self._pending[key] = delta if pending is None else pending.then(delta)
+            if self._window_started is None:
+                self._open_window()
+
+            due = (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._window_started >= self.flush_window
+            )
+
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._in_flight = len(pending)
+                self._window_started = None
+                timer, self._timer = self._timer, None
+
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if not pending:
+                return 0
+
+            try:
+                return self._execute(pending)
+            except Exception:
+                self._requeue(pending)
+                raise
+            finally:
+                self._in_flight = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.engine.dispose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending) + self._in_flight,
+            "flushes": self._flushes,
+            "rows_flushed": self._rows_flushed,
+            "flush_errors": self._flush_errors,
+            "rows_per_second": (
+                self._rows_flushed / self._flush_seconds if self._flush_seconds else 0.0
+            ),
+        }
+
+    def _open_window(self) -> None:
+        self._window_started = time.monotonic()
+        self._timer = threading.Timer(self.flush_window, self._flush_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Flushing queued flag updates failed, retrying")
+
+    def _requeue(self, deltas: Dict[Tuple[str, str], FlagDelta]) -> None:
+        with self._lock:
+            self._flush_errors += 1
+            for key, delta in deltas.items():
+                pending = self._pending.get(key)
+                self._pending[key] = delta if pending is None else delta.then(pending)
+            if self._window_started is None:
+                self._open_window()
+
+    def _build_update(self, with_toggle: bool) -> Any:
+        return (
+            update(entities)
+            .where(
+                and_(
+                    entities.c.entity_type == bindparam("b_type"),
+                    entities.c.entity_id == bindparam("b_id"),
+                )
+            )
+            .values(
+                status_flags=_flag_update_expression(with_toggle),
+                updated_at=func.current_timestamp(),
+            )
+        )
+
+    def _execute(
+        self,
+        deltas: Dict[Tuple[str, str], FlagDelta],
+        connection: Optional[Connection] = None,
+    ) -> int:
+        batches: Dict[bool, List[Dict[str, Any]]] = {False: [], True: []}
+        for (entity_type, entity_id), delta in deltas.items():
+            params = {
+                "b_type": entity_type,
+                "b_id": entity_id,
+                "b_set": to_signed(delta.set_mask),
+                "b_clear": to_signed(delta.clear_mask),
+            }
+            toggle_mask = delta.toggle_mask
+            if toggle_mask:
+                params["b_toggle"] = to_signed(toggle_mask)
+            batches[bool(toggle_mask)].append(params)
+
+        started = time.perf_counter()
+        updated = 0
+        with self._transaction(connection) as conn:
+            for with_toggle, params in batches.items():
+                if params:
+                    result = conn.execute(self._statements[with_toggle], params)
+                    updated += max(result.rowcount, 0)
+
+        self._flushes += 1
+        self._rows_flushed += len(deltas)
+        self._flush_seconds += time.perf_counter() - started
+        return updated
+
+    @contextmanager
+    def _transaction(self, connection: Optional[Connection]) -> Iterator[Connection]:
+        if connection is not None:
+            yield connection
+            return
+        with self.engine.begin() as conn:
+            yield conn
@@ -0,0 +1,263 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from clc.bits import validate_mask
+
+FLAGS_DTYPE = np.dtype("<u8")
+IDS_DTYPE = np.dtype("<u8")
+POSITIONS_DTYPE = np.dtype("<u4")
+
+
+class FlagColumnStore:
+    MANIFEST = "manifest.json"
+    SEGMENT_ROWS = 1 << 24
+    CHUNK_ROWS = 1 << 20
+
+    def __init__(self, path: str, segment_rows: int = SEGMENT_ROWS):
+        self.path = path
+        self.segment_rows = segment_rows
+        self.segments: List[Dict[str, Any]] = []
+        self._maps: Dict[Tuple[str, str], np.memmap] = {}
+        self._live: Dict[str, Optional[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        self.refresh()
+
+    def __len__(self) -> int:
+        total = 0
+        for index, segment in enumerate(self.segments):
+            live = self._live_rows(index)
+            total += segment["rows"] if live is None else int(np.count_nonzero(live))
+        return total
+
+    @property
+    def rows(self) -> int:
+        return sum(segment["rows"] for segment in self.segments)
+
+    def refresh(self) -> None:
+        manifest_path = os.path.join(self.path, self.MANIFEST)
+        if not os.path.exists(manifest_path):
+            self.segments = []
+            return
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            self.segments = json.load(f)["segments"]
+        self._live.clear()
+
+    def append(self, entity_ids: Any, flags: Any) -> int:
+        entity_ids = np.ascontiguousarray(entity_ids, dtype=IDS_DTYPE)
+        flags = np.ascontiguousarray(flags, dtype=FLAGS_DTYPE)
+        if entity_ids.shape != flags.shape or entity_ids.ndim != 1:
+            raise ValueError("entity_ids and flags must be 1-D arrays of equal length")
+
+        with self._lock:
+            segments = list(self.segments)
+            sequence = max((segment["sequence"] for segment in segments), default=0)
+            for start in range(0, len(flags), self.segment_rows):
+                sequence += 1
+                end = start + self.segment_rows
+                segments.append(
+                    self._write_segment(sequence, entity_ids[start:end], flags[start:end])
+                )
+            self._write_manifest(segments)
+            self.segments = segments
+            self._live.clear()
+
+        return len(flags)
+
+    def get(self, entity_id: int) -> Optional[int]:
+        for segment in reversed(self.segments):
+            row = self._find_row(segment, entity_id)
+            if row is not None:
+                return int(self._column(segment, "flags")[row])
+        return None
+
+    def row_of(self, entity_id: int) -> Optional[int]:
+        offset = self.rows
+        for segment in reversed(self.segments):
+            offset -= segment["rows"]
+            row = self._find_row(segment, entity_id)
+            if row is not None:
+                return offset + row
+        return None
+
+    def iter_chunks(
+        self, chunk_rows: int = CHUNK_ROWS
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for index, segment in enumerate(self.segments):
+            ids = self._column(segment, "ids")
+            flags = self._column(segment, "flags")
+            live = self._live_rows(index)
+            for start in range(0, segment["rows"], chunk_rows):
+                end = start + chunk_rows
+                if live is None:
+                    yield ids[start:end], flags[start:end]
+                    continue
+                selected = live[start:end]
+                if selected.any():
+                    yield ids[start:end][selected], flags[start:end][selected]
+
+    def count(
+        self, all_of: int = 0, any_of: int = 0, none_of: int = 0, chunk_rows: int = CHUNK_ROWS
+    ) -> int:
+        total = 0
+        for _, flags in self.iter_chunks(chunk_rows):
+            total += int(np.count_nonzero(match_flags(flags, all_of, any_of, none_of)))
+        return total
+
+    def select(
+        self, all_of: int = 0, any_of: int = 0, none_of: int = 0, chunk_rows: int = CHUNK_ROWS
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for ids, flags in self.iter_chunks(chunk_rows):
+            matched = match_flags(flags, all_of, any_of, none_of)
+            if matched.any():
+                yield ids[matched], flags[matched]
+
+    def compact(self) -> None:
+        with self._lock:
+            old = list(self.segments)
+            sequence = max((segment["sequence"] for segment in old), default=0)
+            segments = []
+            pending_ids: List[np.ndarray] = []
+            pending_flags: List[np.ndarray] = []
+            pending_rows = 0
+
+            for index, segment in enumerate(old):
+                ids = np.asarray(self._column(segment, "ids"))
+                flags = np.asarray(self._column(segment, "flags"))
+                live = self._live_rows(index)
+                if live is not None:
+                    ids, flags = ids[live], flags[live]
+                pending_ids.append(ids)
+                pending_flags.append(flags)
+                pending_rows += len(ids)
+                while pending_rows >= self.segment_rows or (segment is old[-1] and pending_rows):
+                    ids = np.concatenate(pending_ids)
+                    flags = np.concatenate(pending_flags)
+                    sequence += 1
+                    segments.append(
+                        self._write_segment(
+                            sequence, ids[:self.segment_rows], flags[:self.segment_rows]
+                        )
+                    )
+                    pending_ids = [ids[self.segment_rows:]]
+                    pending_flags = [flags[self.segment_rows:]]
+                    pending_rows = len(pending_ids[0])
+
+            self._write_manifest(segments)
+            self.segments = segments
+            self._maps.clear()
+            self._live.clear()
+            for segment in old:
+                for suffix in ("flags", "ids", "idx", "pos"):
+                    os.unlink(self._segment_path(segment["name"], suffix))
+
+    def _live_rows(self, index: int) -> Optional[np.ndarray]:
+        segment = self.segments[index]
+        if segment["name"] in self._live:
+            return self._live[segment["name"]]
+
+        sorted_ids = self._column(segment, "idx")
+        live = None
+        if len(sorted_ids) > 1:
+            duplicated = sorted_ids[1:] == sorted_ids[:-1]
+            if duplicated.any():
+                live = np.ones(segment["rows"], dtype=bool)
+                live[self._column(segment, "pos")[:-1][duplicated]] = False
+
+        ids = self._column(segment, "ids")
+        for later in self.segments[index + 1:]:
+            later_ids = self._column(later, "idx")
+            if not len(later_ids) or not len(ids):
+                continue
+            slots = np.searchsorted(later_ids, ids).clip(max=len(later_ids) - 1)
+            superseded = later_ids[slots] == ids
+            if superseded.any():
+                if live is None:
+                    live = np.ones(segment["rows"], dtype=bool)
+                live &= ~superseded
+
+        self._live[segment["name"]] = live
+        return live
+
+    def _find_row(self, segment: Dict[str, Any], entity_id: int) -> Optional[int]:
+        sorted_ids = self._column(segment, "idx")
+        key = np.uint64(entity_id)
+        index = int(np.searchsorted(sorted_ids, key, side="right")) - 1
+        if index < 0 or sorted_ids[index] != key:
+            return None
+        return int(self._column(segment, "pos")[index])
+
+    def _column(self, segment: Dict[str, Any], suffix: str) -> np.memmap:
+        key = (segment["name"], suffix)
+        column = self._maps.get(key)
+        if column is None:
+            dtype = POSITIONS_DTYPE if suffix == "pos" else FLAGS_DTYPE
+            if segment["rows"] == 0:
+                column = np.empty(0, dtype=dtype)
+            else:
+                column = np.memmap(
+                    self._segment_path(segment["name"], suffix),
+                    dtype=dtype,
+                    mode="r",
+                    shape=(segment["rows"],),
+                )
+            self._maps[key] = column
+        return column
+
+    def _segment_path(self, name: str, suffix: str) -> str:
+        return os.path.join(self.path, f"{name}.{suffix}")
+
+    def _write_segment(
+        self, sequence: int, entity_ids: np.ndarray, flags: np.ndarray
+    ) -> Dict[str, Any]:
+        name = f"seg-{sequence:08d}"
+        order = np.argsort(entity_ids, kind="stable").astype(POSITIONS_DTYPE)
+        columns = {
+            "flags": flags,
+            "ids": entity_ids,
+            "idx": entity_ids[order],
+            "pos": order,
+        }
+        for suffix, column in columns.items():
+            _atomic_write(self._segment_path(name, suffix), column)
+
+        return {"name": name, "sequence": sequence, "rows": int(len(flags))}
+
+    def _write_manifest(self, segments: List[Dict[str, Any]]) -> None:
+        payload = json.dumps({"version": 1, "segments": segments}).encode()
+        _atomic_write(os.path.join(self.path, self.MANIFEST), payload)
+
+        directory = os.open(self.path, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def match_flags(
+    flags: np.ndarray, all_of: int = 0, any_of: int = 0, none_of: int = 0
+) -> np.ndarray:
+    for mask in (all_of, any_of, none_of):
+        validate_mask(mask)
+
+    matched = np.ones(len(flags), dtype=bool)
+    if all_of or none_of:
+        matched = (flags & np.uint64(all_of | none_of)) == np.uint64(all_of)
+    if any_of:
+        matched &= (flags & np.uint64(any_of)) != 0
+    return matched
+
+
+def _atomic_write(path: str, payload: Any) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
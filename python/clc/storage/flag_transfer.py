@@ -0,0 +1,423 @@
+import csv
+import io
+import json
+import os
+import time
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.engine import Connection
+
+from clc.bits import FLAG_MASK
+from clc.enums import BitPosition
+from clc.exceptions import FlagTransferException, InvalidBitmaskException
+from clc.storage.entity_store import EntityStore, FlagDelta, entities, metadata
+
+FLAGS_DTYPE = np.dtype("<u8")
+SIGNED_DTYPE = np.dtype("<i8")
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+TRUE_VALUES = np.array(["1", "true", "t", "yes", "y", "on"])
+FALSE_VALUES = np.array(["", "0", "false", "f", "no", "n", "off", "none", "null"])
+DEFAULT_CHUNK_SIZE = 50_000
+
+checkpoints = Table(
+    "flag_transfer_checkpoints",
+    metadata,
+    Column("name", String(255), primary_key=True),
+    Column("position", BigInteger, nullable=False),
+    Column("rows", BigInteger, nullable=False),
+    Column("last_id", BigInteger),
+    Column("updated_at", DateTime, server_default=func.current_timestamp()),
+)
+
+
+@dataclass
+class Checkpoint:
+    name: str
+    position: int = 0
+    rows: int = 0
+    last_id: int = 0
+
+
+@dataclass
+class TransferResult:
+    rows: int
+    chunks: int
+    resumed_rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class FlagSchema:
+    def __init__(self, columns: Mapping[str, int]):
+        self.columns: Dict[str, int] = {}
+        self.mask = 0
+        for name, position in columns.items():
+            if not BitPosition.is_valid(int(position)):
+                raise InvalidBitmaskException.invalid_bit_position(int(position))
+            self.columns[name] = int(position)
+            self.mask |= 1 << int(position)
+
+    @classmethod
+    def default(cls) -> "FlagSchema":
+        return cls({position.name.lower(): position.value for position in BitPosition})
+
+    @classmethod
+    def parse(cls, specs: Iterable[str]) -> "FlagSchema":
+        columns = {}
+        for spec in specs:
+            name, _, bit = spec.partition("=")
+            bit = bit or name
+            if bit.isdigit():
+                columns[name] = int(bit)
+            else:
+                try:
+                    columns[name] = BitPosition[bit.upper()].value
+                except KeyError:
+                    raise FlagTransferException.unknown_bit(bit) from None
+        return cls(columns)
+
+    def pack(self, columns: Mapping[str, Any]) -> np.ndarray:
+        flags: Optional[np.ndarray] = None
+        for name, position in self.columns.items():
+            bits = np.asarray(columns[name], dtype=bool)
+            if flags is None:
+                flags = np.zeros(len(bits), dtype=FLAGS_DTYPE)
+            flags |= bits.astype(FLAGS_DTYPE) << np.uint64(position)
+        return flags if flags is not None else np.zeros(0, dtype=FLAGS_DTYPE)
+
+    def unpack(self, flags: Any) -> "DecodedFlags":
+        return DecodedFlags(self, np.asarray(flags, dtype=FLAGS_DTYPE))
+
+
+class DecodedFlags(Mapping):
+    def __init__(self, schema: FlagSchema, flags: np.ndarray):
+        self.schema = schema
+        self.flags = flags
+        self._decoded: Dict[str, np.ndarray] = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        bits = self._decoded.get(name)
+        if bits is None:
+            position = np.uint64(self.schema.columns[name])
+            bits = ((self.flags >> position) & np.uint64(1)).astype(bool)
+            self._decoded[name] = bits
+        return bits
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.columns)
+
+    def __len__(self) -> int:
+        return len(self.schema.columns)
+
+
+def parse_booleans(column: str, values: List[Any], first_record: int = 1) -> np.ndarray:
+    distinct, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    text = np.array([value.strip().lower() for value in distinct.tolist()], dtype=str)
+    truthy = np.isin(text, TRUE_VALUES)[inverse]
+    invalid = ~truthy & ~np.isin(text, FALSE_VALUES)[inverse]
+    if invalid.any():
+        row = int(np.argmax(invalid))
+        raise FlagTransferException.invalid_boolean(
+            column, values[row], first_record + row
+        )
+    return truthy
+
+
+def detect_format(path: str) -> str:
+    fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise FlagTransferException.unknown_format(path)
+    return fmt
+
+
+def load_checkpoint(connection: Connection, name: str) -> Checkpoint:
+    row = connection.execute(
+        select(checkpoints.c.position, checkpoints.c.rows, checkpoints.c.last_id).where(
+            checkpoints.c.name == name
+        )
+    ).first()
+    if row is None:
+        return Checkpoint(name)
+    return Checkpoint(name, row.position, row.rows, row.last_id or 0)
+
+
+def save_checkpoint(connection: Connection, checkpoint: Checkpoint) -> None:
+    values = {
+        "position": checkpoint.position,
+        "rows": checkpoint.rows,
+        "last_id": checkpoint.last_id,
+        "updated_at": func.current_timestamp(),
+    }
+    result = connection.execute(
+        update(checkpoints).where(checkpoints.c.name == checkpoint.name).values(**values)
+    )
+    if not result.rowcount:
+        connection.execute(insert(checkpoints).values(name=checkpoint.name, **values))
+
+
+def import_flags(
+    store: EntityStore,
+    source: str,
+    schema: Optional[FlagSchema] = None,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    entity_type: Optional[str] = None,
+    id_column: str = "entity_id",
+    merge: bool = False,
+    checkpoint: Optional[str] = None,
+    resume: bool = True,
+) -> TransferResult:
+    schema = schema or FlagSchema.default()
+    fmt = fmt or detect_format(source)
+    name = checkpoint or f"import:{os.path.abspath(source)}"
+    keep = ~schema.mask & FLAG_MASK
+
+    checkpoints.create(store.engine, checkfirst=True)
+    with store.engine.begin() as conn:
+        state = load_checkpoint(conn, name) if resume else Checkpoint(name)
+
+    size = os.path.getsize(source)
+    if state.position > size:
+        raise FlagTransferException.checkpoint_mismatch(name, state.position, size)
+
+    started = time.perf_counter()
+    resumed_rows = state.rows
+    chunks = 0
+    with open(source, "rb") as f:
+        chunks_read = _read_chunks(f, fmt, source, state.position, chunk_size)
+        for columns, count, position in chunks_read:
+            first_record = state.rows + 1
+            ids = columns(id_column)
+            types = [entity_type] * count if entity_type else columns("entity_type")
+            for column, values in ((id_column, ids), ("entity_type", types)):
+                if None in values:
+                    raise FlagTransferException.missing_column(column, source)
+            flags = schema.pack(
+                {
+                    column: parse_booleans(column, columns(column), first_record)
+                    for column in schema.columns
+                }
+            ).tolist()
+
+            with store.engine.begin() as conn:
+                if merge:
+                    store.apply_many(
+                        {
+                            (str(kind), str(entity_id)): FlagDelta(keep, value)
+                            for kind, entity_id, value in zip(types, ids, flags)
+                        },
+                        conn,
+                    )
+                else:
+                    coordinate_keys = columns("coordinate_key", required=False)
+                    store.create_many(
+                        zip(map(str, types), map(str, ids), flags, coordinate_keys), conn
+                    )
+                state.position = position
+                state.rows += count
+                save_checkpoint(conn, state)
+            chunks += 1
+
+    return TransferResult(
+        state.rows - resumed_rows, chunks, resumed_rows, time.perf_counter() - started
+    )
+
+
+def export_flags(
+    store: EntityStore,
+    dest: str,
+    schema: Optional[FlagSchema] = None,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    entity_type: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    checkpoint: Optional[str] = None,
+    resume: bool = True,
+) -> TransferResult:
+    schema = schema or FlagSchema.default()
+    fmt = fmt or detect_format(dest)
+    name = checkpoint or f"export:{os.path.abspath(dest)}"
+    names = list(columns or schema.columns)
+    for column in names:
+        if column not in schema.columns:
+            raise FlagTransferException.missing_column(column, "flag schema")
+
+    checkpoints.create(store.engine, checkfirst=True)
+    with store.engine.begin() as conn:
+        state = load_checkpoint(conn, name) if resume else Checkpoint(name)
+
+    if state.position and os.path.exists(dest):
+        size = os.path.getsize(dest)
+        if state.position > size:
+            raise FlagTransferException.checkpoint_mismatch(name, state.position, size)
+        f = open(dest, "r+b")
+        f.seek(state.position)
+        f.truncate()
+    else:
+        state = Checkpoint(name)
+        f = open(dest, "wb")
+
+    query = select(
+        entities.c.id, entities.c.entity_type, entities.c.entity_id, entities.c.status_flags
+    ).order_by(entities.c.id)
+    if entity_type:
+        query = query.where(entities.c.entity_type == entity_type)
+
+    started = time.perf_counter()
+    resumed_rows = state.rows
+    chunks = 0
+    with f:
+        if fmt == "csv" and not state.position:
+            f.write(_csv_line(["entity_type", "entity_id", *names]))
+
+        while True:
+            with store.engine.connect() as conn:
+                rows = conn.execute(
+                    query.where(entities.c.id > state.last_id).limit(chunk_size)
+                ).all()
+            if not rows:
+                break
+
+            ids, types, entity_ids, signed = zip(*rows)
+            decoded = schema.unpack(np.array(signed, dtype=SIGNED_DTYPE).view(FLAGS_DTYPE))
+            f.write(_encode_rows(fmt, types, entity_ids, names, decoded))
+            f.flush()
+
+            state.position = f.tell()
+            state.rows += len(rows)
+            state.last_id = ids[-1]
+            with store.engine.begin() as conn:
+                save_checkpoint(conn, state)
+            chunks += 1
+
+    return TransferResult(
+        state.rows - resumed_rows, chunks, resumed_rows, time.perf_counter() - started
+    )
+
+
+class _LineSource:
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.position = f.tell()
+
+    def __iter__(self) -> "_LineSource":
+        return self
+
+    def __next__(self) -> str:
+        line = self.f.readline()
+        if not line:
+            raise StopIteration
+        self.position += len(line)
+        return line.decode("utf-8")
+
+
+def _read_chunks(
+    f: BinaryIO, fmt: str, source: str, position: int, chunk_size: int
+) -> Iterator[Tuple[Any, int, int]]:
+    lines = _LineSource(f)
+    if fmt == "csv":
+        reader = csv.reader(lines)
+        header = next(reader, [])
+        if header:
+            header[0] = header[0].lstrip("\ufeff")
+        index = {column: i for i, column in enumerate(header)}
+        if position:
+            f.seek(position)
+            lines.position = position
+        records: Iterator[Any] = reader
+    else:
+        f.seek(position)
+        lines.position = position
+        records = (json.loads(line) for line in lines if line.strip())
+
+    while True:
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                break
+        if not chunk:
+            return
+
+        if fmt == "csv":
+            transposed = list(zip_longest(*chunk, fillvalue=""))
+            columns = _csv_columns(transposed, index, source, len(chunk))
+        else:
+            columns = _json_columns(chunk)
+        yield columns, len(chunk), lines.position
+
+
+def _csv_columns(
+    transposed: List[Tuple[str, ...]], index: Dict[str, int], source: str, count: int
+) -> Any:
+    def column(name: str, required: bool = True) -> List[Any]:
+        if name not in index:
+            if required:
+                raise FlagTransferException.missing_column(name, source)
+            return [None] * count
+        return list(transposed[index[name]])
+
+    return column
+
+
+def _json_columns(records: List[Dict[str, Any]]) -> Any:
+    def column(name: str, required: bool = True) -> List[Any]:
+        return [record.get(name) for record in records]
+
+    return column
+
+
+def _csv_line(values: List[Any]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_rows(
+    fmt: str,
+    types: Tuple[str, ...],
+    entity_ids: Tuple[str, ...],
+    names: List[str],
+    decoded: DecodedFlags,
+) -> bytes:
+    if fmt == "csv":
+        buffer = io.StringIO()
+        bits = [decoded[name].astype(np.uint8).tolist() for name in names]
+        csv.writer(buffer, lineterminator="\n").writerows(zip(types, entity_ids, *bits))
+        return buffer.getvalue().encode("utf-8")
+
+    bits = [decoded[name].tolist() for name in names]
+    return "".join(
+        json.dumps(
+            {"entity_type": kind, "entity_id": entity_id, **dict(zip(names, values))}
+        )
+        + "\n"
+        for kind, entity_id, *values in zip(types, entity_ids, *bits)
+    ).encode("utf-8")
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Mapping, Tuple
+
+SECTIONS = (
+    "layer1_human_map",
+    "layer2_coordinate_registry",
+    "layer3_bitmask_core",
+    "projections",
+)
+
+
+def partition_of(coordinate_key: str, partitions: int) -> int:
+    return zlib.crc32(coordinate_key.encode("utf-8")) % partitions
+
+
+class SectionView(Mapping):
+    def __init__(self, registry: "PartitionedRegistry", section: str):
+        self.registry = registry
+        self.section = section
+
+    def __getitem__(self, coordinate_key: str) -> Any:
+        return self.registry.partition(self.section, coordinate_key)[coordinate_key]
+
+    def __contains__(self, coordinate_key: object) -> bool:
+        return isinstance(coordinate_key, str) and coordinate_key in self.registry.partition(
+            self.section, coordinate_key
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.registry.partitions):
+            yield from self.registry.read_partition(self.section, index)
+
+    def __len__(self) -> int:
+        return self.registry.counts.get(self.section, 0)
+
+
+class PartitionedRegistry(Mapping):
+    MANIFEST = "manifest.json"
+
+    def __init__(self, path: str, max_resident_bytes: int = 64 << 20):
+        self.path = path
+        self.max_resident_bytes = max(0, max_resident_bytes)
+
+        with open(os.path.join(path, self.MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        self.partitions: int = manifest["partitions"]
+        self.counts: Dict[str, int] = manifest["sections"]
+        self.extra: Dict[str, Any] = manifest.get("extra", {})
+        self.views = {section: SectionView(self, section) for section in self.counts}
+
+        self._resident: "OrderedDict[Tuple[str, int], Tuple[Dict[str, Any], int]]" = (
+            OrderedDict()
+        )
+        self._resident_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._loads = 0
+        self._evictions = 0
+
+    @classmethod
+    def write(
+        cls, registry_data: Dict[str, Any], path: str, partitions: int = 256
+    ) -> "PartitionedRegistry":
+        os.makedirs(path, exist_ok=True)
+        counts = {}
+        for section in SECTIONS:
+            entries = registry_data.get(section) or {}
+            shards: Dict[int, Dict[str, Any]] = {index: {} for index in range(partitions)}
+            for coordinate_key, value in entries.items():
+                shards[partition_of(coordinate_key, partitions)][coordinate_key] = value
+
+            os.makedirs(os.path.join(path, section), exist_ok=True)
+            for index, shard in shards.items():
+                _write_json(cls._partition_path(path, section, index), shard)
+            counts[section] = len(entries)
+
+        _write_json(
+            os.path.join(path, cls.MANIFEST),
+            {
+                "version": 1,
+                "partitions": partitions,
+                "sections": counts,
+                "extra": {
+                    name: value
+                    for name, value in registry_data.items()
+                    if name not in SECTIONS
+                },
+            },
+        )
+        return cls(path)
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self.views:
+            return self.views[name]
+        return self.extra[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.views
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self.views) + len(self.extra)
+
+    def partition(self, section: str, coordinate_key: str) -> Dict[str, Any]:
+        slot = (section, partition_of(coordinate_key, self.partitions))
+        with self._lock:
+            entry = self._resident.get(slot)
+            if entry is not None:
+                self._resident.move_to_end(slot)
+                self._hits += 1
+                return entry[0]
+
+        shard, size = self._load_partition(*slot)
+        with self._lock:
+            self._loads += 1
+            previous = self._resident.pop(slot, None)
+            if previous is not None:
+                self._resident_bytes -= previous[1]
+            self._resident[slot] = (shard, size)
+            self._resident_bytes += size
+            while (
+                self._resident_bytes > self.max_resident_bytes
+                and len(self._resident) > 1
+            ):
+                _, (_, evicted) = self._resident.popitem(last=False)
+                self._resident_bytes -= evicted
+                self._evictions += 1
+        return shard
+
+    def read_partition(self, section: str, index: int) -> Dict[str, Any]:
+        return self._load_partition(section, index)[0]
+
+    def _load_partition(self, section: str, index: int) -> Tuple[Dict[str, Any], int]:
+        with open(self._partition_path(self.path, section, index), "rb") as f:
+            document = f.read()
+        return json.loads(document), len(document)
+
+    def content_hash(self) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        paths = [os.path.join(self.path, self.MANIFEST)] + [
+            self._partition_path(self.path, section, index)
+            for section in self.counts
+            for index in range(self.partitions)
+        ]
+        for path in paths:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._loads
+            return {
+                "partitions": self.partitions,
+                "resident": len(self._resident),
+                "resident_bytes": self._resident_bytes,
+                "max_resident_bytes": self.max_resident_bytes,
+                "hits": self._hits,
+                "loads": self._loads,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    @staticmethod
+    def _partition_path(path: str, section: str, index: int) -> str:
+        return os.path.join(path, section, f"{index:05d}.json")
+
+
+def _write_json(path: str, payload: Any) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
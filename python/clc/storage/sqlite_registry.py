@@ -0,0 +1,151 @@
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Set
+
+from clc.bits import to_signed
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS coordinate_mappings (
+    coordinate_key TEXT PRIMARY KEY,
+    has_glossary INTEGER NOT NULL DEFAULT 0,
+    label TEXT,
+    description TEXT,
+    seo_keywords TEXT,
+    schema_type TEXT,
+    coordinate_address TEXT,
+    bitmask_policy INTEGER,
+    version INTEGER NOT NULL DEFAULT 1,
+    is_active INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_coordinate_address ON coordinate_mappings (coordinate_address);
+CREATE INDEX IF NOT EXISTS idx_bitmask_policy ON coordinate_mappings (bitmask_policy);
+"""
+
+INSERT_MAPPING = """
+INSERT INTO coordinate_mappings (
+    coordinate_key, has_glossary, label, description, seo_keywords, schema_type,
+    coordinate_address, bitmask_policy
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def import_registry(registry_data: Mapping[str, Any], path: str) -> int:
+    layer1 = registry_data.get("layer1_human_map") or {}
+    layer2 = registry_data.get("layer2_coordinate_registry") or {}
+    layer3 = registry_data.get("layer3_bitmask_core") or {}
+
+    rows = []
+    for coordinate_key in dict.fromkeys([*layer1, *layer2, *layer3]):
+        glossary = layer1.get(coordinate_key)
+        mask = layer3.get(coordinate_key)
+        keywords = (glossary or {}).get("seo_keywords")
+        rows.append(
+            (
+                coordinate_key,
+                int(glossary is not None),
+                (glossary or {}).get("label"),
+                (glossary or {}).get("description"),
+                None if keywords is None else json.dumps(keywords),
+                (glossary or {}).get("schema_type"),
+                layer2.get(coordinate_key),
+                None if mask is None else to_signed(mask),
+            )
+        )
+
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_MAPPING, rows)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+def glossary_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    glossary = {
+        "label": row["label"],
+        "description": row["description"],
+        "seo_keywords": None if row["seo_keywords"] is None else json.loads(row["seo_keywords"]),
+        "schema_type": row["schema_type"],
+    }
+    return {field: value for field, value in glossary.items() if value is not None}
+
+
+class _ThreadConnection:
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release(
+    connections: Set[sqlite3.Connection], lock: threading.Lock, conn: sqlite3.Connection
+) -> None:
+    with lock:
+        connections.discard(conn)
+    conn.close()
+
+
+class ConnectionPool:
+    def __init__(self, path: str, cached_statements: int = 64):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        self.uri = f"{Path(path).absolute().as_uri()}?mode=ro"
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: Set[sqlite3.Connection] = set()
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        holder = getattr(self._local, "connection", None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=self.cached_statements,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            holder = self._local.connection = _ThreadConnection(conn)
+            with self._lock:
+                self._connections.add(conn)
+            weakref.finalize(holder, _release, self._connections, self._lock, conn)
+        return holder.conn
+
+    def execute(self, sql: str, params: Any = ()) -> sqlite3.Cursor:
+        return self.connection().execute(sql, params)
+
+    def iterate(self, sql: str, params: Any = ()) -> Iterator[sqlite3.Row]:
+        conn = sqlite3.connect(self.uri, uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield from conn.execute(sql, params)
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return len(self._connections)
@@ -0,0 +1,263 @@
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, TextIO
+
+import numpy as np
+
+from clc.enums import ProjectionType
+
+MAGIC = b"CLCTLOG1"
+FORMAT_VERSION = 1
+SEGMENT_SUFFIX = ".clog"
+KEYS_SUFFIX = ".keys"
+UNKNOWN_COORDINATE = 0xFFFFFFFF
+NO_PROJECTION = 0xFF
+MAX_LATENCY_US = 0xFFFFFFFF
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("record_size", "<u4"),
+        ("count", "<u8"),
+        ("capacity", "<u8"),
+        ("created_us", "<u8"),
+        ("reserved", "V24"),
+    ]
+)
+RECORD_DTYPE = np.dtype(
+    [
+        ("request_id", "V16"),
+        ("timestamp_us", "<u8"),
+        ("caller_mask", "<u8"),
+        ("coordinate", "<u4"),
+        ("latency_us", "<u4"),
+        ("response_code", "<u2"),
+        ("projection", "u1"),
+        ("reserved", "V5"),
+    ]
+)
+HEADER = struct.Struct("<8sIIQQQ24x")
+RECORD = struct.Struct("<16sQQIIHB5x")
+COUNT_OFFSET = 16
+PROJECTION_CODES = {projection: code for code, projection in enumerate(ProjectionType)}
+
+
+class TunnelLogWriter:
+    SEGMENT_RECORDS = 1 << 20
+    SEGMENT_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        path: str,
+        segment_records: int = SEGMENT_RECORDS,
+        segment_seconds: float = SEGMENT_SECONDS,
+    ):
+        self.path = path
+        self.segment_records = segment_records
+        self.segment_seconds = segment_seconds
+        self.stream: Optional[str] = None
+        self.records_written = 0
+        self.segments_written = 0
+
+        self._keys: Dict[str, int] = {}
+        self._sequence = 0
+        self._map: Optional[mmap.mmap] = None
+        self._segment_path: Optional[str] = None
+        self._count = 0
+        self._opened = 0.0
+        self._pid: Optional[int] = None
+        self._keys_file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["TunnelLogWriter"]:
+        path = os.getenv("CLC_TUNNEL_LOG_DIR")
+        if not path:
+            return None
+        return cls(
+            path,
+            segment_records=int(
+                os.getenv("CLC_TUNNEL_LOG_SEGMENT_RECORDS", str(cls.SEGMENT_RECORDS))
+            ),
+            segment_seconds=float(
+                os.getenv("CLC_TUNNEL_LOG_SEGMENT_SECONDS", str(cls.SEGMENT_SECONDS))
+            ),
+        )
+
+    def log(
+        self,
+        request_id: bytes,
+        coordinate_key: Optional[str],
+        caller_mask: int,
+        response_code: int,
+        latency_seconds: float,
+        projection: Optional[ProjectionType] = None,
+        intern: bool = True,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        now = time.time() if timestamp is None else timestamp
+        latency_us = min(max(int(latency_seconds * 1e6), 0), MAX_LATENCY_US)
+        projection_code = (
+            NO_PROJECTION if projection is None else PROJECTION_CODES[projection]
+        )
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._open_stream()
+            coordinate = self._ordinal(coordinate_key, intern)
+            if (
+                self._map is None
+                or self._count >= self.segment_records
+                or time.monotonic() - self._opened >= self.segment_seconds
+            ):
+                self._rotate()
+
+            RECORD.pack_into(
+                self._map,
+                HEADER.size + self._count * RECORD.size,
+                request_id,
+                int(now * 1e6),
+                caller_mask,
+                coordinate,
+                latency_us,
+                response_code,
+                projection_code,
+            )
+            self._count += 1
+            self._map[COUNT_OFFSET : COUNT_OFFSET + 8] = self._count.to_bytes(8, "little")
+            self.records_written += 1
+
+    def rotate(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                self._seal()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            self._seal()
+            if self._keys_file is not None:
+                self._keys_file.close()
+                self._keys_file = None
+            self._pid = None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "path": self.path,
+            "stream": self.stream,
+            "records_written": self.records_written,
+            "segments_written": self.segments_written,
+            "coordinates": len(self._keys),
+            "active_records": self._count,
+        }
+
+    def _open_stream(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        if self._keys_file is not None:
+            self._keys_file.close()
+        self._map = None
+        self._pid = os.getpid()
+        self.stream = f"{self._pid}-{time.time_ns() // 1000}"
+        self._keys = {}
+        self._sequence = self._count = 0
+        self._keys_file = open(
+            os.path.join(self.path, self.stream + KEYS_SUFFIX), "a", encoding="utf-8"
+        )
+
+    def _ordinal(self, coordinate_key: Optional[str], intern: bool) -> int:
+        if coordinate_key is None:
+            return UNKNOWN_COORDINATE
+        ordinal = self._keys.get(coordinate_key)
+        if ordinal is not None:
+            return ordinal
+        if not intern or len(self._keys) >= UNKNOWN_COORDINATE:
+            return UNKNOWN_COORDINATE
+
+        ordinal = self._keys[coordinate_key] = len(self._keys)
+        self._keys_file.write(coordinate_key + "\n")
+        self._keys_file.flush()
+        return ordinal
+
+    def _rotate(self) -> None:
+        self._seal()
+        self._sequence += 1
+        self._segment_path = os.path.join(
+            self.path, f"{self.stream}-{self._sequence:06d}{SEGMENT_SUFFIX}"
+        )
+        with open(self._segment_path, "w+b") as f:
+            f.truncate(HEADER.size + self.segment_records * RECORD.size)
+            self._map = mmap.mmap(f.fileno(), 0)
+
+        HEADER.pack_into(
+            self._map,
+            0,
+            MAGIC,
+            FORMAT_VERSION,
+            RECORD.size,
+            0,
+            self.segment_records,
+            time.time_ns() // 1000,
+        )
+        self._count = 0
+        self._opened = time.monotonic()
+
+    def _seal(self) -> None:
+        if self._map is None:
+            return
+
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        if self._count:
+            with open(self._segment_path, "r+b") as f:
+                f.truncate(HEADER.size + self._count * RECORD.size)
+            self.segments_written += 1
+        else:
+            os.remove(self._segment_path)
+        self._count = 0
+
+
+def list_segments(path: str) -> List[str]:
+    return sorted(
+        os.path.join(path, name)
+        for name in os.listdir(path)
+        if name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def segment_stream(segment_path: str) -> str:
+    return os.path.basename(segment_path)[: -len(SEGMENT_SUFFIX)].rsplit("-", 1)[0]
+
+
+def read_segment(segment_path: str) -> np.ndarray:
+    size = os.path.getsize(segment_path)
+    if size < HEADER_DTYPE.itemsize:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+
+    header = np.fromfile(segment_path, HEADER_DTYPE, count=1)[0]
+    if header["magic"] != MAGIC or header["record_size"] != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Not a tunnel log segment: {segment_path}")
+
+    available = (size - HEADER_DTYPE.itemsize) // RECORD_DTYPE.itemsize
+    count = min(int(header["count"]), available)
+    if not count:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(
+        segment_path, RECORD_DTYPE, "r", offset=HEADER_DTYPE.itemsize, shape=(count,)
+    )
+
+
+def read_keys(path: str, stream: str) -> List[str]:
+    keys_path = os.path.join(path, stream + KEYS_SUFFIX)
+    if not os.path.exists(keys_path):
+        return []
+    with open(keys_path, "r", encoding="utf-8") as f:
+        return f.read().splitlines()
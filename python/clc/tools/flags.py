@@ -0,0 +1,108 @@
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from clc.storage.entity_store import EntityStore
+from clc.storage.flag_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    FlagSchema,
+    TransferResult,
+    export_flags,
+    import_flags,
+)
+
+
+def import_command(args: argparse.Namespace) -> int:
+    store = EntityStore(args.database)
+    try:
+        result = import_flags(
+            store,
+            args.source,
+            schema=_schema(args),
+            fmt=args.format,
+            chunk_size=args.chunk_size,
+            entity_type=args.entity_type,
+            id_column=args.id_column,
+            merge=args.merge,
+            resume=not args.restart,
+        )
+    finally:
+        store.close()
+
+    _report("Imported", result, args.source)
+    return 0
+
+
+def export_command(args: argparse.Namespace) -> int:
+    store = EntityStore(args.database)
+    try:
+        result = export_flags(
+            store,
+            args.dest,
+            schema=_schema(args),
+            fmt=args.format,
+            chunk_size=args.chunk_size,
+            entity_type=args.entity_type,
+            resume=not args.restart,
+        )
+    finally:
+        store.close()
+
+    _report("Exported", result, args.dest)
+    return 0
+
+
+def _schema(args: argparse.Namespace) -> FlagSchema:
+    return FlagSchema.parse(args.column) if args.column else FlagSchema.default()
+
+
+def _report(action: str, result: TransferResult, path: str) -> None:
+    resumed = f", resumed after {result.resumed_rows}" if result.resumed_rows else ""
+    print(
+        f"{action} {result.rows} rows in {result.chunks} chunks ({path}{resumed}): "
+        f"{result.rows_per_second:,.0f} rows/s"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="clc-flags")
+    parser.add_argument(
+        "--database",
+        default=os.getenv("CLC_ENTITY_DB", "sqlite:///entities.db"),
+        help="SQLAlchemy URL of the entity store",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, handler, path, help_text in (
+        ("import", import_command, "source", "Pack boolean columns into status_flags"),
+        ("export", export_command, "dest", "Decode status_flags into boolean columns"),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument(path)
+        command.add_argument(
+            "--column",
+            action="append",
+            help="column=BIT_NAME or column=position; defaults to every BitPosition",
+        )
+        command.add_argument("--format", choices=["csv", "jsonl"])
+        command.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        command.add_argument("--entity-type")
+        command.add_argument(
+            "--restart", action="store_true", help="Ignore the saved checkpoint"
+        )
+        command.set_defaults(handler=handler)
+
+    commands.choices["import"].add_argument("--id-column", default="entity_id")
+    commands.choices["import"].add_argument(
+        "--merge",
+        action="store_true",
+        help="Update the mapped bits of existing entities instead of inserting",
+    )
+
+    args = parser.parse_args(argv)
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
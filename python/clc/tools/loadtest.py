@@ -0,0 +1,271 @@
+import argparse
+import http.client
+import itertools
+import json
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import numpy as np
+
+BOT_USER_AGENTS = [
+    "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+    "Mozilla/5.0 (compatible; bingbot/2.0; +http://www.bing.com/bingbot.htm)",
+    "DuckDuckBot/1.1; (+http://duckduckgo.com/duckduckbot.html)",
+    "Twitterbot/1.0",
+]
+BROWSER_USER_AGENTS = [
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_2) AppleWebKit/605.1.15 Safari/605.1.15",
+]
+PROBE_USER_AGENTS = ["curl/8.4.0", "python-requests/2.31.0", ""]
+CALLERS = ("bot", "auth", "probe")
+PERCENTILES = {"p50": 50.0, "p95": 95.0, "p99": 99.0, "p999": 99.9}
+
+
+@dataclass
+class TrafficModel:
+    bot: float = 0.2
+    auth: float = 0.5
+    probe: float = 0.3
+    zipf_s: float = 1.1
+    miss_rate: float = 0.05
+
+    def caller_weights(self) -> np.ndarray:
+        weights = np.array([self.bot, self.auth, self.probe], dtype=float)
+        if weights.sum() <= 0 or (weights < 0).any():
+            raise ValueError("caller mix must be non-negative and not all zero")
+        return weights / weights.sum()
+
+
+@dataclass(frozen=True)
+class SyncRequest:
+    caller: str
+    target: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+class TrafficGenerator:
+    def __init__(self, keys: Sequence[str], model: TrafficModel, seed: int = 0):
+        if not keys:
+            raise ValueError("registry has no coordinates to target")
+
+        self.model = model
+        self.rng = np.random.default_rng(seed)
+        self.keys = [keys[i] for i in self.rng.permutation(len(keys))]
+
+        weights = np.arange(1, len(keys) + 1, dtype=float) ** -model.zipf_s
+        self._cdf = np.cumsum(weights) / weights.sum()
+
+    def batch(self, count: int) -> List[SyncRequest]:
+        rng = self.rng
+        callers = rng.choice(len(CALLERS), size=count, p=self.model.caller_weights())
+        ranks = np.minimum(
+            np.searchsorted(self._cdf, rng.random(count)), len(self.keys) - 1
+        )
+        misses = rng.random(count) < self.model.miss_rate
+        variants = rng.integers(0, 1 << 30, size=count)
+
+        requests = []
+        for caller, rank, miss, variant in zip(callers, ranks, misses, variants):
+            target = f"COORD_MISS_{variant:08x}" if miss else self.keys[rank]
+            requests.append(
+                SyncRequest(
+                    caller=CALLERS[caller],
+                    target=target,
+                    headers=self._headers(CALLERS[caller], int(variant)),
+                    body=json.dumps({"target": target, "payload": {}}).encode(),
+                )
+            )
+        return requests
+
+    @staticmethod
+    def _headers(caller: str, variant: int) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if caller == "bot":
+            headers["User-Agent"] = BOT_USER_AGENTS[variant % len(BOT_USER_AGENTS)]
+        elif caller == "auth":
+            headers["User-Agent"] = BROWSER_USER_AGENTS[variant % len(BROWSER_USER_AGENTS)]
+            headers["Authorization"] = f"Bearer lt-{variant:08x}"
+        else:
+            headers["User-Agent"] = PROBE_USER_AGENTS[variant % len(PROBE_USER_AGENTS)]
+        return headers
+
+
+class WSGITransport:
+    name = "wsgi"
+
+    def __init__(self, app: Any):
+        self.app = app
+        self._local = threading.local()
+
+    def send(self, request: SyncRequest) -> int:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        return client.post("/api/sync", data=request.body, headers=request.headers).status_code
+
+
+class HTTPTransport:
+    def __init__(self, url: str, timeout: float = 10.0):
+        parts = urlsplit(url)
+        self.name = url
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.path = (parts.path.rstrip("/") or "") + "/api/sync"
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def send(self, request: SyncRequest) -> int:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        try:
+            conn.request("POST", self.path, body=request.body, headers=request.headers)
+            response = conn.getresponse()
+            response.read()
+            if response.will_close:
+                conn.close()
+                self._local.conn = None
+            return response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self._local.conn = None
+            return 0
+
+
+def run(
+    transport: Any,
+    requests: List[SyncRequest],
+    rate: Optional[float] = None,
+    concurrency: int = 8,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    count = len(requests)
+    latencies = np.zeros(count, dtype=float)
+    statuses = np.zeros(count, dtype=np.int32)
+    schedule = None
+    if rate:
+        schedule = np.cumsum(np.random.default_rng(seed).exponential(1.0 / rate, count))
+
+    indices = itertools.count()
+    started = time.perf_counter()
+
+    def worker() -> None:
+        while True:
+            i = next(indices)
+            if i >= count:
+                return
+            if schedule is not None:
+                scheduled = started + schedule[i]
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            else:
+                scheduled = time.perf_counter()
+
+            statuses[i] = transport.send(requests[i])
+            latencies[i] = time.perf_counter() - scheduled
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return summarize(
+        latencies, statuses, [r.caller for r in requests], time.perf_counter() - started
+    )
+
+
+def summarize(
+    latencies: np.ndarray, statuses: np.ndarray, callers: List[str], elapsed: float
+) -> Dict[str, Any]:
+    callers_array = np.array(callers)
+    errors = (statuses == 0) | (statuses >= 500)
+
+    def breakdown(selected: np.ndarray) -> Dict[str, Any]:
+        if not selected.any():
+            return {
+                "requests": 0,
+                "latency_ms": {name: 0.0 for name in PERCENTILES},
+                "error_rate": 0.0,
+            }
+        values = np.percentile(latencies[selected] * 1e3, list(PERCENTILES.values()))
+        return {
+            "requests": int(selected.sum()),
+            "latency_ms": {name: round(float(v), 3) for name, v in zip(PERCENTILES, values)},
+            "error_rate": round(float(errors[selected].mean()), 6),
+        }
+
+    codes, counts = np.unique(statuses, return_counts=True)
+    return {
+        **breakdown(np.ones(len(latencies), dtype=bool)),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "status_codes": {str(int(c)): int(n) for c, n in zip(codes, counts)},
+        "callers": {caller: breakdown(callers_array == caller) for caller in CALLERS},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="clc-loadtest", description="Synthetic /api/sync traffic and latency report"
+    )
+    parser.add_argument("--url", help="Tunnel server base URL; omit to drive the app in-process")
+    parser.add_argument("--registry", default=None)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--rate", type=float, default=None, help="Open-loop arrivals per second")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--bot", type=float, default=0.2)
+    parser.add_argument("--auth", type=float, default=0.5)
+    parser.add_argument("--probe", type=float, default=0.3)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--miss-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    from clc.app import create_app, load_registry
+
+    registry = load_registry(args.registry)
+    model = TrafficModel(args.bot, args.auth, args.probe, args.zipf, args.miss_rate)
+    generator = TrafficGenerator(list(registry.get("layer1_human_map", {})), model, args.seed)
+    transport = (
+        HTTPTransport(args.url) if args.url else WSGITransport(create_app(registry_data=registry))
+    )
+
+    results = run(transport, generator.batch(args.requests), args.rate, args.concurrency, args.seed)
+    report = {
+        "label": args.label,
+        "target": transport.name,
+        "mode": "open-loop" if args.rate else "closed-loop",
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "model": asdict(model),
+        "results": results,
+    }
+
+    latency = results["latency_ms"]
+    print(
+        f"{results['requests']} requests in {results['elapsed_seconds']}s "
+        f"({results['throughput_rps']} req/s), errors {results['error_rate']:.2%}, "
+        + " ".join(f"{name}={value}ms" for name, value in latency.items()),
+        file=sys.stderr,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
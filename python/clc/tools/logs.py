@@ -0,0 +1,282 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from clc.enums import CallerType, ProjectionType
+from clc.storage.tunnel_log import (
+    PROJECTION_CODES,
+    UNKNOWN_COORDINATE,
+    list_segments,
+    read_keys,
+    read_segment,
+    segment_stream,
+)
+
+LATENCY_SUBBUCKETS = 16
+LATENCY_BINS = 2 + 32 * LATENCY_SUBBUCKETS
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def latency_bins(latency_us: np.ndarray) -> np.ndarray:
+    latency_us = np.asarray(latency_us, dtype=np.float64)
+    bins = np.zeros(len(latency_us), dtype=np.int64)
+    positive = latency_us > 0
+    bins[positive] = 1 + np.floor(np.log2(latency_us[positive]) * LATENCY_SUBBUCKETS)
+    return bins
+
+
+def histogram_percentiles(
+    histogram: np.ndarray, percentiles: Sequence[float] = PERCENTILES
+) -> Dict[str, float]:
+    total = int(histogram.sum())
+    if not total:
+        return {}
+
+    cumulative = np.cumsum(histogram)
+    ranks = np.ceil(np.asarray(percentiles) / 100.0 * total).clip(1, total)
+    bins = np.searchsorted(cumulative, ranks)
+    upper_us = np.where(bins > 0, np.exp2(bins / LATENCY_SUBBUCKETS), 0.0)
+    return {
+        f"p{percentile:g}": round(float(value) / 1000.0, 3)
+        for percentile, value in zip(percentiles, upper_us)
+    }
+
+
+@dataclass
+class LogSummary:
+    records: int = 0
+    segments: int = 0
+    first_us: Optional[int] = None
+    last_us: Optional[int] = None
+    callers: Dict[int, int] = field(default_factory=dict)
+    responses: Dict[int, int] = field(default_factory=dict)
+    projections: np.ndarray = field(default_factory=lambda: np.zeros(256, np.int64))
+    latency: np.ndarray = field(default_factory=lambda: np.zeros(LATENCY_BINS, np.int64))
+    coordinate_keys: List[str] = field(default_factory=list)
+    coordinate_codes: np.ndarray = field(default_factory=lambda: np.zeros(0, np.int64))
+    coordinate_counts: np.ndarray = field(default_factory=lambda: np.zeros(0, np.int64))
+
+    def merge(self, other: "LogSummary") -> "LogSummary":
+        self.records += other.records
+        self.segments += other.segments
+        if other.records:
+            self.first_us = min(
+                value for value in (self.first_us, other.first_us) if value is not None
+            )
+            self.last_us = max(
+                value for value in (self.last_us, other.last_us) if value is not None
+            )
+        for mine, theirs in (
+            (self.callers, other.callers),
+            (self.responses, other.responses),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.projections += other.projections
+        self.latency += other.latency
+
+        index = {key: i for i, key in enumerate(self.coordinate_keys)}
+        remap = np.array(
+            [index.setdefault(key, len(index)) for key in other.coordinate_keys],
+            dtype=np.int64,
+        )
+        self.coordinate_keys = list(index)
+        codes = remap[other.coordinate_codes // LATENCY_BINS] * LATENCY_BINS + (
+            other.coordinate_codes % LATENCY_BINS
+        )
+        self.coordinate_codes, inverse = np.unique(
+            np.concatenate([self.coordinate_codes, codes]), return_inverse=True
+        )
+        self.coordinate_counts = np.bincount(
+            inverse,
+            weights=np.concatenate([self.coordinate_counts, other.coordinate_counts]),
+            minlength=len(self.coordinate_codes),
+        ).astype(np.int64)
+        return self
+
+    def report(self, top: int = 20) -> Dict[str, Any]:
+        callers = {
+            _caller_label(mask): count
+            for mask, count in sorted(self.callers.items(), key=lambda item: -item[1])
+        }
+        deception = self.projections[PROJECTION_CODES[ProjectionType.DECEPTION]]
+        return {
+            "records": self.records,
+            "segments": self.segments,
+            "from": _isoformat(self.first_us),
+            "to": _isoformat(self.last_us),
+            "callers": callers,
+            "caller_share": {
+                label: round(count / self.records, 4) for label, count in callers.items()
+            },
+            "deception_rate": round(float(deception) / self.records, 4)
+            if self.records
+            else 0.0,
+            "projections": {
+                projection.value: int(self.projections[code])
+                for projection, code in PROJECTION_CODES.items()
+            },
+            "responses": {
+                str(code): count for code, count in sorted(self.responses.items())
+            },
+            "latency_ms": histogram_percentiles(self.latency),
+            "coordinates": self._top_coordinates(top),
+        }
+
+    def _top_coordinates(self, top: int) -> List[Dict[str, Any]]:
+        if not len(self.coordinate_codes):
+            return []
+
+        ordinals = self.coordinate_codes // LATENCY_BINS
+        requests = np.bincount(ordinals, weights=self.coordinate_counts).astype(np.int64)
+        ranked = np.argsort(-requests, kind="stable")[:top]
+        results = []
+        for ordinal in ranked:
+            if not requests[ordinal]:
+                break
+            selected = ordinals == ordinal
+            histogram = np.bincount(
+                self.coordinate_codes[selected] % LATENCY_BINS,
+                weights=self.coordinate_counts[selected],
+                minlength=LATENCY_BINS,
+            )
+            results.append(
+                {
+                    "coordinate_key": self.coordinate_keys[ordinal],
+                    "requests": int(requests[ordinal]),
+                    **histogram_percentiles(histogram, (50.0, 99.0)),
+                }
+            )
+        return results
+
+
+def summarize_segment(
+    segment_path: str, since_us: int = 0, until_us: Optional[int] = None
+) -> LogSummary:
+    records = read_segment(segment_path)
+    timestamps = np.asarray(records["timestamp_us"])
+    selected = timestamps >= since_us
+    if until_us is not None:
+        selected &= timestamps < until_us
+
+    def column(name: str) -> np.ndarray:
+        values = np.asarray(records[name])
+        return values if selected.all() else values[selected]
+
+    timestamps = column("timestamp_us")
+    summary = LogSummary(records=len(timestamps), segments=1)
+    if not summary.records:
+        return summary
+
+    summary.first_us = int(timestamps.min())
+    summary.last_us = int(timestamps.max())
+    for target, name in (
+        (summary.callers, "caller_mask"),
+        (summary.responses, "response_code"),
+    ):
+        values, counts = np.unique(column(name), return_counts=True)
+        target.update(zip(values.tolist(), counts.tolist()))
+    summary.projections = np.bincount(column("projection"), minlength=256).astype(np.int64)
+
+    bins = latency_bins(column("latency_us"))
+    summary.latency = np.bincount(bins, minlength=LATENCY_BINS).astype(np.int64)
+
+    coordinates = column("coordinate")
+    known = coordinates != UNKNOWN_COORDINATE
+    codes, counts = np.unique(
+        coordinates[known].astype(np.int64) * LATENCY_BINS + bins[known],
+        return_counts=True,
+    )
+    ordinals, local = np.unique(codes // LATENCY_BINS, return_inverse=True)
+    keys = read_keys(os.path.dirname(segment_path), segment_stream(segment_path))
+    summary.coordinate_keys = [
+        keys[ordinal] if ordinal < len(keys) else f"#{ordinal}"
+        for ordinal in ordinals.tolist()
+    ]
+    summary.coordinate_codes = local * LATENCY_BINS + codes % LATENCY_BINS
+    summary.coordinate_counts = counts.astype(np.int64)
+    return summary
+
+
+def summarize(
+    path: str,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    workers: Optional[int] = None,
+) -> LogSummary:
+    segments = list_segments(path)
+    since_us = int(since * 1e6) if since else 0
+    until_us = int(until * 1e6) if until else None
+
+    summary = LogSummary()
+    if workers == 0 or len(segments) <= 1:
+        for segment in segments:
+            summary.merge(summarize_segment(segment, since_us, until_us))
+        return summary
+
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        partials = pool.map(
+            summarize_segment,
+            segments,
+            [since_us] * len(segments),
+            [until_us] * len(segments),
+        )
+        for partial in partials:
+            summary.merge(partial)
+    return summary
+
+
+def _caller_label(mask: int) -> str:
+    try:
+        return CallerType(mask).label()
+    except ValueError:
+        return hex(mask)
+
+
+def _isoformat(timestamp_us: Optional[int]) -> Optional[str]:
+    if timestamp_us is None:
+        return None
+    return datetime.fromtimestamp(timestamp_us / 1e6, timezone.utc).isoformat()
+
+
+def stats(args: argparse.Namespace) -> int:
+    since = args.since
+    if args.last:
+        since = time.time() - args.last
+
+    summary = summarize(args.path, since=since, until=args.until, workers=args.workers)
+    print(json.dumps(summary.report(top=args.top), indent=2))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="clc-logs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stats_parser = commands.add_parser(
+        "stats", help="Aggregate caller, deception and latency statistics from segments"
+    )
+    stats_parser.add_argument("path", help="Directory set as CLC_TUNNEL_LOG_DIR")
+    stats_parser.add_argument("--since", type=float, help="Unix timestamp lower bound")
+    stats_parser.add_argument("--until", type=float, help="Unix timestamp upper bound")
+    stats_parser.add_argument("--last", type=float, help="Only the last N seconds")
+    stats_parser.add_argument(
+        "--workers", type=int, default=None, help="Reader processes (0 reads inline)"
+    )
+    stats_parser.add_argument("--top", type=int, default=20)
+    stats_parser.set_defaults(handler=stats)
+
+    args = parser.parse_args(argv)
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
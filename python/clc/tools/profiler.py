@@ -0,0 +1,198 @@
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Optional
+
+NODE_METHODS = frozenset({"process", "execute"})
+IDLE_FRAMES = frozenset(
+    {
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("socket.py", "accept"),
+        ("socket.py", "readinto"),
+    }
+)
+
+
+class SamplingProfiler:
+    def __init__(
+        self,
+        hz: float = 100.0,
+        window_seconds: float = 60.0,
+        windows: int = 10,
+        output_dir: Optional[str] = None,
+        max_depth: int = 128,
+        include_idle: bool = False,
+        enabled: bool = False,
+    ):
+        self.hz = hz
+        self.window_seconds = window_seconds
+        self.output_dir = output_dir
+        self.max_depth = max_depth
+        self.include_idle = include_idle
+        self.enabled = enabled
+
+        self.windows: Deque[Counter] = deque(maxlen=windows)
+        self._current: Counter = Counter()
+        self._window_started = time.monotonic()
+        self._labels: Dict[Any, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._control: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._toggle_requested = threading.Event()
+        self._lock = threading.Lock()
+        self._samples = 0
+        self._sampling_seconds = 0.0
+        self._running_since: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "SamplingProfiler":
+        return cls(
+            hz=float(os.getenv("CLC_PROFILER_HZ", "100")),
+            window_seconds=float(os.getenv("CLC_PROFILER_WINDOW", "60")),
+            output_dir=os.getenv("CLC_PROFILER_DIR") or None,
+            enabled=os.getenv("CLC_PROFILER", "false").lower() in ("1", "true"),
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self.enabled = True
+        self._stop.clear()
+        self._window_started = time.monotonic()
+        self._running_since = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="clc-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.rotate()
+
+    def toggle(self, signum: Optional[int] = None, frame: Any = None) -> None:
+        if self.running:
+            self.enabled = False
+            self.stop()
+        else:
+            self.start()
+
+    def install_signal_handler(self, signum: int = signal.SIGUSR2) -> None:
+        if self._control is None or not self._control.is_alive():
+            self._control = threading.Thread(
+                target=self._watch_toggles, name="clc-profiler-control", daemon=True
+            )
+            self._control.start()
+        signal.signal(signum, self.request_toggle)
+
+    def request_toggle(self, signum: Optional[int] = None, frame: Any = None) -> None:
+        self._toggle_requested.set()
+
+    def sample(self) -> None:
+        started = time.perf_counter()
+        if time.monotonic() - self._window_started >= self.window_seconds:
+            self.rotate()
+
+        own = threading.get_ident()
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+
+            leaf = (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+            if not self.include_idle and leaf in IDLE_FRAMES:
+                continue
+
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(self._label(frame))
+                frame = frame.f_back
+            labels.reverse()
+            stacks.append(";".join(labels))
+
+        with self._lock:
+            self._current.update(stacks)
+            self._samples += 1
+            self._sampling_seconds += time.perf_counter() - started
+
+    def rotate(self) -> None:
+        with self._lock:
+            window, self._current = self._current, Counter()
+            self._window_started = time.monotonic()
+            if not window:
+                return
+            self.windows.append(window)
+
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = os.path.join(
+                self.output_dir, f"profile-{os.getpid()}-{int(time.time())}.folded"
+            )
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(collapse(window))
+
+    def collapsed(self, window: int = -1) -> str:
+        with self._lock:
+            if window == -1 and self._current:
+                return collapse(self._current)
+            windows = list(self.windows)
+        try:
+            return collapse(windows[window])
+        except IndexError:
+            return ""
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            wall = (
+                time.monotonic() - self._running_since
+                if self._running_since is not None
+                else 0.0
+            )
+            return {
+                "running": self.running,
+                "hz": self.hz,
+                "window_seconds": self.window_seconds,
+                "windows": len(self.windows),
+                "samples": self._samples,
+                "overhead": round(self._sampling_seconds / wall, 6) if wall else 0.0,
+            }
+
+    def _watch_toggles(self) -> None:
+        while True:
+            self._toggle_requested.wait()
+            self._toggle_requested.clear()
+            self.toggle()
+
+    def _run(self) -> None:
+        interval = 1.0 / self.hz
+        while not self._stop.wait(interval):
+            self.sample()
+
+    def _label(self, frame: Any) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{os.path.basename(code.co_filename)}:{name}".replace(";", ":")
+            self._labels[code] = label
+
+        if code.co_name in NODE_METHODS:
+            node_id = getattr(frame.f_locals.get("self"), "node_id", None)
+            if node_id is not None:
+                return f"{label} [{node_id}]"
+        return label
+
+
+def collapse(window: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(window.items()))
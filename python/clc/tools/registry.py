@@ -0,0 +1,89 @@
+import argparse
+import sys
+from typing import List, Optional
+
+import yaml
+
+from clc.storage.partitioned_registry import PartitionedRegistry
+from clc.storage.sqlite_registry import import_registry
+
+
+def partition(args: argparse.Namespace) -> int:
+    with open(args.source, "r", encoding="utf-8") as f:
+        registry_data = yaml.safe_load(f) or {}
+
+    registry = PartitionedRegistry.write(registry_data, args.dest, args.partitions)
+    counts = ", ".join(f"{section}={count}" for section, count in registry.counts.items())
+    print(f"Wrote {registry.partitions} partitions to {args.dest} ({counts})")
+    return 0
+
+
+def import_sqlite(args: argparse.Namespace) -> int:
+    with open(args.source, "r", encoding="utf-8") as f:
+        registry_data = yaml.safe_load(f) or {}
+
+    rows = import_registry(registry_data, args.dest)
+    print(f"Imported {rows} coordinates into {args.dest}")
+    return 0
+
+
+def validate(args: argparse.Namespace) -> int:
+    from clc.tools.validator import validate_registry
+
+    report = validate_registry(
+        args.source,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_issues=args.max_issues,
+    )
+    for line in report.format():
+        print(line)
+
+    counts = ", ".join(f"{section}={count}" for section, count in report.entries.items())
+    print(
+        f"Checked {report.coordinates} coordinates ({counts}): "
+        f"{report.errors} errors, {report.warnings} warnings",
+        file=sys.stderr,
+    )
+    return 0 if report.ok and not (args.strict and report.warnings) else 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="clc-registry")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    partition_parser = commands.add_parser(
+        "partition", help="Shard a YAML registry into an on-disk partitioned layout"
+    )
+    partition_parser.add_argument("source")
+    partition_parser.add_argument("dest")
+    partition_parser.add_argument("--partitions", type=int, default=256)
+    partition_parser.set_defaults(handler=partition)
+
+    import_parser = commands.add_parser(
+        "import-sqlite", help="Load a YAML registry into a SQLite coordinate_mappings table"
+    )
+    import_parser.add_argument("source")
+    import_parser.add_argument("dest")
+    import_parser.set_defaults(handler=import_sqlite)
+
+    validate_parser = commands.add_parser(
+        "validate", help="Stream-check a YAML registry and report problems by line"
+    )
+    validate_parser.add_argument("source")
+    validate_parser.add_argument(
+        "--workers", type=int, default=None, help="Checker processes (0 checks inline)"
+    )
+    validate_parser.add_argument("--chunk-size", type=int, default=5_000)
+    validate_parser.add_argument("--max-issues", type=int, default=1_000)
+    validate_parser.add_argument(
+        "--strict", action="store_true", help="Exit non-zero on warnings too"
+    )
+    validate_parser.set_defaults(handler=validate)
+
+    args = parser.parse_args(argv)
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
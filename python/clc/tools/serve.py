@@ -0,0 +1,277 @@
+import argparse
+import gc
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from werkzeug.serving import make_server
+
+logger = logging.getLogger("clc.serve")
+
+INDEPENDENT_PROBE = """
+import json, os, sys
+from clc.app import create_app, load_registry
+from clc.tools.serve import read_memory
+create_app(registry_data=load_registry(sys.argv[1] or None))
+print(json.dumps(read_memory(os.getpid())))
+"""
+
+
+def read_memory(pid: int) -> Dict[str, int]:
+    fields: Dict[str, int] = {}
+    with open(f"/proc/{pid}/smaps_rollup", "r", encoding="utf-8") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            parts = rest.split()
+            if len(parts) == 2 and parts[1] == "kB":
+                fields[name] = int(parts[0]) * 1024
+
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def measure_independent_startup(registry_path: Optional[str]) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-c", INDEPENDENT_PROBE, registry_path or ""],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class PreforkServer:
+    RESTART_BACKOFF_SECONDS = 1.0
+    MIN_WORKER_LIFETIME_SECONDS = 1.0
+    SUPERVISE_INTERVAL_SECONDS = 0.25
+
+    def __init__(
+        self,
+        app: Any,
+        host: str = "127.0.0.1",
+        port: int = 5000,
+        workers: int = 2,
+        threaded: bool = False,
+        backlog: int = 2048,
+        registry_path: Optional[str] = None,
+    ):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.threaded = threaded
+        self.backlog = backlog
+        self.registry_path = registry_path
+        self.socket: Optional[socket.socket] = None
+        self.children: Dict[int, int] = {}
+        self.started_at: Dict[int, float] = {}
+        self.running = False
+        self.profiler = getattr(app, "extensions", {}).get("clc.profiler")
+        self.tunnel_log = getattr(app, "extensions", {}).get("clc.tunnel_log")
+        self._independent: Optional[Dict[str, int]] = None
+        self._report_requested = False
+
+    def bind(self) -> None:
+        self.socket = socket.create_server((self.host, self.port), backlog=self.backlog)
+        self.socket.set_inheritable(True)
+        self.port = self.socket.getsockname()[1]
+
+    def serve(self) -> None:
+        if self.socket is None:
+            self.bind()
+
+        if self.profiler is not None and self.profiler.running:
+            self.profiler.stop()
+
+        gc.collect()
+        gc.freeze()
+
+        self.running = True
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGUSR1, self._handle_report)
+        signal.signal(signal.SIGUSR2, self._handle_profile)
+
+        logger.info("Listening on http://%s:%d", self.host, self.port)
+        for slot in range(self.workers):
+            self._spawn(slot)
+
+        self._supervise()
+        self.socket.close()
+
+    def memory_report(self) -> Dict[str, Any]:
+        workers = {pid: read_memory(pid) for pid in sorted(self.children)}
+        if self._independent is None:
+            self._independent = measure_independent_startup(self.registry_path)
+
+        return {
+            "master": read_memory(os.getpid()),
+            "workers": workers,
+            "prefork_total_pss": sum(w["pss"] for w in workers.values()),
+            "independent_worker_rss": self._independent["rss"],
+            "independent_total_rss": self._independent["rss"] * len(workers),
+        }
+
+    def log_memory_report(self) -> None:
+        report = self.memory_report()
+        mib = 1024 * 1024
+        for pid, usage in report["workers"].items():
+            logger.info(
+                "worker %d: rss=%.1fMiB pss=%.1fMiB shared=%.1fMiB private=%.1fMiB",
+                pid,
+                usage["rss"] / mib,
+                usage["pss"] / mib,
+                usage["shared"] / mib,
+                usage["private"] / mib,
+            )
+        logger.info(
+            "prefork total pss=%.1fMiB vs independent startup %d x %.1fMiB = %.1fMiB",
+            report["prefork_total_pss"] / mib,
+            len(report["workers"]),
+            report["independent_worker_rss"] / mib,
+            report["independent_total_rss"] / mib,
+        )
+
+    def _spawn(self, slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+
+        self.children[pid] = slot
+        self.started_at[pid] = time.monotonic()
+        logger.info("Booted worker %d (pid %d)", slot, pid)
+
+    def _run_worker(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_worker_stop)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        signal.signal(signal.SIGUSR2, signal.SIG_IGN)
+        gc.enable()
+
+        if self.profiler is not None:
+            self.profiler.install_signal_handler(signal.SIGUSR2)
+            if self.profiler.enabled:
+                self.profiler.start()
+
+        exit_code = 0
+        try:
+            server = make_server(
+                self.host,
+                self.port,
+                self.app,
+                threaded=self.threaded,
+                fd=self.socket.fileno(),
+            )
+            server.serve_forever()
+        except SystemExit:
+            pass
+        except BaseException:
+            exit_code = 1
+        finally:
+            try:
+                if self.tunnel_log is not None:
+                    self.tunnel_log.close()
+            finally:
+                os._exit(exit_code)
+
+    def _supervise(self) -> None:
+        while self.children:
+            if self._report_requested:
+                self._report_requested = False
+                self.log_memory_report()
+
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(self.SUPERVISE_INTERVAL_SECONDS)
+                continue
+
+            slot = self.children.pop(pid, None)
+            started_at = self.started_at.pop(pid, time.monotonic())
+            if slot is None or not self.running:
+                continue
+
+            logger.warning(
+                "Worker %d (pid %d) exited with status %d, restarting",
+                slot,
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            if time.monotonic() - started_at < self.MIN_WORKER_LIFETIME_SECONDS:
+                time.sleep(self.RESTART_BACKOFF_SECONDS)
+            self._spawn(slot)
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        self.running = False
+        self._signal_children(signal.SIGTERM)
+
+    def _handle_worker_stop(self, signum: int, frame: Any) -> None:
+        raise SystemExit(0)
+
+    def _handle_profile(self, signum: int, frame: Any) -> None:
+        if self.profiler is not None:
+            self.profiler.enabled = not self.profiler.enabled
+        self._signal_children(signal.SIGUSR2)
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _handle_report(self, signum: int, frame: Any) -> None:
+        self._report_requested = True
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="clc-serve", description="Pre-fork server for the /api/sync tunnel"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threaded", action="store_true")
+    parser.add_argument("--registry", default=None)
+    parser.add_argument("--memory-report", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="[%(process)d] %(levelname)s %(message)s"
+    )
+
+    gc.disable()
+
+    from clc.app import create_app, load_registry
+
+    app = create_app(registry_data=load_registry(args.registry))
+    server = PreforkServer(
+        app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        threaded=args.threaded,
+        registry_path=args.registry,
+    )
+    if args.memory_report:
+        signal.setitimer(signal.ITIMER_REAL, 2.0)
+        signal.signal(signal.SIGALRM, server._handle_report)
+
+    server.serve()
+
+
+if __name__ == "__main__":
+    main()
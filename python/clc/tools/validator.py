@@ -0,0 +1,384 @@
+import os
+import re
+import sqlite3
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+from pydantic import ValidationError
+from yaml.events import MappingEndEvent, MappingStartEvent, ScalarEvent
+
+from clc.exceptions import CoordinateResolutionException, InvalidBitmaskException
+from clc.services.coordinate_resolver import CoordinateData, decode_address
+from clc.bits import validate_mask
+
+LAYER1 = "layer1_human_map"
+LAYER2 = "layer2_coordinate_registry"
+LAYER3 = "layer3_bitmask_core"
+PROJECTIONS = "projections"
+SECTIONS = (LAYER1, LAYER2, LAYER3, PROJECTIONS)
+
+ERROR = "error"
+WARNING = "warning"
+
+Entry = Tuple[str, Any, int]
+Issue = Tuple[int, str, str, str]
+Fact = Tuple[str, str, int, Optional[str]]
+Fragment = Tuple[str, int, int, int]
+
+ANCHOR_PATTERN = re.compile(rb"(^|[\s\[{,])[&*][^\s,\]}]")
+
+SCHEMA = """
+CREATE TABLE entries (section TEXT, coordinate_key TEXT, line INTEGER, address TEXT);
+CREATE TABLE issues (line INTEGER, severity TEXT, coordinate_key TEXT, message TEXT);
+"""
+
+MISSING_FROM = (
+    "INSERT INTO issues SELECT {line}, ?, a.coordinate_key, ? || a.coordinate_key "
+    "FROM entries a WHERE {where} AND NOT EXISTS (SELECT 1 FROM entries b "
+    "WHERE b.section = ? AND b.coordinate_key = a.coordinate_key){group}"
+)
+CROSS_CHECKS = [
+    (
+        MISSING_FROM.format(line="a.line", where="a.section = ?", group=""),
+        (
+            ERROR,
+            str(CoordinateResolutionException.layer_resolution_failed(2, "")),
+            LAYER1,
+            LAYER2,
+        ),
+    ),
+    (
+        MISSING_FROM.format(line="a.line", where="a.section = ?", group=""),
+        (WARNING, "No layer 3 mask (resolves with mask 0) for coordinate: ", LAYER1, LAYER3),
+    ),
+    (
+        MISSING_FROM.format(line="a.line", where="a.section = ?", group=""),
+        (WARNING, "No projection for coordinate: ", LAYER1, PROJECTIONS),
+    ),
+    (
+        MISSING_FROM.format(
+            line="MIN(a.line)", where="a.section != ?", group=" GROUP BY a.coordinate_key"
+        ),
+        (WARNING, "No layer 1 entry for coordinate: ", LAYER1, LAYER1),
+    ),
+    (
+        "INSERT INTO issues SELECT MAX(line), ?, coordinate_key, ? || coordinate_key "
+        "FROM entries GROUP BY section, coordinate_key HAVING COUNT(*) > 1",
+        (ERROR, "Duplicate key: "),
+    ),
+]
+
+
+@dataclass
+class ValidationReport:
+    path: str
+    coordinates: int = 0
+    entries: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    warnings: int = 0
+    issues: List[Issue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.errors == 0
+
+    def format(self) -> Iterator[str]:
+        for line, severity, _, message in self.issues:
+            yield f"{self.path}:{line}: {severity}: {message}"
+
+
+def iter_entries(stream: Any) -> Iterator[Tuple[str, Entry]]:
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()
+        if not loader.check_event(yaml.DocumentStartEvent):
+            return
+        loader.get_event()
+        if not loader.check_event(MappingStartEvent):
+            return
+        loader.get_event()
+
+        while not loader.check_event(MappingEndEvent):
+            name = loader.get_event()
+            section = name.value if isinstance(name, ScalarEvent) else None
+            if section not in SECTIONS or not loader.check_event(MappingStartEvent):
+                loader.compose_node(None, None)
+                continue
+
+            loader.get_event()
+            for entry in _iter_mapping(loader, 0):
+                yield section, entry
+            loader.get_event()
+    finally:
+        loader.dispose()
+
+
+def scan_fragments(path: str, chunk_size: int) -> Optional[List[Fragment]]:
+    fragments: List[Fragment] = []
+    section: Optional[str] = None
+    indent: Optional[int] = None
+    start = first_line = count = offset = 0
+
+    def close(end: int) -> None:
+        if section is not None and count:
+            fragments.append((section, start, end - start, first_line))
+
+    with open(path, "rb") as f:
+        for number, line in enumerate(f, 1):
+            stripped = line.strip()
+            if stripped and not stripped.startswith(b"#"):
+                if ANCHOR_PATTERN.search(line):
+                    return None
+
+                if not line[:1].isspace():
+                    close(offset)
+                    name, colon, rest = stripped.partition(b":")
+                    if not colon or stripped[:1] in b"-?{[%&*!|>'\"":
+                        return None
+                    if rest.strip() and name.decode() in SECTIONS:
+                        return None
+                    section = name.decode() if name.decode() in SECTIONS else None
+                    indent, count = None, 0
+                elif section is not None:
+                    width = len(line) - len(line.lstrip(b" "))
+                    if indent is None:
+                        indent = width
+                    if width < indent or (width == indent and stripped[:1] in b"-?"):
+                        return None
+                    if width == indent:
+                        if count >= chunk_size:
+                            close(offset)
+                            count = 0
+                        if count == 0:
+                            start, first_line = offset, number
+                        count += 1
+            offset += len(line)
+        close(offset)
+    return fragments
+
+
+def check_fragment(
+    path: str, section: str, offset: int, length: int, first_line: int
+) -> Tuple[List[Issue], List[Fact]]:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(length)
+
+    entries: List[Entry] = []
+    yaml_issues: List[Issue] = []
+    loader = yaml.SafeLoader(data)
+    try:
+        loader.get_event()
+        loader.get_event()
+        if loader.check_event(MappingStartEvent):
+            loader.get_event()
+            for entry in _iter_mapping(loader, first_line - 1):
+                entries.append(entry)
+    except yaml.MarkedYAMLError as e:
+        yaml_issues.append(_yaml_issue(e, first_line - 1))
+    finally:
+        loader.dispose()
+
+    issues, facts = check_chunk(section, entries)
+    return yaml_issues + issues, facts
+
+
+def check_chunk(section: str, entries: List[Entry]) -> Tuple[List[Issue], List[Fact]]:
+    issues: List[Issue] = []
+    facts: List[Fact] = []
+    for coordinate_key, value, line in entries:
+        address = None
+        if section == LAYER1:
+            message = _check_glossary(coordinate_key, value)
+        elif section == LAYER2:
+            message = _check_address(value)
+            if message is None:
+                address = value
+        elif section == LAYER3:
+            message = _check_mask(value)
+        else:
+            message = None if isinstance(value, dict) else "Projection must be a mapping"
+
+        if message is not None:
+            issues.append((line, ERROR, coordinate_key, message))
+        facts.append((section, coordinate_key, line, address))
+    return issues, facts
+
+
+def validate_registry(
+    path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 5_000,
+    max_issues: int = 1_000,
+    work_dir: Optional[str] = None,
+) -> ValidationReport:
+    report = ValidationReport(path)
+    handle, db_path = tempfile.mkstemp(suffix=".sqlite", dir=work_dir)
+    os.close(handle)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        conn.execute("BEGIN")
+
+        def record(result: Tuple[List[Issue], List[Fact]]) -> None:
+            issues, facts = result
+            conn.executemany("INSERT INTO issues VALUES (?, ?, ?, ?)", issues)
+            conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", facts)
+
+        fragments = scan_fragments(path, chunk_size)
+        if fragments is not None:
+            _run(((check_fragment, (path, *fragment)) for fragment in fragments), workers, record)
+        else:
+            with open(path, "rb") as stream:
+                chunks = _chunks(iter_entries(stream), chunk_size)
+                try:
+                    _run(((check_chunk, chunk) for chunk in chunks), workers, record)
+                except yaml.MarkedYAMLError as e:
+                    conn.execute("INSERT INTO issues VALUES (?, ?, ?, ?)", _yaml_issue(e, 0))
+
+        conn.execute("CREATE INDEX idx_entries ON entries (section, coordinate_key)")
+        for sql, params in CROSS_CHECKS:
+            conn.execute(sql, params)
+        conn.executemany(
+            "INSERT INTO issues VALUES (?, ?, ?, ?)",
+            [
+                (
+                    line,
+                    ERROR,
+                    address,
+                    str(
+                        CoordinateResolutionException.duplicate_address(
+                            address, keys.split("\0")
+                        )
+                    ),
+                )
+                for line, address, keys in conn.execute(
+                    "SELECT MAX(line), address, GROUP_CONCAT(coordinate_key, char(0)) "
+                    "FROM entries WHERE section = ? AND address IS NOT NULL "
+                    "GROUP BY address HAVING COUNT(*) > 1",
+                    (LAYER2,),
+                )
+            ],
+        )
+        conn.execute("COMMIT")
+
+        report.entries = dict(
+            conn.execute("SELECT section, COUNT(*) FROM entries GROUP BY section")
+        )
+        report.coordinates = conn.execute(
+            "SELECT COUNT(DISTINCT coordinate_key) FROM entries"
+        ).fetchone()[0]
+        for severity, count in conn.execute(
+            "SELECT severity, COUNT(*) FROM issues GROUP BY severity"
+        ):
+            setattr(report, f"{severity}s", count)
+        report.issues = list(
+            conn.execute(
+                "SELECT line, severity, coordinate_key, message FROM issues "
+                "ORDER BY line, severity LIMIT ?",
+                (max_issues,),
+            )
+        )
+    finally:
+        conn.close()
+        os.unlink(db_path)
+    return report
+
+
+def _chunks(
+    entries: Iterator[Tuple[str, Entry]], chunk_size: int
+) -> Iterator[Tuple[str, List[Entry]]]:
+    section, chunk = None, []
+    for entry_section, entry in entries:
+        if chunk and (entry_section != section or len(chunk) >= chunk_size):
+            yield section, chunk
+            chunk = []
+        section = entry_section
+        chunk.append(entry)
+    if chunk:
+        yield section, chunk
+
+
+def _run(
+    tasks: Iterator[Tuple[Callable[..., Any], Tuple[Any, ...]]],
+    workers: Optional[int],
+    record: Callable[[Tuple[List[Issue], List[Fact]]], None],
+) -> None:
+    if workers == 0:
+        for fn, args in tasks:
+            record(fn(*args))
+        return
+
+    workers = workers or os.cpu_count() or 1
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(workers) as pool:
+        for fn, args in tasks:
+            pending.append(pool.submit(fn, *args))
+            if len(pending) >= workers * 2:
+                record(pending.popleft().result())
+        while pending:
+            record(pending.popleft().result())
+
+
+def _iter_mapping(loader: yaml.SafeLoader, line_offset: int) -> Iterator[Entry]:
+    while not loader.check_event(MappingEndEvent):
+        key_node = loader.compose_node(None, None)
+        value_node = loader.compose_node(None, None)
+        yield (
+            str(loader.construct_document(key_node)),
+            loader.construct_document(value_node),
+            key_node.start_mark.line + 1 + line_offset,
+        )
+
+
+def _yaml_issue(error: yaml.MarkedYAMLError, line_offset: int) -> Issue:
+    mark = error.problem_mark or error.context_mark
+    line = mark.line + 1 + line_offset if mark else line_offset
+    return (line, ERROR, "", f"YAML error: {error.problem}")
+
+
+def _check_glossary(coordinate_key: str, glossary: Any) -> Optional[str]:
+    if not isinstance(glossary, dict):
+        return "Glossary must be a mapping"
+    try:
+        CoordinateData(
+            coordinate_key=coordinate_key,
+            label=glossary.get("label", ""),
+            description=glossary.get("description"),
+            seo_keywords=glossary.get("seo_keywords"),
+            schema_type=glossary.get("schema_type"),
+            coordinate_address="0000.0000@",
+            bitmask_policy=0,
+            version=1,
+            is_active=True,
+        )
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+    return None
+
+
+def _check_address(address: Any) -> Optional[str]:
+    try:
+        decode_address(address if isinstance(address, str) else repr(address))
+    except CoordinateResolutionException as e:
+        return str(e)
+    return None
+
+
+def _check_mask(mask: Any) -> Optional[str]:
+    if not isinstance(mask, int) or isinstance(mask, bool):
+        return f"Invalid mask value: {mask!r}. Mask must be an integer."
+    try:
+        validate_mask(mask)
+    except InvalidBitmaskException as e:
+        return str(e)
+    return None
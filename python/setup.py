@@ -15,10 +15,20 @@ setup(
         "pydantic==2.5.0",
         "python-dotenv==1.0.0",
         "pyyaml==6.0.1",
+        "numpy==1.26.2",
         "pytest==7.4.3",
         "pytest-cov==4.1.0",
         "pytest-flask==1.3.0",
     ],
+    entry_points={
+        "console_scripts": [
+            "clc-serve=clc.tools.serve:main",
+            "clc-registry=clc.tools.registry:main",
+            "clc-flags=clc.tools.flags:main",
+            "clc-logs=clc.tools.logs:main",
+            "clc-loadtest=clc.tools.loadtest:main",
+        ],
+    },
     extras_require={
         "dev": [
             "black==23.12.0",
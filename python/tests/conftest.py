@@ -0,0 +1,60 @@
+import pytest
+import yaml
+
+
+REGISTRY_DATA = {
+    "layer1_human_map": {
+        "COORD_X101": {
+            "label": "User_Profile_Name",
+            "description": "Display name for the user profile",
+            "seo_keywords": ["user", "profile", "name"],
+            "schema_type": "Person",
+        },
+        "COORD_X102": {
+            "label": "Dashboard_Stats",
+            "description": "Aggregated dashboard statistics",
+            "seo_keywords": ["dashboard", "stats"],
+            "schema_type": "Dataset",
+        },
+        "COORD_NAV_PROFILE": {
+            "label": "Navigation_Profile",
+            "description": "Profile navigation entry",
+            "seo_keywords": ["navigation", "profile"],
+            "schema_type": "SiteNavigationElement",
+        },
+    },
+    "layer2_coordinate_registry": {
+        "COORD_X101": "1010.0101@",
+        "COORD_X102": "1020.0202@",
+        "COORD_NAV_PROFILE": "2000.0000@",
+    },
+    "layer3_bitmask_core": {
+        "COORD_X101": 0x0001,
+        "COORD_X102": 0x0002,
+        "COORD_NAV_PROFILE": 0x0010,
+    },
+    "projections": {
+        "COORD_X101": {
+            "glossary": {"label": "User_Profile_Name", "schema": "Person"},
+            "private": {"name": "Jane Doe"},
+            "deception": {"name": "honeypot"},
+        },
+        "COORD_X102": {
+            "glossary": {"label": "Dashboard_Stats", "schema": "Dataset"},
+            "private": {"visits": 1024},
+            "deception": {"visits": 0},
+        },
+    },
+}
+
+
+@pytest.fixture
+def registry_data():
+    return yaml.safe_load(yaml.safe_dump(REGISTRY_DATA))
+
+
+@pytest.fixture
+def registry_path(tmp_path, registry_data):
+    path = tmp_path / "master_registry.yaml"
+    path.write_text(yaml.safe_dump(registry_data), encoding="utf-8")
+    return str(path)
@@ -0,0 +1,92 @@
+import pytest
+
+from clc.app import create_app
+from clc.enums import AdmissionDecision, CallerType
+from clc.services.admission_controller import AdmissionController
+
+
+class TestAdmissionController:
+    @pytest.fixture
+    def controller(self):
+        return AdmissionController(
+            max_in_flight=4, reserved_in_flight=2, max_queue_latency_ms=100.0
+        )
+
+    def test_admits_under_limits(self, controller):
+        assert controller.admit(CallerType.ATTACKER.value) is AdmissionDecision.ADMIT
+        assert controller.admit(CallerType.BOT.value) is AdmissionDecision.ADMIT
+        assert controller.in_flight == 2
+
+    def test_reserved_capacity_serves_attackers_statically(self, controller):
+        controller.admit(CallerType.BOT.value)
+        controller.admit(CallerType.AUTHENTICATED.value)
+
+        assert controller.admit(CallerType.ATTACKER.value) is AdmissionDecision.STATIC
+        assert controller.admit(CallerType.BOT.value) is AdmissionDecision.ADMIT
+        assert controller.admit(CallerType.AUTHENTICATED.value) is AdmissionDecision.ADMIT
+
+    def test_sheds_everyone_at_hard_limit(self, controller):
+        for _ in range(4):
+            controller.admit(CallerType.AUTHENTICATED.value)
+
+        assert controller.admit(CallerType.ATTACKER.value) is AdmissionDecision.SHED
+        assert controller.admit(CallerType.BOT.value) is AdmissionDecision.SHED
+
+        controller.release()
+        assert controller.admit(CallerType.BOT.value) is AdmissionDecision.ADMIT
+
+    def test_queue_latency_diverts_only_attackers(self):
+        controller = AdmissionController(max_queue_latency_ms=100.0, latency_smoothing=1.0)
+
+        assert controller.admit(CallerType.ATTACKER.value, 500.0) is AdmissionDecision.STATIC
+        assert controller.admit(CallerType.BOT.value, 500.0) is AdmissionDecision.ADMIT
+
+    def test_stats_counts_decisions(self, controller):
+        controller.admit(CallerType.BOT.value)
+        controller.admit(CallerType.AUTHENTICATED.value)
+        controller.admit(CallerType.ATTACKER.value)
+
+        stats = controller.stats()
+        assert stats["admit"]["bot"] == 1
+        assert stats["static"]["attacker"] == 1
+        assert stats["in_flight"] == 2
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("t=999.9", 100.0),
+            ("999900", 100.0),
+            ("999900000", 100.0),
+            (None, 0.0),
+            ("garbage", 0.0),
+        ],
+    )
+    def test_queue_latency_from_header(self, header, expected):
+        latency = AdmissionController.queue_latency_from_header(header, now=1000.0)
+        assert latency == pytest.approx(expected, abs=1e-3)
+
+
+class TestSyncAdmission:
+    def test_attacker_gets_static_deception_under_load(self, registry_data, monkeypatch):
+        monkeypatch.setenv("CLC_ADMISSION_MAX_QUEUE_MS", "0")
+        client = create_app(registry_data=registry_data).test_client()
+
+        response = client.post(
+            "/api/sync",
+            json={"target": "COORD_X101"},
+            headers={"X-Request-Start": "t=1"},
+        )
+        assert response.status_code == 200
+        assert response.json["data"]["data"] == {"error": "INVALID_COORDINATE"}
+
+        bot = client.post(
+            "/api/sync",
+            json={"target": "COORD_X101"},
+            headers={"User-Agent": "Googlebot/2.1", "X-Request-Start": "t=1"},
+        )
+        assert bot.json["data"]["type"] == "glossary"
+
+        stats = client.get("/api/admission").json
+        assert stats["static"]["attacker"] == 1
+        assert stats["admit"]["bot"] == 1
+        assert stats["in_flight"] == 0
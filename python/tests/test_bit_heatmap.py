@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from clc.app import create_app
+from clc.enums import BitPosition, CallerType
+from clc.exceptions import InvalidBitmaskException
+from clc.services.bit_heatmap import BitHeatmap, unpack_bits
+from clc.storage.flag_column import FlagColumnStore
+
+
+class TestBitHeatmap:
+    def test_unpack_bits_is_little_endian_per_position(self):
+        bits = unpack_bits(np.array([1, 1 << 63, 0b1010], dtype=np.uint64))
+
+        assert bits.shape == (3, 64)
+        assert bits[0].nonzero()[0].tolist() == [0]
+        assert bits[1].nonzero()[0].tolist() == [63]
+        assert bits[2].nonzero()[0].tolist() == [1, 3]
+
+    def test_counts_and_cooccurrence_match_naive(self):
+        rng = np.random.default_rng(3)
+        masks = rng.integers(0, 1 << 63, size=5000, dtype=np.uint64) | np.uint64(1 << 63)
+        heatmap = BitHeatmap()
+        heatmap.MATMUL_ROWS = 1024
+        heatmap.observe(masks, timestamp=0)
+
+        observations, counts, pairs = heatmap.snapshot(now=0)
+        expected = np.array(
+            [[int(m) >> bit & 1 for bit in range(64)] for m in masks], dtype=np.uint64
+        )
+
+        assert observations == 5000
+        assert counts.tolist() == expected.sum(axis=0).tolist()
+        assert pairs.tolist() == (expected.T @ expected).tolist()
+
+    def test_windows_expire_old_buckets(self):
+        heatmap = BitHeatmap(bucket_seconds=10, buckets=6)
+        heatmap.observe([BitPosition.IS_ACTIVE.mask()], timestamp=5)
+        heatmap.observe([BitPosition.IS_VIP.mask()] * 2, timestamp=35)
+
+        assert heatmap.snapshot(now=39)[0] == 3
+        assert heatmap.snapshot(window_seconds=10, now=39)[0] == 2
+        assert heatmap.snapshot(now=65)[0] == 2
+
+        heatmap.observe([BitPosition.IS_BANNED.mask()], timestamp=65)
+        observations, counts, _ = heatmap.snapshot(now=65)
+        assert observations == 3
+        assert counts[BitPosition.IS_ACTIVE] == 0
+
+    def test_recorded_masks_are_buffered_until_snapshot(self):
+        heatmap = BitHeatmap(buffer_size=100)
+        for _ in range(3):
+            heatmap.record(CallerType.BOT.value, timestamp=0)
+
+        report = heatmap.report(now=0)
+        assert report["observations"] == 3
+        assert report["bits"]["CAN_READ"] == {"count": 3, "rate": 1.0}
+        assert "IS_ACTIVE" in report["dead"]
+
+    def test_report_lists_hottest_pairs(self):
+        heatmap = BitHeatmap()
+        vip_active = BitPosition.IS_VIP.mask() | BitPosition.IS_ACTIVE.mask()
+        heatmap.observe([vip_active] * 4 + [BitPosition.IS_VIP.mask()], timestamp=0)
+
+        pairs = heatmap.report(now=0)["top_pairs"]
+        assert pairs == [{"bits": ["IS_ACTIVE", "IS_VIP"], "count": 4}]
+
+    def test_observes_flag_column_chunks(self, tmp_path):
+        store = FlagColumnStore(str(tmp_path))
+        store.append(np.arange(10), np.full(10, BitPosition.IS_ACTIVE.mask()))
+        heatmap = BitHeatmap()
+        for _, flags in store.iter_chunks(chunk_rows=4):
+            heatmap.observe(flags, timestamp=0)
+
+        assert heatmap.snapshot(now=0)[1][BitPosition.IS_ACTIVE] == 10
+
+    def test_rejects_out_of_range_masks(self):
+        with pytest.raises(InvalidBitmaskException):
+            BitHeatmap().record(-1)
+        with pytest.raises(InvalidBitmaskException):
+            BitHeatmap().observe([1 << 64])
+
+
+def test_sync_feeds_caller_heatmap(registry_data):
+    client = create_app(registry_data=registry_data).test_client()
+    client.post(
+        "/api/sync",
+        json={"target": "COORD_X101"},
+        headers={"User-Agent": "Googlebot/2.1"},
+    )
+
+    report = client.get("/api/heatmap").get_json()
+    assert report["observations"] == 1
+    assert report["bits"]["BOT"]["count"] == 1
+    assert report["dead"] == ["AUTHENTICATED", "ATTACKER"]
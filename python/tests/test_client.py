@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from clc.app import create_app
+from clc.client import AsyncTunnelClient, TunnelClient
+from clc.exceptions import TunnelClientException
+
+BOT = "Googlebot/2.1"
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, app):
+        self.client = app.test_client()
+        self.batches = []
+        super().__init__(("127.0.0.1", 0), KeepAliveHandler)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.batches.append(self.path)
+        response = self.server.client.post(self.path, data=body, headers=dict(self.headers))
+
+        self.send_response(response.status_code)
+        for name, value in response.headers.items():
+            if name.lower() not in ("connection", "content-length"):
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.data)))
+        self.end_headers()
+        self.wfile.write(response.data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(registry_data):
+    httpd = StandInServer(create_app(registry_data=registry_data))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+class TestTunnelClient:
+    def test_sync_returns_projection(self, server):
+        _, url = server
+        with TunnelClient(url, user_agent=BOT) as client:
+            projection = client.sync("COORD_X101")
+            assert projection["type"] == "glossary"
+            assert projection["data"]["label"] == "User_Profile_Name"
+            assert client.sync("COORD_MISSING") is None
+
+    def test_concurrent_lookups_are_coalesced(self, server):
+        httpd, url = server
+        targets = ["COORD_X101", "COORD_X102", "COORD_NAV_PROFILE"] * 4
+        with TunnelClient(url, user_agent=BOT, batch_window=0.05) as client:
+            results = [None] * len(targets)
+
+            def lookup(i):
+                results[i] = client.sync(targets[i])
+
+            threads = [
+                threading.Thread(target=lookup, args=(i,)) for i in range(len(targets))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(httpd.batches) == 1
+            assert results[0] == results[3]
+            assert results[1]["data"]["label"] == "Dashboard_Stats"
+
+    def test_connections_are_reused(self, server):
+        _, url = server
+        with TunnelClient(url, auth_token="Bearer abcdef", batch_window=0) as client:
+            for target in ("COORD_X101", "COORD_X102", "COORD_X101", "COORD_X102"):
+                client.sync(target)
+            assert client.stats()["requests"] == 4
+            assert client.stats()["connections_opened"] == 1
+
+    def test_private_projections_are_revalidated_by_etag(self, server):
+        _, url = server
+        with TunnelClient(url, auth_token="Bearer abcdef", batch_window=0) as client:
+            first = client.sync("COORD_X101")
+            second = client.sync("COORD_X101")
+
+            assert first == second
+            assert first["type"] == "private"
+            stats = client.stats()
+            assert stats["requests"] == 2
+            assert stats["revalidations"] == 1
+            assert stats["registry_version"]
+
+    def test_public_projections_are_served_from_cache(self, server):
+        httpd, url = server
+        with TunnelClient(url, user_agent=BOT, batch_window=0) as client:
+            client.sync("COORD_X101")
+            client.sync("COORD_X101")
+
+            assert len(httpd.batches) == 1
+            assert client.stats()["cache_hits"] == 1
+
+    def test_registry_version_change_clears_cache(self, server):
+        _, url = server
+        with TunnelClient(url, user_agent=BOT, batch_window=0) as client:
+            client.sync("COORD_X101")
+            client.cache.observe_version("older-registry")
+            assert len(client.cache) == 0
+
+    def test_unreachable_server_raises(self):
+        with TunnelClient("http://127.0.0.1:9", timeout=0.5, batch_window=0) as client:
+            with pytest.raises(TunnelClientException):
+                client.sync("COORD_X101")
+
+
+def test_async_client_batches_gathered_lookups(server):
+    httpd, url = server
+
+    async def main():
+        async with AsyncTunnelClient(url, user_agent=BOT, batch_window=0.05) as client:
+            results = await client.sync_many(["COORD_X101", "COORD_X102", "COORD_MISSING"])
+            return results, client.stats()
+
+    results, stats = asyncio.run(main())
+    assert results["COORD_X102"]["data"]["label"] == "Dashboard_Stats"
+    assert results["COORD_MISSING"] is None
+    assert stats["requests"] == 1
+    assert len(httpd.batches) == 1
+
+
+def test_batch_endpoint_honours_known_etags(registry_data):
+    client = create_app(registry_data=registry_data).test_client()
+    headers = {"User-Agent": BOT}
+    first = client.post(
+        "/api/sync/batch", json={"targets": ["COORD_X101", "COORD_MISSING"]}, headers=headers
+    ).get_json()
+    etag = first["results"]["COORD_X101"]["etag"]
+
+    assert first["max_age"] == 300
+    assert first["results"]["COORD_MISSING"] == {"status": 404, "data": None}
+
+    second = client.post(
+        "/api/sync/batch",
+        json={"targets": ["COORD_X101", "COORD_X102"], "etags": {"COORD_X101": etag}},
+        headers=headers,
+    ).get_json()
+    assert second["results"]["COORD_X101"] == {"status": 304, "etag": etag}
+    assert second["results"]["COORD_X102"]["status"] == 200
+
+    invalid = client.post("/api/sync/batch", json={"targets": []}, headers=headers)
+    assert invalid.status_code == 400
@@ -0,0 +1,79 @@
+from clc.app import create_app, load_registry
+from clc.services.coordinate_resolver import CoordinateResolver
+from clc.storage.compact_registry import CompactRegistry, GlossaryRecord
+
+
+class TestCompactRegistry:
+    def test_sections_round_trip(self, registry_data):
+        registry_data["metadata"] = {"version": "1.0"}
+        registry = CompactRegistry.from_registry(registry_data)
+
+        for section in (
+            "layer1_human_map",
+            "layer2_coordinate_registry",
+            "layer3_bitmask_core",
+            "projections",
+        ):
+            assert dict(registry[section]) == registry_data[section]
+            assert len(registry[section]) == len(registry_data[section])
+        assert registry["metadata"] == {"version": "1.0"}
+        assert "COORD_NAV_PROFILE" not in registry["projections"]
+        assert registry["layer1_human_map"].get("COORD_MISSING") is None
+
+    def test_repeated_strings_are_shared(self, registry_data):
+        for glossary in registry_data["layer1_human_map"].values():
+            glossary["schema_type"] = "".join(["Per", "son"])
+        registry = CompactRegistry.from_registry(registry_data)
+
+        first, second = registry.glossaries[0], registry.glossaries[1]
+        assert isinstance(first, GlossaryRecord)
+        assert first.schema_type is second.schema_type
+        assert not hasattr(first, "__dict__")
+        assert registry.masks.typecode == "Q"
+
+    def test_unpackable_addresses_are_kept_verbatim(self):
+        registry = CompactRegistry.from_registry(
+            {
+                "layer1_human_map": {"A": {"label": "A"}, "B": {"label": "B"}},
+                "layer2_coordinate_registry": {"A": "ffff.0001@", "B": "1010-bad"},
+            }
+        )
+
+        assert registry["layer2_coordinate_registry"]["A"] == "ffff.0001@"
+        assert registry["layer2_coordinate_registry"]["B"] == "1010-bad"
+        assert "A" not in registry["layer3_bitmask_core"]
+        assert registry["layer1_human_map"]["A"] == {"label": "A"}
+
+    def test_resolver_matches_in_memory_registry(self, registry_data):
+        compact = CoordinateResolver(CompactRegistry.from_registry(registry_data))
+        in_memory = CoordinateResolver(registry_data)
+
+        for coordinate_key in registry_data["layer1_human_map"]:
+            assert compact.resolve(coordinate_key) == in_memory.resolve(coordinate_key)
+            assert compact.resolve_glossary(coordinate_key) == in_memory.resolve_glossary(
+                coordinate_key
+            )
+            assert compact.resolve_address(coordinate_key) == in_memory.resolve_address(
+                coordinate_key
+            )
+        assert compact.search("profile") == in_memory.search("profile")
+        assert compact.find_by_atom(all_of=1) == in_memory.find_by_atom(all_of=1)
+        assert compact.lookup("COORD_MISSING") is None
+        assert compact.membership_stats()["rejected"] == 1
+
+    def test_app_loads_compact_registry(self, registry_path, monkeypatch):
+        monkeypatch.setenv("CLC_REGISTRY_COMPACT", "1")
+        registry = load_registry(registry_path)
+        assert isinstance(registry, CompactRegistry)
+
+        client = create_app(registry_data=registry).test_client()
+        response = client.post(
+            "/api/sync",
+            json={"target": "COORD_X102"},
+            headers={"User-Agent": "Googlebot/2.1"},
+        )
+        assert response.status_code == 200
+        assert response.get_json()["data"]["data"] == {
+            "label": "Dashboard_Stats",
+            "schema": "Dataset",
+        }
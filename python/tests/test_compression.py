@@ -0,0 +1,127 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+from clc.app import create_app
+from clc.services.compression import CompressedSegment, VariantCache, negotiate
+
+BOT = {"User-Agent": "Googlebot/2.1"}
+DECOMPRESSORS = [("gzip", gzip.decompress), ("deflate", zlib.decompress)]
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "gzip"),
+        ("deflate;q=0.9, gzip;q=0.5", "deflate"),
+        ("br, identity", None),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("", None),
+    ],
+)
+def test_negotiate(header, expected):
+    assert negotiate(header) == expected
+
+
+@pytest.mark.parametrize("encoding, decompress", DECOMPRESSORS)
+def test_segment_finishes_into_valid_stream(encoding, decompress):
+    static = b'{"data":' + b'"glossary",' * 500 + b'"request_id":"'
+    segment = CompressedSegment.compress(static, encoding)
+
+    for tail in (b'abc","status":200}\n', b'ffff-0000","status":200}\n'):
+        assert decompress(segment.finish(tail)) == static + tail
+
+
+def test_variant_cache_builds_once_and_respects_threshold():
+    cache = VariantCache(min_size=64)
+    builds = []
+
+    def build(size):
+        def inner():
+            builds.append(size)
+            return b"x" * size
+
+        return inner
+
+    first = cache.get("large", "gzip", build(1000))
+    assert cache.get("large", "gzip", build(1000)) is first
+    assert cache.get("small", "gzip", build(10)) is None
+    assert cache.get("small", "gzip", build(10)) is None
+    assert builds == [1000, 10]
+
+    cache.record(1000, len(first.data))
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["below_threshold"] == 1
+    assert stats["raw_bytes"] == 1000
+    assert stats["cache_bytes"] == len(first.data)
+    assert 0 < stats["compression_ratio"] < 0.1
+    assert stats["bytes_saved"] == 1000 - len(first.data)
+
+
+class TestCompressedSync:
+    @pytest.fixture
+    def client(self, registry_data, monkeypatch):
+        monkeypatch.setenv("CLC_COMPRESS_MIN_SIZE", "0")
+        registry_data["projections"]["COORD_X101"]["glossary"]["description"] = "word " * 200
+        return create_app(registry_data=registry_data).test_client()
+
+    def sync(self, client, headers):
+        return client.post("/api/sync", json={"target": "COORD_X101"}, headers=headers)
+
+    @pytest.mark.parametrize("encoding, decompress", DECOMPRESSORS)
+    def test_negotiated_variant_matches_identity(self, client, encoding, decompress):
+        plain = self.sync(client, BOT)
+        compressed = self.sync(client, {**BOT, "Accept-Encoding": encoding})
+
+        assert compressed.headers["Content-Encoding"] == encoding
+        assert len(compressed.data) < len(plain.data)
+        body = json.loads(decompress(compressed.data))
+        expected = plain.get_json()
+        assert body["data"] == expected["data"]
+        assert body["status"] == 200
+        assert body["request_id"] != expected["request_id"]
+        assert compressed.headers["ETag"] == plain.headers["ETag"][:-1] + f'-{encoding}"'
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+
+    def test_variant_is_compressed_once_and_reported(self, client):
+        etag = None
+        for _ in range(3):
+            response = self.sync(client, {**BOT, "Accept-Encoding": "gzip"})
+            etag = response.headers["ETag"]
+
+        stats = client.get("/api/compression").get_json()
+        assert stats["entries"] == 1
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["bytes_saved"] > 0
+
+        not_modified = self.sync(
+            client, {**BOT, "Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        assert not_modified.status_code == 304
+
+    def test_uncompressed_body_has_no_encoding_suffix(self, registry_data, monkeypatch):
+        monkeypatch.setenv("CLC_COMPRESS_MIN_SIZE", "1000000")
+        client = create_app(registry_data=registry_data).test_client()
+        plain = self.sync(client, BOT)
+        response = self.sync(client, {**BOT, "Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["ETag"] == plain.headers["ETag"]
+        assert response.headers["ETag"].startswith('W/"')
+        assert not response.headers["ETag"].endswith('-gzip"')
+
+        conditional = {"Accept-Encoding": "gzip", "If-None-Match": plain.headers["ETag"]}
+        not_modified = self.sync(client, {**BOT, **conditional})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == plain.headers["ETag"]
+
+    def test_compression_can_be_disabled(self, registry_data, monkeypatch):
+        monkeypatch.setenv("CLC_COMPRESSION", "false")
+        client = create_app(registry_data=registry_data).test_client()
+        response = self.sync(client, {**BOT, "Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
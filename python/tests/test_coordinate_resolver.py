@@ -0,0 +1,314 @@
+import gc
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from clc.app import create_app
+from clc.enums import SubtypeBit, TypeBit
+from clc.exceptions import CoordinateResolutionException
+from clc.services.bloom_filter import BloomFilter
+from clc.services.coordinate_resolver import CoordinateResolver, decode_address
+from clc.services.keyword_index import MAX_PREFIX_EXPANSION, KeywordIndex, tokenize
+from clc.services.sqlite_resolver import SQLiteCoordinateResolver
+from clc.storage.sqlite_registry import ConnectionPool, import_registry
+
+
+@pytest.fixture(params=["yaml", "sqlite"])
+def make_resolver(request, tmp_path):
+    resolvers = []
+
+    def make(registry_data):
+        if request.param == "yaml":
+            return CoordinateResolver(registry_data)
+
+        path = str(tmp_path / f"registry-{len(resolvers)}.db")
+        import_registry(registry_data, path)
+        resolvers.append(SQLiteCoordinateResolver(path))
+        return resolvers[-1]
+
+    yield make
+    for resolver in resolvers:
+        resolver.close()
+
+
+@pytest.fixture
+def resolver(make_resolver, registry_data):
+    registry_data["layer1_human_map"]["COORD_VAULT"] = {"label": "Vault"}
+    registry_data["layer2_coordinate_registry"].update(
+        {
+            "COORD_VAULT": "6000.c000@",
+            "COORD_JOB": "4000.9000@",
+            "COORD_BROKEN": "zz00.0000@",
+        }
+    )
+    return make_resolver(registry_data)
+
+
+class TestCoordinateResolver:
+    def test_resolve_decodes_type_and_subtype(self, resolver):
+        data = resolver.resolve("COORD_VAULT")
+
+        assert data.coordinate_address == "6000.c000@"
+        assert data.type_bits == TypeBit.SECRET | TypeBit.ACTIVE
+        assert data.subtype_bits == SubtypeBit.TRANSFORMED | SubtypeBit.HYDRATED
+
+    def test_resolve_layers(self, resolver):
+        data = resolver.resolve("COORD_X101")
+        assert (data.label, data.bitmask_policy, data.version, data.is_active) == (
+            "User_Profile_Name",
+            0x0001,
+            1,
+            True,
+        )
+        assert resolver.resolve_mask("COORD_X102") == 0x0002
+        assert resolver.resolve_address("COORD_JOB") == "4000.9000@"
+        assert resolver.resolve_glossary("COORD_VAULT") == {
+            "label": "Vault",
+            "description": None,
+            "seo_keywords": None,
+            "schema_type": None,
+        }
+        assert resolver.resolve_glossary("COORD_X102")["seo_keywords"] == [
+            "dashboard",
+            "stats",
+        ]
+        assert resolver.exists("COORD_VAULT")
+        assert not resolver.exists("COORD_JOB")
+
+    @pytest.mark.parametrize(
+        "method", ["resolve", "resolve_mask", "resolve_glossary", "resolve_address"]
+    )
+    def test_lookups_reject_unknown_coordinates(self, resolver, method):
+        with pytest.raises(CoordinateResolutionException, match="not found"):
+            getattr(resolver, method)("COORD_MISSING")
+
+    def test_resolve_requires_layer2_address(self, make_resolver, registry_data):
+        del registry_data["layer2_coordinate_registry"]["COORD_X101"]
+        resolver = make_resolver(registry_data)
+
+        with pytest.raises(CoordinateResolutionException, match="Layer 2"):
+            resolver.resolve("COORD_X101")
+
+    def test_resolve_unknown_coordinate(self, resolver):
+        with pytest.raises(CoordinateResolutionException):
+            resolver.resolve("COORD_MISSING")
+
+    @pytest.mark.parametrize(
+        "address, atom",
+        [("1010.0101@", 0x01), ("2000.0000@", 0x02), ("f000.a000@", 0xAF)],
+    )
+    def test_decode_address(self, address, atom):
+        assert decode_address(address) == atom
+
+    @pytest.mark.parametrize("address", ["1010.0101", "1010-0101@", "ABCD.0101@"])
+    def test_decode_rejects_malformed_addresses(self, address):
+        with pytest.raises(CoordinateResolutionException):
+            decode_address(address)
+
+
+class TestAddressIndex:
+    def test_find_by_type_and_subtype_bits(self, resolver):
+        secret_active = TypeBit.SECRET | TypeBit.ACTIVE
+
+        assert resolver.find_by_atom(all_of=secret_active) == ["COORD_VAULT"]
+        assert sorted(resolver.find_by_atom(all_of=SubtypeBit.HYDRATED)) == [
+            "COORD_JOB",
+            "COORD_VAULT",
+        ]
+        assert resolver.find_by_atom(
+            all_of=SubtypeBit.HYDRATED, none_of=TypeBit.SECRET
+        ) == ["COORD_JOB"]
+        assert sorted(resolver.find_by_atom(any_of=TypeBit.STRING)) == [
+            "COORD_X101",
+            "COORD_X102",
+        ]
+
+    def test_resolve_atom(self, resolver):
+        assert resolver.resolve_atom("COORD_X101") == (TypeBit.STRING, SubtypeBit(0))
+
+        with pytest.raises(CoordinateResolutionException):
+            resolver.resolve_atom("COORD_BROKEN")
+        with pytest.raises(CoordinateResolutionException):
+            resolver.resolve_atom("COORD_MISSING")
+
+    def test_invalid_addresses_are_kept_out_of_buckets(self, resolver):
+        assert resolver.address_index.invalid == ["COORD_BROKEN"]
+        assert "COORD_BROKEN" not in resolver.find_by_atom()
+
+    def test_duplicate_addresses_are_detected(self, make_resolver, registry_data):
+        make_resolver(registry_data).validate_unique_addresses()
+
+        registry_data["layer2_coordinate_registry"]["COORD_CLONE"] = "1010.0101@"
+        resolver = make_resolver(registry_data)
+
+        assert resolver.address_index.duplicates == {
+            "1010.0101@": ["COORD_X101", "COORD_CLONE"]
+        }
+        with pytest.raises(CoordinateResolutionException, match="COORD_CLONE"):
+            resolver.validate_unique_addresses()
+
+
+class TestKeywordIndex:
+    def test_tokenize(self):
+        assert tokenize("User_Profile-Name 2FA") == ["user", "profile", "name", "2fa"]
+
+    def test_ranks_keywords_above_labels_and_descriptions(self, resolver):
+        assert resolver.search("profile", prefix=False) == [
+            ("COORD_NAV_PROFILE", 6),
+            ("COORD_X101", 6),
+        ]
+        assert resolver.search("dashboard") == [("COORD_X102", 6)]
+        assert resolver.search("aggregated") == [("COORD_X102", 1)]
+
+    def test_prefix_matches_last_term_only(self, resolver):
+        assert [key for key, _ in resolver.search("navig")] == ["COORD_NAV_PROFILE"]
+        assert resolver.search("navig", prefix=False) == []
+        assert resolver.search("prof name") == []
+        assert resolver.search("profile nam") == [("COORD_X101", 12)]
+
+    def test_multi_term_queries_intersect(self, resolver):
+        assert resolver.search("profile navigation") == [("COORD_NAV_PROFILE", 12)]
+        assert resolver.search("dashboard navigation") == []
+
+    def test_unknown_terms_match_nothing(self, resolver):
+        assert resolver.search("foo profile") == []
+        assert resolver.search("foo baz profile") == []
+        assert resolver.search("profile foo", prefix=False) == []
+
+    def test_rankings_are_cached_for_indexed_tokens_only(self, resolver):
+        index = resolver.keyword_index
+        for i in range(100):
+            resolver.search(f"junk{i} profile", prefix=False)
+            index._ranking(f"junk{i}")
+        resolver.search("profile", prefix=False)
+
+        assert set(index._ranked) <= set(index.postings)
+        assert "profile" in index._ranked
+
+    def test_limit_and_empty_queries(self, resolver):
+        assert len(resolver.search("profile", limit=1)) == 1
+        assert resolver.search("") == []
+        assert resolver.search("   --- ") == []
+
+    def test_prefix_expansion_is_capped(self):
+        index = KeywordIndex(
+            {f"COORD_{i}": {"label": f"term{i:03d}"} for i in range(MAX_PREFIX_EXPANSION * 2)}
+        )
+        assert len(index.expand("term")) == MAX_PREFIX_EXPANSION
+        assert len(index.search("term", limit=1000)) == MAX_PREFIX_EXPANSION
+
+    def test_indexes_are_built_explicitly(self, registry_data):
+        resolver = CoordinateResolver(registry_data)
+        index = resolver.build_keyword_index()
+        bloom = resolver.build_membership_filter()
+
+        assert resolver.keyword_index is index
+        assert resolver.membership_filter is bloom
+        assert "COORD_X101" in bloom
+
+    def test_search_endpoint(self, registry_data):
+        client = create_app(registry_data=registry_data).test_client()
+
+        body = client.get("/api/search?q=dash").get_json()
+        assert body == {
+            "query": "dash",
+            "results": [{"coordinate_key": "COORD_X102", "score": 6}],
+        }
+
+        response = client.get("/api/search?q=foo baz profile")
+        assert response.status_code == 200
+        assert response.get_json()["results"] == []
+
+
+def test_sync_uses_sqlite_backend(registry_data, tmp_path, monkeypatch):
+    path = str(tmp_path / "registry.db")
+    import_registry(registry_data, path)
+    monkeypatch.setenv("CLC_REGISTRY_DB", path)
+
+    client = create_app(registry_data=registry_data).test_client()
+    headers = {"User-Agent": "Googlebot/2.1"}
+
+    response = client.post("/api/sync", json={"target": "COORD_X101"}, headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()["data"]["data"]["label"] == "User_Profile_Name"
+
+    response = client.post("/api/sync", json={"target": "COORD_NOPE"}, headers=headers)
+    assert response.status_code == 404
+
+
+def test_connection_pool_closes_connections_of_finished_threads(registry_data, tmp_path):
+    path = str(tmp_path / "registry.db")
+    import_registry(registry_data, path)
+    pool = ConnectionPool(path)
+    connections = []
+
+    def query():
+        connections.append(pool.connection())
+        pool.execute("SELECT 1").fetchone()
+
+    for _ in range(20):
+        thread = threading.Thread(target=query)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert len(pool) == 0
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    assert pool.execute("SELECT 1").fetchone()[0] == 1
+    assert len(pool) == 1
+    pool.close()
+    assert len(pool) == 0
+
+
+class TestMembershipFilter:
+    def test_bloom_filter_has_no_false_negatives(self):
+        keys = [f"COORD_{i}" for i in range(5000)]
+        bloom = BloomFilter.from_keys(keys, len(keys), 0.01)
+        bloom.add("COORD_LATE")
+
+        assert all(key in bloom for key in keys)
+        assert "COORD_LATE" in bloom
+        assert bloom.count == 5001
+
+        probes = sum(f"PROBE_{i}" in bloom for i in range(20000))
+        assert probes / 20000 < 0.03
+
+        unpacked = np.unpackbits(np.frombuffer(bytes(bloom._bits), dtype=np.uint8))
+        assert bloom.set_bits == int(unpacked.sum())
+
+    def test_bloom_filter_sizing(self):
+        stats = BloomFilter(capacity=1_000_000, false_positive_rate=0.01).stats()
+
+        assert stats["size_bits"] == 9_585_059
+        assert stats["hashes"] == 7
+        assert stats["estimated_false_positive_rate"] == 0.0
+
+        with pytest.raises(ValueError):
+            BloomFilter(10, false_positive_rate=1.5)
+
+    def test_lookup_rejects_misses_without_raising(self, resolver):
+        assert resolver.lookup("COORD_X101").label == "User_Profile_Name"
+        assert resolver.lookup("COORD_PROBE") is None
+        assert resolver.lookup("COORD_JOB") is None
+
+        stats = resolver.membership_stats()
+        assert stats["count"] == 4
+        assert stats["rejected"] + stats["false_positives"] == 2
+
+    def test_sync_serves_precomputed_not_found(self, registry_data):
+        client = create_app(registry_data=registry_data).test_client()
+        headers = {"User-Agent": "Googlebot/2.1"}
+
+        first = client.post("/api/sync", json={"target": "COORD_PROBE"}, headers=headers)
+        second = client.post("/api/sync", json={"target": "COORD_PROBE"}, headers=headers)
+
+        assert first.status_code == second.status_code == 404
+        assert first.get_json()["data"] is None
+        assert first.get_json()["status"] == 404
+        assert first.get_json()["request_id"] != second.get_json()["request_id"]
+        assert client.get("/api/lookup-filter").get_json()["rejected"] >= 1
@@ -0,0 +1,137 @@
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from clc.enums import BitPosition
+from clc.exceptions import InvalidBitmaskException
+from clc.storage.entity_store import EntityStore, FlagDelta
+
+
+class TestFlagDelta:
+    @pytest.mark.parametrize("flags", [0, 0b1010, (1 << 64) - 1, 1 << 63])
+    def test_composition_matches_sequential_application(self, flags):
+        first = FlagDelta.of(set_mask=0b0011, toggle_mask=1 << 63)
+        second = FlagDelta.of(clear_mask=0b0110, toggle_mask=0b1001)
+
+        assert first.then(second).apply(flags) == second.apply(first.apply(flags))
+
+    def test_round_trips_set_clear_toggle(self):
+        delta = FlagDelta.of(set_mask=0b001, clear_mask=0b010, toggle_mask=0b100)
+        assert (delta.set_mask, delta.clear_mask, delta.toggle_mask) == (0b001, 0b010, 0b100)
+
+    def test_rejects_out_of_range_masks(self):
+        with pytest.raises(InvalidBitmaskException):
+            FlagDelta.of(set_mask=-1)
+        with pytest.raises(InvalidBitmaskException):
+            FlagDelta.of(set_mask=1 << 64)
+
+
+class FailingEngine:
+    def begin(self):
+        raise OperationalError("UPDATE entities", {}, Exception("database is locked"))
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestEntityStore:
+    @pytest.fixture
+    def store(self):
+        store = EntityStore("sqlite://", flush_window=60.0)
+        store.create_many(
+            [("user", str(i), BitPosition.IS_ACTIVE.mask(), None) for i in range(10)]
+        )
+        yield store
+        store.close()
+
+    def test_immediate_mask_operations(self, store):
+        vip = BitPosition.IS_VIP.mask()
+        assert store.set_mask("user", "1", vip) == 1
+        assert store.get_flags("user", "1") == BitPosition.IS_ACTIVE.mask() | vip
+
+        store.clear_mask("user", "1", BitPosition.IS_ACTIVE.mask())
+        assert store.get_flags("user", "1") == vip
+
+        store.toggle_mask("user", "1", vip | BitPosition.IS_BANNED.mask())
+        assert store.get_flags("user", "1") == BitPosition.IS_BANNED.mask()
+
+    def test_high_bit_survives_signed_storage(self, store):
+        store.set_mask("user", "2", 1 << 63)
+        assert store.get_flags("user", "2") == (1 << 63) | BitPosition.IS_ACTIVE.mask()
+
+    def test_queued_updates_are_coalesced_per_entity(self, store):
+        store.queue("user", "3", set_mask=BitPosition.CAN_READ.mask())
+        store.queue("user", "3", toggle_mask=BitPosition.IS_ACTIVE.mask())
+        store.queue("user", "4", clear_mask=BitPosition.IS_ACTIVE.mask())
+        assert store.stats()["pending"] == 2
+
+        assert store.flush() == 2
+        assert store.get_flags("user", "3") == BitPosition.CAN_READ.mask()
+        assert store.get_flags("user", "4") == 0
+        assert store.stats()["rows_flushed"] == 2
+
+    def test_flushes_when_pending_limit_is_reached(self):
+        store = EntityStore("sqlite://", max_pending=2)
+        store.create_many([("doc", "a", 0, None), ("doc", "b", 0, None)])
+
+        store.queue("doc", "a", set_mask=1)
+        store.queue("doc", "b", set_mask=1)
+
+        assert store.stats()["pending"] == 0
+        assert store.get_flags("doc", "b") == 1
+
+    def test_idle_queue_flushes_after_window(self):
+        store = EntityStore("sqlite://", flush_window=0.05)
+        store.create_many([("doc", "a", 0, None)])
+
+        store.queue("doc", "a", set_mask=1)
+        assert store.stats()["pending"] == 1
+
+        deadline = time.monotonic() + 5
+        while store.stats()["pending"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.stats()["pending"] == 0
+        assert store.get_flags("doc", "a") == 1
+        store.close()
+
+    def test_failed_flush_requeues_updates_in_order(self, store, monkeypatch):
+        engine = store.engine
+        store.queue("user", "5", set_mask=BitPosition.CAN_READ.mask())
+        store.queue("user", "6", clear_mask=BitPosition.IS_ACTIVE.mask())
+
+        monkeypatch.setattr(store, "engine", FailingEngine())
+        with pytest.raises(OperationalError):
+            store.flush()
+        assert store.stats()["pending"] == 2
+        assert store.stats()["flush_errors"] == 1
+
+        store.queue("user", "5", clear_mask=BitPosition.CAN_READ.mask())
+        monkeypatch.setattr(store, "engine", engine)
+        assert store.flush() == 2
+        assert store.get_flags("user", "5") == BitPosition.IS_ACTIVE.mask()
+        assert store.get_flags("user", "6") == 0
+
+    def test_background_flush_failure_is_logged_and_retried(self, monkeypatch, caplog):
+        store = EntityStore("sqlite://", flush_window=0.05)
+        store.create_many([("doc", "a", 0, None)])
+        engine = store.engine
+        monkeypatch.setattr(store, "engine", FailingEngine())
+
+        store.queue("doc", "a", set_mask=1)
+        assert wait_for(lambda: "Flushing queued flag updates failed" in caplog.text)
+        assert store.stats()["flush_errors"] >= 1
+        assert store.stats()["pending"] == 1
+
+        monkeypatch.setattr(store, "engine", engine)
+        assert wait_for(lambda: store.stats()["pending"] == 0)
+        assert store.get_flags("doc", "a") == 1
+        store.close()
+
+    def test_missing_entity(self, store):
+        assert store.get_flags("user", "missing") is None
+        assert store.set_mask("user", "missing", 1) == 0
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from clc.enums import BitPosition
+from clc.services.bitmask_engine import BitMaskEngine
+from clc.storage.flag_column import FlagColumnStore, match_flags
+
+
+class TestFlagColumnStore:
+    @pytest.fixture
+    def flags(self):
+        rng = np.random.default_rng(3)
+        return rng.integers(0, 1 << 16, size=5_000, dtype=np.uint64) | np.uint64(1 << 63)
+
+    @pytest.fixture
+    def store(self, tmp_path, flags):
+        store = FlagColumnStore(str(tmp_path / "flags"), segment_rows=1_024)
+        store.append(np.arange(len(flags), dtype=np.uint64) * 7, flags)
+        return store
+
+    def test_segments_persist_and_reload(self, tmp_path, store, flags):
+        reopened = FlagColumnStore(str(tmp_path / "flags"))
+        assert len(reopened) == len(flags)
+        assert len(reopened.segments) == 5
+        assert reopened.get(7 * 4_321) == int(flags[4_321])
+
+    def test_index_lookup(self, store, flags):
+        assert store.row_of(7 * 2_500) == 2_500
+        assert store.get(3) is None
+
+    def test_latest_append_wins(self, store):
+        store.append([7 * 10], [BitPosition.IS_VIP.mask()])
+        assert store.get(7 * 10) == BitPosition.IS_VIP.mask()
+
+    @pytest.mark.parametrize(
+        "all_of, any_of, none_of",
+        [
+            (0b11, 0, 0),
+            (0, 0b1100, 0),
+            (0, 0, 0b1),
+            (1 << 63, 0b110, 0b1000),
+            (0, 0, 0),
+        ],
+    )
+    def test_scans_match_bitmask_engine(self, store, flags, all_of, any_of, none_of):
+        engine = BitMaskEngine()
+        expected = sum(
+            1
+            for value in map(int, flags)
+            if engine.has_mask(value, all_of)
+            and (not any_of or engine.has_any_mask(value, any_of))
+            and not engine.has_any_mask(value, none_of)
+        )
+
+        assert store.count(all_of, any_of, none_of, chunk_rows=300) == expected
+        selected = sum(len(ids) for ids, _ in store.select(all_of, any_of, none_of))
+        assert selected == expected
+
+    def test_compact_merges_segments(self, store, flags):
+        store.append([1, 2], [1, 2])
+        before = store.count(any_of=0b1)
+
+        store.compact()
+
+        assert len(store.segments) == 5
+        assert store.count(any_of=0b1) == before
+        assert store.get(2) == 2
+
+    def test_scans_skip_superseded_rows(self, tmp_path):
+        store = FlagColumnStore(str(tmp_path / "overwrites"))
+        store.append([1, 2], [1, 1])
+        store.append([1], [0])
+
+        assert store.get(1) == 0
+        assert len(store) == 2
+        assert store.rows == 3
+        assert store.count(any_of=1) == 1
+        assert [ids.tolist() for ids, _ in store.select(any_of=1)] == [[2]]
+
+        store.compact()
+        assert store.rows == 2
+        assert store.count(any_of=1) == 1
+        assert store.get(1) == 0
+
+    def test_duplicate_ids_within_one_append(self, tmp_path):
+        store = FlagColumnStore(str(tmp_path / "duplicates"))
+        store.append([5, 6, 5, 5], [1, 1, 2, 4])
+
+        assert store.get(5) == 4
+        assert len(store) == 2
+        assert store.count(any_of=0b011) == 1
+        assert sorted(
+            (int(i), int(f)) for ids, flags in store.iter_chunks(2) for i, f in zip(ids, flags)
+        ) == [(5, 4), (6, 1)]
+
+    def test_overwrites_match_bitmask_engine(self, store, flags):
+        rewritten = np.arange(0, len(flags), 3, dtype=np.uint64)
+        store.append(rewritten * 7, np.zeros(len(rewritten), dtype=np.uint64))
+        expected = flags.copy()
+        expected[rewritten.astype(np.int64)] = 0
+
+        assert len(store) == len(flags)
+        assert store.count(any_of=1 << 63) == int(np.count_nonzero(expected))
+        store.compact()
+        assert store.rows == len(flags)
+        assert store.count(any_of=1 << 63) == int(np.count_nonzero(expected))
+
+    def test_match_flags_empty_conditions(self):
+        assert match_flags(np.array([0, 1], dtype=np.uint64)).all()
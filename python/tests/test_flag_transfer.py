@@ -0,0 +1,185 @@
+import json
+
+import numpy as np
+import pytest
+
+from clc.enums import BitPosition
+from clc.exceptions import FlagTransferException
+from clc.storage.entity_store import EntityStore
+from clc.storage.flag_transfer import (
+    FlagSchema,
+    export_flags,
+    import_flags,
+    parse_booleans,
+)
+from clc.tools.flags import main as flags_main
+
+SCHEMA = FlagSchema.parse(
+    ["active=IS_ACTIVE", "verified=IS_VERIFIED", "legacy_admin=11"]
+)
+ACTIVE = BitPosition.IS_ACTIVE.mask()
+VERIFIED = BitPosition.IS_VERIFIED.mask()
+ADMIN = BitPosition.CAN_ADMIN.mask()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EntityStore(f"sqlite:///{tmp_path / 'entities.db'}")
+    yield store
+    store.close()
+
+
+def write_csv(path, rows):
+    lines = ["entity_type,entity_id,active,verified,legacy_admin"]
+    lines += [",".join(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+class TestFlagSchema:
+    def test_pack_and_lazy_unpack_round_trip(self):
+        columns = {
+            "active": [True, False, True],
+            "verified": [False, False, True],
+            "legacy_admin": [True, False, False],
+        }
+        flags = SCHEMA.pack(columns)
+        assert flags.tolist() == [ACTIVE | ADMIN, 0, ACTIVE | VERIFIED]
+
+        decoded = SCHEMA.unpack(flags)
+        assert decoded["verified"].tolist() == columns["verified"]
+        assert list(decoded._decoded) == ["verified"]
+
+    def test_high_bits_survive_packing(self):
+        schema = FlagSchema({"top": 63})
+        flags = schema.pack({"top": [True]})
+        assert flags.dtype == np.uint64
+        assert int(flags[0]) == 1 << 63
+
+    def test_default_schema_covers_bit_positions(self):
+        schema = FlagSchema.default()
+        assert schema.columns["is_banned"] == BitPosition.IS_BANNED.value
+        assert len(schema.columns) == len(BitPosition)
+
+    def test_parse_booleans(self):
+        values = ["1", "True", " yes ", "", "0", "false", None, True, 0]
+        assert parse_booleans("col", values).tolist() == [
+            True, True, True, False, False, False, False, True, False
+        ]
+        with pytest.raises(FlagTransferException, match="record 3"):
+            parse_booleans("col", ["1", "0", "maybe"])
+
+    def test_unknown_bit_is_rejected(self):
+        with pytest.raises(FlagTransferException):
+            FlagSchema.parse(["x=NOT_A_BIT"])
+
+
+class TestImportExport:
+    def test_csv_import_packs_columns(self, store, tmp_path):
+        source = write_csv(
+            tmp_path / "users.csv",
+            [
+                ("user", "1", "1", "0", "true"),
+                ("user", "2", "0", "1", ""),
+                ("team", "3", "y", "y", "n"),
+            ],
+        )
+        result = import_flags(store, source, SCHEMA, chunk_size=2)
+
+        assert (result.rows, result.chunks) == (3, 2)
+        assert store.get_flags("user", "1") == ACTIVE | ADMIN
+        assert store.get_flags("user", "2") == VERIFIED
+        assert store.get_flags("team", "3") == ACTIVE | VERIFIED
+
+    def test_import_resumes_from_checkpoint(self, store, tmp_path):
+        rows = [("user", str(i), "1", "0", "0") for i in range(5)]
+        rows.insert(3, ("user", "bad", "maybe", "0", "0"))
+        source = write_csv(tmp_path / "users.csv", rows)
+
+        with pytest.raises(FlagTransferException, match="record 4"):
+            import_flags(store, source, SCHEMA, chunk_size=2)
+        assert store.get_flags("user", "1") == ACTIVE
+        assert store.get_flags("user", "2") is None
+
+        rows[3] = ("user", "bad", "0", "0", "0")
+        fixed = write_csv(tmp_path / "users.csv", rows)
+        result = import_flags(store, fixed, SCHEMA, chunk_size=2)
+        assert result.resumed_rows == 2
+        assert result.rows == 4
+        assert store.get_flags("user", "bad") == 0
+        assert store.get_flags("user", "4") == ACTIVE
+
+        again = import_flags(store, fixed, SCHEMA, chunk_size=2)
+        assert again.rows == 0
+
+    def test_jsonl_merge_only_touches_mapped_bits(self, store, tmp_path):
+        premium = BitPosition.IS_PREMIUM.mask()
+        store.create_many([("user", "1", premium | ACTIVE, None)])
+        source = tmp_path / "flags.jsonl"
+        source.write_text(
+            json.dumps({"entity_id": "1", "active": False, "verified": True}) + "\n\n",
+            encoding="utf-8",
+        )
+
+        import_flags(store, str(source), SCHEMA, entity_type="user", merge=True)
+        assert store.get_flags("user", "1") == premium | VERIFIED
+
+    def test_missing_id_column_is_reported(self, store, tmp_path):
+        source = tmp_path / "flags.csv"
+        source.write_text("entity_type,active\nuser,1\n", encoding="utf-8")
+        with pytest.raises(FlagTransferException, match="entity_id"):
+            import_flags(store, str(source), SCHEMA)
+
+    @pytest.mark.parametrize("suffix", ["csv", "jsonl"])
+    def test_export_round_trips_through_import(self, store, tmp_path, suffix):
+        store.create_many(
+            ("user", str(i), (ACTIVE if i % 2 else 0) | (ADMIN if i % 3 else 0), None)
+            for i in range(7)
+        )
+        dest = str(tmp_path / f"out.{suffix}")
+        result = export_flags(store, dest, SCHEMA, chunk_size=3)
+        assert (result.rows, result.chunks) == (7, 3)
+
+        other = EntityStore("sqlite://")
+        import_flags(other, dest, SCHEMA)
+        for i in range(7):
+            assert other.get_flags("user", str(i)) == store.get_flags("user", str(i))
+        other.close()
+
+    def test_export_resume_truncates_partial_output(self, store, tmp_path):
+        store.create_many(("user", str(i), ACTIVE, None) for i in range(4))
+        dest = tmp_path / "out.csv"
+        export_flags(store, str(dest), SCHEMA, chunk_size=2)
+        with open(dest, "a", encoding="utf-8") as f:
+            f.write("user,partial")
+
+        store.create_many([("user", "9", VERIFIED, None)])
+        result = export_flags(store, str(dest), SCHEMA, chunk_size=2)
+
+        assert result.resumed_rows == 4
+        lines = dest.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "entity_type,entity_id,active,verified,legacy_admin"
+        assert lines[1:] == [f"user,{i},1,0,0" for i in range(4)] + ["user,9,0,1,0"]
+
+
+def test_flags_command(tmp_path, capsys):
+    database = f"sqlite:///{tmp_path / 'cli.db'}"
+    source = write_csv(tmp_path / "users.csv", [("user", "1", "1", "1", "0")])
+    columns = []
+    for spec in ("active=IS_ACTIVE", "verified=IS_VERIFIED", "legacy_admin=11"):
+        columns += ["--column", spec]
+
+    with pytest.raises(SystemExit) as exit_info:
+        flags_main(["--database", database, "import", source, *columns])
+    assert exit_info.value.code == 0
+    assert "Imported 1 rows" in capsys.readouterr().out
+
+    dest = str(tmp_path / "out.jsonl")
+    with pytest.raises(SystemExit):
+        flags_main(["--database", database, "export", dest, "--column", "verified=2"])
+    with open(dest, encoding="utf-8") as f:
+        assert json.loads(f.readline()) == {
+            "entity_type": "user",
+            "entity_id": "1",
+            "verified": True,
+        }
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_US = 50_000
+WEB_STACK = ("flask", "pydantic", "yaml", "werkzeug")
+
+
+def _profile_import(statement):
+    probe = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {WEB_STACK!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(__file__)),
+    )
+
+    total_us = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        started = started or name.strip().startswith("clc")
+        if started:
+            total_us += int(self_us)
+
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return total_us, loaded
+
+
+class TestImportTime:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import clc",
+            "from clc.services.bitmask_engine import BitMaskEngine",
+            "from clc.services import BitMaskEngine",
+            "from clc.services.caller_detector import CallerDetector",
+            "from clc.enums import BitPosition",
+        ],
+    )
+    def test_light_imports_skip_web_stack(self, statement):
+        total_us, loaded = _profile_import(statement)
+        assert loaded == []
+        assert total_us < IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "clc.services.bit_heatmap",
+            "clc.storage.flag_column",
+            "clc.storage.sqlite_registry",
+            "clc.services.sqlite_resolver",
+            "clc.tools.validator",
+        ],
+    )
+    def test_bit_helpers_do_not_load_sqlalchemy(self, module):
+        result = subprocess.run(
+            [sys.executable, "-c", f"import sys, {module}; print('sqlalchemy' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(__file__)),
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_create_app_is_resolved_lazily(self):
+        import clc
+
+        assert callable(clc.create_app)
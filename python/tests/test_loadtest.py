@@ -0,0 +1,132 @@
+import json
+import threading
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from werkzeug.serving import make_server
+
+from clc.app import create_app
+from clc.enums import CallerType
+from clc.services.caller_detector import CallerDetector
+from clc.tools.loadtest import (
+    HTTPTransport,
+    TrafficGenerator,
+    TrafficModel,
+    WSGITransport,
+    main,
+    run,
+    summarize,
+)
+
+KEYS = [f"COORD_{i}" for i in range(100)]
+
+
+class TestTrafficGenerator:
+    def test_caller_mix_matches_detector(self):
+        model = TrafficModel(bot=0.5, auth=0.3, probe=0.2, miss_rate=0.0)
+        requests = TrafficGenerator(KEYS, model, seed=1).batch(5000)
+        detector = CallerDetector()
+        expected = {
+            "bot": CallerType.BOT.value,
+            "auth": CallerType.AUTHENTICATED.value,
+            "probe": CallerType.ATTACKER.value,
+        }
+
+        for request in requests[:200]:
+            mask = detector.detect(
+                request.headers.get("User-Agent", ""),
+                request.headers.get("Authorization", ""),
+            )
+            assert mask == expected[request.caller]
+
+        mix = Counter(request.caller for request in requests)
+        assert mix["bot"] / 5000 == pytest.approx(0.5, abs=0.03)
+        assert mix["probe"] / 5000 == pytest.approx(0.2, abs=0.03)
+
+    def test_zipf_hot_keys_and_miss_rate(self):
+        model = TrafficModel(zipf_s=1.2, miss_rate=0.1)
+        requests = TrafficGenerator(KEYS, model, seed=2).batch(10_000)
+        targets = Counter(request.target for request in requests)
+
+        misses = sum(n for target, n in targets.items() if target not in KEYS)
+        assert misses / 10_000 == pytest.approx(0.1, abs=0.02)
+
+        hits = [n for target, n in targets.most_common() if target in KEYS]
+        assert hits[0] > 10 * hits[49]
+        assert json.loads(requests[0].body)["target"] == requests[0].target
+
+    def test_rejects_empty_mix(self):
+        with pytest.raises(ValueError):
+            TrafficGenerator(KEYS, TrafficModel(bot=0, auth=0, probe=0)).batch(1)
+
+
+class TestRun:
+    def test_summarize_percentiles_and_errors(self):
+        latencies = np.arange(1, 1001, dtype=float) / 1000
+        statuses = np.array([200] * 990 + [503] * 5 + [0] * 5)
+        summary = summarize(latencies, statuses, ["bot"] * 1000, elapsed=2.0)
+
+        assert summary["requests"] == 1000
+        assert summary["throughput_rps"] == 500.0
+        assert summary["latency_ms"]["p50"] == pytest.approx(500.5)
+        assert summary["latency_ms"]["p999"] == pytest.approx(999.001)
+        assert summary["error_rate"] == 0.01
+        assert summary["status_codes"] == {"0": 5, "200": 990, "503": 5}
+        assert summary["callers"]["auth"]["requests"] == 0
+
+    def test_open_loop_run_in_process(self, registry_data):
+        transport = WSGITransport(create_app(registry_data=registry_data))
+        generator = TrafficGenerator(
+            list(registry_data["layer1_human_map"]), TrafficModel(miss_rate=0.2), seed=3
+        )
+
+        results = run(transport, generator.batch(200), rate=2000, concurrency=4)
+
+        assert results["requests"] == 200
+        assert results["error_rate"] == 0.0
+        assert set(results["status_codes"]) <= {"200", "404"}
+        assert results["latency_ms"]["p50"] <= results["latency_ms"]["p99"]
+
+    def test_http_transport_keeps_connections_alive(self, registry_data):
+        server = make_server("127.0.0.1", 0, create_app(registry_data=registry_data), threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            transport = HTTPTransport(f"http://127.0.0.1:{server.server_port}")
+            generator = TrafficGenerator(
+                list(registry_data["layer1_human_map"]), TrafficModel(), seed=4
+            )
+            results = run(transport, generator.batch(40), concurrency=2)
+        finally:
+            server.shutdown()
+
+        assert results["requests"] == 40
+        assert results["error_rate"] == 0.0
+        assert HTTPTransport("http://127.0.0.1:1").send(generator.batch(1)[0]) == 0
+
+    def test_main_writes_json_report(self, registry_path, tmp_path, capsys):
+        output = tmp_path / "run.json"
+        main(
+            [
+                "--registry",
+                registry_path,
+                "--requests",
+                "50",
+                "--concurrency",
+                "2",
+                "--label",
+                "wsgi-baseline",
+                "--output",
+                str(output),
+            ]
+        )
+
+        report = json.loads(output.read_text())
+        assert report["label"] == "wsgi-baseline"
+        assert report["mode"] == "closed-loop"
+        assert report["target"] == "wsgi"
+        assert report["results"]["requests"] == 50
+        assert "p999" in report["results"]["latency_ms"]
+        assert "requests in" in capsys.readouterr().err
@@ -0,0 +1,98 @@
+import pytest
+
+from clc.app import create_app, load_registry
+from clc.services.coordinate_resolver import CoordinateResolver
+from clc.storage.partitioned_registry import PartitionedRegistry
+from clc.tools.registry import main as registry_main
+
+
+@pytest.fixture
+def registry_dir(tmp_path, registry_data):
+    registry_data["metadata"] = {"version": "1.0"}
+    path = str(tmp_path / "registry.d")
+    PartitionedRegistry.write(registry_data, path, partitions=4)
+    return path
+
+
+class TestPartitionedRegistry:
+    def test_sections_behave_like_mappings(self, registry_dir, registry_data):
+        registry = PartitionedRegistry(registry_dir)
+        layer2 = registry["layer2_coordinate_registry"]
+
+        assert len(layer2) == 3
+        assert dict(layer2) == registry_data["layer2_coordinate_registry"]
+        assert "COORD_X101" in layer2
+        assert "COORD_MISSING" not in layer2
+        assert layer2.get("COORD_MISSING") is None
+        assert registry["metadata"] == {"version": "1.0"}
+        assert registry.get("unknown", {}) == {}
+
+    def test_resolver_matches_in_memory_registry(self, registry_dir, registry_data):
+        partitioned = CoordinateResolver(PartitionedRegistry(registry_dir))
+        in_memory = CoordinateResolver(registry_data)
+
+        for coordinate_key in registry_data["layer1_human_map"]:
+            assert partitioned.resolve(coordinate_key) == in_memory.resolve(coordinate_key)
+            assert partitioned.resolve_mask(coordinate_key) == in_memory.resolve_mask(
+                coordinate_key
+            )
+        assert partitioned.search("profile") == in_memory.search("profile")
+
+    def test_resident_partitions_are_capped_by_bytes(self, registry_dir, registry_data):
+        registry = PartitionedRegistry(registry_dir, max_resident_bytes=1)
+        layer1 = registry["layer1_human_map"]
+        layer2 = registry["layer2_coordinate_registry"]
+
+        for _ in range(3):
+            for coordinate_key in registry_data["layer1_human_map"]:
+                layer1[coordinate_key]
+                layer2[coordinate_key]
+
+        stats = registry.stats()
+        assert stats["resident"] == 1
+        assert stats["resident_bytes"] > stats["max_resident_bytes"]
+        assert stats["evictions"] == stats["loads"] - 1
+        assert stats["hits"] + stats["loads"] == 18
+
+    def test_resident_bytes_track_loaded_partitions(self, registry_dir, registry_data):
+        registry = PartitionedRegistry(registry_dir)
+        for coordinate_key in registry_data["layer1_human_map"]:
+            registry["layer1_human_map"][coordinate_key]
+
+        stats = registry.stats()
+        assert stats["evictions"] == 0
+        assert stats["resident_bytes"] <= stats["max_resident_bytes"]
+        assert stats["resident_bytes"] == sum(
+            size for _, size in registry._resident.values()
+        )
+
+    def test_iteration_does_not_fill_the_cache(self, registry_dir):
+        registry = PartitionedRegistry(registry_dir, max_resident_bytes=1)
+        assert sorted(registry["projections"]) == ["COORD_X101", "COORD_X102"]
+        assert registry.stats()["resident"] == 0
+
+    def test_app_serves_from_partition_directory(self, registry_dir):
+        registry = load_registry(registry_dir)
+        assert isinstance(registry, PartitionedRegistry)
+
+        client = create_app(registry_data=registry).test_client()
+        response = client.post(
+            "/api/sync",
+            json={"target": "COORD_X102"},
+            headers={"User-Agent": "Googlebot/2.1"},
+        )
+        assert response.status_code == 200
+        assert response.get_json()["data"]["data"] == {
+            "label": "Dashboard_Stats",
+            "schema": "Dataset",
+        }
+        assert client.get("/api/search?q=profile").status_code == 404
+
+    def test_partition_command(self, tmp_path, registry_path, capsys):
+        dest = str(tmp_path / "out")
+        with pytest.raises(SystemExit) as exit_info:
+            registry_main(["partition", registry_path, dest, "--partitions", "8"])
+
+        assert exit_info.value.code == 0
+        assert "Wrote 8 partitions" in capsys.readouterr().out
+        assert PartitionedRegistry(dest).partitions == 8
@@ -0,0 +1,152 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from clc.app import create_app
+from clc.services.token_verifier import HMACTokenVerifier
+from clc.tools.profiler import SamplingProfiler
+
+
+class BusyNode:
+    def __init__(self, node_id):
+        self.node_id = node_id
+        self.stop = threading.Event()
+
+    def process(self, data):
+        while not self.stop.is_set():
+            sum(range(100))
+        return data
+
+
+@pytest.fixture
+def busy_node():
+    node = BusyNode("resolver-node")
+    thread = threading.Thread(target=node.process, args=(None,), daemon=True)
+    thread.start()
+    yield node
+    node.stop.set()
+    thread.join()
+
+
+class TestSamplingProfiler:
+    def test_samples_are_collapsed_and_tag_node_ids(self, busy_node):
+        profiler = SamplingProfiler()
+        for _ in range(5):
+            profiler.sample()
+
+        lines = profiler.collapsed().splitlines()
+        node_lines = [line for line in lines if "[resolver-node]" in line]
+        assert node_lines
+        stack, count = node_lines[0].rsplit(" ", 1)
+        assert "test_profiler.py:BusyNode.process [resolver-node]" in stack.split(";")
+        assert int(count) >= 1
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in node_lines) == 5
+
+    def test_idle_threads_are_skipped(self):
+        event = threading.Event()
+        thread = threading.Thread(target=event.wait, daemon=True)
+        thread.start()
+        try:
+            profiler = SamplingProfiler()
+            profiler.sample()
+            assert "Event.wait" not in profiler.collapsed()
+
+            profiler.include_idle = True
+            profiler.sample()
+            assert "Event.wait" in profiler.collapsed()
+        finally:
+            event.set()
+            thread.join()
+
+    def test_windows_rotate_and_are_written(self, busy_node, tmp_path):
+        profiler = SamplingProfiler(window_seconds=3600, windows=2, output_dir=str(tmp_path))
+        profiler.sample()
+        profiler.rotate()
+        profiler.rotate()
+
+        assert len(profiler.windows) == 1
+        assert profiler.collapsed(0) == profiler.collapsed()
+        assert profiler.collapsed(5) == ""
+        written = list(tmp_path.glob("profile-*.folded"))
+        assert len(written) == 1
+        assert written[0].read_text() == profiler.collapsed(0)
+
+    def test_toggle_starts_and_stops_background_sampling(self, busy_node):
+        profiler = SamplingProfiler(hz=500)
+        profiler.toggle()
+        assert profiler.running and profiler.enabled
+
+        time.sleep(0.1)
+        profiler.toggle()
+
+        stats = profiler.stats()
+        assert not stats["running"]
+        assert not profiler.enabled
+        assert stats["samples"] > 0
+        assert 0 <= stats["overhead"] < 1
+        assert "[resolver-node]" in profiler.collapsed()
+
+    def test_signal_toggle_does_not_block_on_profiler_lock(self, busy_node):
+        profiler = SamplingProfiler(hz=500)
+        previous = signal.getsignal(signal.SIGUSR2)
+        try:
+            profiler.install_signal_handler(signal.SIGUSR2)
+            profiler.start()
+            deadline = time.monotonic() + 5
+            while not profiler.collapsed() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            with profiler._lock:
+                os.kill(os.getpid(), signal.SIGUSR2)
+                time.sleep(0.05)
+
+            deadline = time.monotonic() + 5
+            while (
+                profiler.running or not profiler.windows
+            ) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert not profiler.running
+            assert not profiler.enabled
+            assert len(profiler.windows) == 1
+        finally:
+            signal.signal(signal.SIGUSR2, previous)
+
+
+def test_profile_endpoint_is_hidden_without_token_verification(registry_data, monkeypatch):
+    monkeypatch.setenv("CLC_PROFILER", "1")
+    app = create_app(registry_data=registry_data)
+    try:
+        response = app.test_client().get(
+            "/api/profile", headers={"Authorization": "Bearer ops"}
+        )
+        assert response.status_code == 404
+    finally:
+        app.extensions["clc.profiler"].stop()
+
+
+def test_profile_endpoint_requires_signed_token(registry_data, monkeypatch):
+    monkeypatch.setenv("CLC_PROFILER", "1")
+    monkeypatch.setenv("CLC_PROFILER_HZ", "200")
+    monkeypatch.setenv("CLC_TOKEN_SECRET", "ops-secret")
+    app = create_app(registry_data=registry_data)
+    profiler = app.extensions["clc.profiler"]
+    try:
+        client = app.test_client()
+        assert profiler.running
+        assert client.get("/api/profile").status_code == 404
+        forged = {"Authorization": "Bearer ops"}
+        assert client.get("/api/profile", headers=forged).status_code == 404
+
+        token = HMACTokenVerifier(b"ops-secret").issue("ops")
+        headers = {"Authorization": f"Bearer {token}"}
+        stats = client.get("/api/profile?format=json", headers=headers).get_json()
+        assert stats["running"] is True
+
+        response = client.get("/api/profile", headers=headers)
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+    finally:
+        profiler.stop()
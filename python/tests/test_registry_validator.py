@@ -0,0 +1,153 @@
+import textwrap
+
+import pytest
+
+from clc.tools.registry import main as registry_main
+from clc.tools.validator import check_chunk, iter_entries, scan_fragments, validate_registry
+
+BROKEN_REGISTRY = textwrap.dedent(
+    """\
+    metadata:
+      version: "1.0"
+    layer1_human_map:
+      COORD_OK:
+        label: Fine
+        seo_keywords: [a, b]
+      COORD_BAD_ADDRESS:
+        label: Bad address
+      COORD_NO_ADDRESS:
+        label: No address
+      COORD_BAD_GLOSSARY:
+        label: [not, a, string]
+    layer2_coordinate_registry:
+      COORD_OK: 1010.0101@
+      COORD_BAD_ADDRESS: 10G0-0101
+      COORD_BAD_GLOSSARY: 1010.0101@
+    layer3_bitmask_core:
+      COORD_OK: 0x0001
+      COORD_BAD_ADDRESS: -4
+      COORD_NO_ADDRESS: 0x1FFFFFFFFFFFFFFFF
+      COORD_BAD_GLOSSARY: 2
+      COORD_ORPHAN: 1
+    projections:
+      COORD_OK:
+        glossary: {label: Fine}
+    """
+)
+
+
+@pytest.fixture
+def broken_path(tmp_path):
+    path = tmp_path / "broken.yaml"
+    path.write_text(BROKEN_REGISTRY, encoding="utf-8")
+    return str(path)
+
+
+def issues_by_line(report):
+    return {(line, severity): message for line, severity, _, message in report.issues}
+
+
+class TestRegistryValidator:
+    def test_iter_entries_streams_sections_with_lines(self, broken_path):
+        with open(broken_path, "rb") as stream:
+            entries = list(iter_entries(stream))
+
+        assert entries[0] == (
+            "layer1_human_map",
+            ("COORD_OK", {"label": "Fine", "seo_keywords": ["a", "b"]}, 4),
+        )
+        assert ("layer3_bitmask_core", ("COORD_OK", 1, 18)) in entries
+        assert {section for section, _ in entries} == {
+            "layer1_human_map",
+            "layer2_coordinate_registry",
+            "layer3_bitmask_core",
+            "projections",
+        }
+
+    def test_check_chunk_uses_resolver_and_mask_rules(self):
+        issues, facts = check_chunk(
+            "layer2_coordinate_registry", [("A", "1010.0101@", 1), ("B", "nope", 2)]
+        )
+        assert [line for line, *_ in issues] == [2]
+        assert "Expected format: XXXX.YYYY@" in issues[0][3]
+        assert facts == [
+            ("layer2_coordinate_registry", "A", 1, "1010.0101@"),
+            ("layer2_coordinate_registry", "B", 2, None),
+        ]
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_reports_every_problem_with_line_numbers(self, broken_path, workers):
+        report = validate_registry(broken_path, workers=workers, chunk_size=2)
+        issues = issues_by_line(report)
+
+        assert not report.ok
+        assert report.coordinates == 5
+        assert report.entries["layer3_bitmask_core"] == 5
+        assert "Invalid coordinate address format: 10G0-0101" in issues[(15, "error")]
+        assert issues[(9, "error")].startswith("Layer 2 resolution failed")
+        assert "label" in issues[(11, "error")]
+        assert "non-negative" in issues[(19, "error")]
+        assert "Invalid mask value" in issues[(20, "error")]
+        assert issues[(22, "warning")] == "No layer 1 entry for coordinate: COORD_ORPHAN"
+        assert issues[(7, "warning")] == "No projection for coordinate: COORD_BAD_ADDRESS"
+        assert "Duplicate coordinate address 1010.0101@" in issues[(16, "error")]
+        assert report.errors == 6
+
+    def test_scan_fragments_splits_sections_by_entry(self, broken_path):
+        fragments = scan_fragments(broken_path, chunk_size=2)
+        assert [(section, line) for section, _, _, line in fragments] == [
+            ("layer1_human_map", 4),
+            ("layer1_human_map", 9),
+            ("layer2_coordinate_registry", 14),
+            ("layer2_coordinate_registry", 16),
+            ("layer3_bitmask_core", 18),
+            ("layer3_bitmask_core", 20),
+            ("layer3_bitmask_core", 22),
+            ("projections", 24),
+        ]
+
+    def test_anchors_fall_back_to_streaming(self, tmp_path):
+        path = tmp_path / "anchored.yaml"
+        path.write_text(
+            BROKEN_REGISTRY.replace("label: Fine", "label: &fine Fine", 1)
+            .replace("glossary: {label: Fine}", "glossary: {label: *fine}"),
+            encoding="utf-8",
+        )
+        assert scan_fragments(str(path), chunk_size=2) is None
+
+        report = validate_registry(str(path), workers=0, chunk_size=2)
+        assert report.errors == 6
+        assert issues_by_line(report)[(15, "error")].startswith("Invalid coordinate")
+
+    def test_valid_registry_passes(self, registry_path):
+        report = validate_registry(registry_path, workers=0)
+
+        assert report.ok
+        assert report.coordinates == 3
+        assert [message for *_, message in report.issues] == [
+            "No projection for coordinate: COORD_NAV_PROFILE"
+        ]
+
+    def test_yaml_errors_are_reported(self, tmp_path):
+        path = tmp_path / "bad.yaml"
+        path.write_text("layer1_human_map:\n  A: {label: x\n  B: 1\n", encoding="utf-8")
+
+        report = validate_registry(str(path), workers=0)
+        assert not report.ok
+        assert report.issues[0][3].startswith("YAML error")
+
+    def test_validate_command(self, broken_path, registry_path, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            registry_main(["validate", broken_path, "--workers", "0"])
+        assert exit_info.value.code == 1
+        output = capsys.readouterr()
+        assert f"{broken_path}:15: error: Invalid coordinate address format" in output.out
+        assert "6 errors" in output.err
+
+        with pytest.raises(SystemExit) as exit_info:
+            registry_main(["validate", registry_path, "--workers", "0"])
+        assert exit_info.value.code == 0
+
+        with pytest.raises(SystemExit) as exit_info:
+            registry_main(["validate", registry_path, "--workers", "0", "--strict"])
+        assert exit_info.value.code == 1
@@ -0,0 +1,116 @@
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+
+from clc.storage.tunnel_log import HEADER, RECORD, list_segments
+from clc.tools.serve import read_memory
+
+
+def _read_until(stream, pattern, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        line = stream.readline()
+        match = re.search(pattern, line)
+        if match:
+            return match
+    raise AssertionError(f"Timed out waiting for {pattern!r}")
+
+
+def _start_prefork(registry_path, env=None):
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "clc.tools.serve",
+            "--port",
+            "0",
+            "--workers",
+            "2",
+            "--registry",
+            registry_path,
+        ],
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(__file__)),
+        env=env,
+    )
+
+
+@pytest.fixture
+def prefork_server(registry_path):
+    process = _start_prefork(registry_path)
+    try:
+        port = int(_read_until(process.stderr, r"Listening on http://[^:]+:(\d+)").group(1))
+        pids = [
+            int(_read_until(process.stderr, r"Booted worker \d+ \(pid (\d+)\)").group(1))
+            for _ in range(2)
+        ]
+        yield process, port, pids
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=10)
+
+
+def _sync(port, target):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/api/sync",
+        data=json.dumps({"target": target}).encode(),
+        headers={"Content-Type": "application/json", "User-Agent": "Googlebot/2.1"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+class TestPreforkServer:
+    def test_workers_serve_shared_registry(self, prefork_server):
+        _, port, _ = prefork_server
+        body = _sync(port, "COORD_X101")
+        assert body["data"]["type"] == "glossary"
+
+    def test_restarts_killed_worker(self, prefork_server):
+        process, port, pids = prefork_server
+        os.kill(pids[0], signal.SIGKILL)
+
+        replacement = int(
+            _read_until(process.stderr, r"Booted worker \d+ \(pid (\d+)\)").group(1)
+        )
+        assert replacement not in pids
+        assert _sync(port, "COORD_X102")["status"] == 200
+
+    def test_memory_report_runs_outside_signal_handler(self, prefork_server):
+        process, port, _ = prefork_server
+        process.send_signal(signal.SIGUSR1)
+        process.send_signal(signal.SIGUSR1)
+
+        _read_until(process.stderr, r"prefork total pss=")
+        assert _sync(port, "COORD_X101")["status"] == 200
+
+    def test_workers_seal_tunnel_log_on_shutdown(self, registry_path, tmp_path):
+        log_dir = str(tmp_path / "tunnel-log")
+        process = _start_prefork(
+            registry_path, env={**os.environ, "CLC_TUNNEL_LOG_DIR": log_dir}
+        )
+        try:
+            port = int(
+                _read_until(process.stderr, r"Listening on http://[^:]+:(\d+)").group(1)
+            )
+            assert _sync(port, "COORD_X101")["status"] == 200
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=10)
+
+        segments = list_segments(log_dir)
+        assert len(segments) == 1
+        assert os.path.getsize(segments[0]) == HEADER.size + RECORD.size
+
+    def test_read_memory(self):
+        usage = read_memory(os.getpid())
+        assert usage["rss"] > 0
+        assert usage["rss"] >= usage["private"]
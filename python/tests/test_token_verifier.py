@@ -0,0 +1,136 @@
+import time
+
+import pytest
+
+from clc.app import create_app
+from clc.enums import CallerType
+from clc.services.caller_detector import CallerDetector
+from clc.services.token_verifier import HMACTokenVerifier, VerifiedTokenCache
+
+SECRET = b"test-secret"
+AUTHENTICATED = CallerType.AUTHENTICATED.value
+ATTACKER = CallerType.ATTACKER.value
+
+
+class CountingVerifier:
+    def __init__(self, verifier):
+        self.verifier = verifier
+        self.calls = 0
+
+    def verify(self, token):
+        self.calls += 1
+        return self.verifier.verify(token)
+
+
+class TestHMACTokenVerifier:
+    @pytest.fixture
+    def verifier(self):
+        return HMACTokenVerifier(SECRET)
+
+    def test_accepts_signed_token_until_expiry(self, verifier):
+        token = verifier.issue("user-1", ttl=60)
+        assert verifier.verify(token) == pytest.approx(time.time() + 60, abs=2)
+        assert verifier.verify(verifier.issue("user-1", ttl=-1)) is None
+
+    @pytest.mark.parametrize(
+        "token", ["", "abc", "abc.", ".sig", "a.b.c", "not-base64!.sig"]
+    )
+    def test_rejects_malformed_tokens(self, verifier, token):
+        assert verifier.verify(token) is None
+
+    @pytest.mark.parametrize("token", ["abc.dé", "é.sig", "abc.\udcff"])
+    def test_rejects_non_ascii_tokens(self, verifier, token):
+        assert verifier.verify(token) is None
+        assert VerifiedTokenCache(verifier).verify(token) is False
+
+    def test_rejects_foreign_signature(self, verifier):
+        token = HMACTokenVerifier(b"other-secret").issue("user-1")
+        assert verifier.verify(token) is None
+        claims, signature = verifier.issue("user-1").split(".")
+        assert verifier.verify(f"{claims}x.{signature}") is None
+
+
+class TestVerifiedTokenCache:
+    @pytest.fixture
+    def verifier(self):
+        return CountingVerifier(HMACTokenVerifier(SECRET))
+
+    def test_repeat_tokens_skip_verification(self, verifier):
+        cache = VerifiedTokenCache(verifier)
+        token = verifier.verifier.issue("user-1")
+
+        assert all(cache.verify(token) for _ in range(5))
+        assert not any(cache.verify("forged.token") for _ in range(5))
+        assert verifier.calls == 2
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["negative_hits"], stats["misses"]) == (4, 4, 2)
+        assert stats["hit_rate"] == 0.8
+
+    def test_entries_expire_with_the_token(self, verifier, monkeypatch):
+        cache = VerifiedTokenCache(verifier, negative_ttl=10)
+        token = verifier.verifier.issue("user-1", ttl=30)
+        assert cache.verify(token)
+        assert not cache.verify("forged.token")
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 31)
+        assert not cache.verify(token)
+        assert not cache.verify("forged.token")
+        assert verifier.calls == 4
+        assert cache.stats()["expired"] == 2
+
+    def test_invalid_tokens_do_not_evict_valid_ones(self, verifier):
+        cache = VerifiedTokenCache(verifier, max_entries=2, max_negative_entries=2)
+        tokens = [verifier.verifier.issue(f"user-{i}") for i in range(2)]
+        for token in tokens:
+            cache.verify(token)
+        for i in range(10):
+            cache.verify(f"forged.{i}")
+
+        assert all(cache.verify(token) for token in tokens)
+        assert verifier.calls == 12
+        assert cache.stats()["valid_entries"] == 2
+        assert cache.stats()["invalid_entries"] == 2
+
+
+class TestCallerDetectorVerification:
+    def test_without_verifier_any_bearer_token_authenticates(self):
+        detector = CallerDetector()
+        assert detector.detect("Mozilla/5.0", "Bearer anything") == AUTHENTICATED
+        assert detector.token_stats() == {"enabled": False}
+
+    def test_verifier_gates_authenticated_mask(self):
+        verifier = HMACTokenVerifier(SECRET)
+        detector = CallerDetector(verifier)
+        token = verifier.issue("user-1")
+
+        assert detector.detect("Mozilla/5.0", f"Bearer {token}") == AUTHENTICATED
+        assert detector.detect("Mozilla/5.0", f"Token {token}") == AUTHENTICATED
+        assert detector.detect("Mozilla/5.0", "Bearer anything") == ATTACKER
+        assert detector.detect("Mozilla/5.0", token) == ATTACKER
+        assert detector.detect("Googlebot/2.1", "Bearer anything") == CallerType.BOT.value
+        assert detector.token_stats()["hits"] == 1
+
+
+def test_app_verifies_tokens_from_env(registry_data, monkeypatch):
+    monkeypatch.setenv("CLC_TOKEN_SECRET", SECRET.decode())
+    client = create_app(registry_data=registry_data).test_client()
+    token = HMACTokenVerifier(SECRET).issue("user-1")
+
+    def mask(auth):
+        response = client.post(
+            "/api/sync",
+            json={"target": "COORD_X101"},
+            headers={"User-Agent": "Mozilla/5.0", "Authorization": auth},
+        )
+        return response.get_json()["data"]["mask"]
+
+    assert mask(f"Bearer {token}") == hex(AUTHENTICATED)
+    assert mask(f"Bearer {token}") == hex(AUTHENTICATED)
+    assert mask("Bearer forged") == hex(ATTACKER)
+    assert mask("Bearer abc.d\u00e9") == hex(ATTACKER)
+
+    stats = client.get("/api/token-cache").get_json()
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"]) == (1, 3)
@@ -0,0 +1,152 @@
+import json
+import uuid
+
+import numpy as np
+import pytest
+
+from clc.app import create_app
+from clc.enums import CallerType, ProjectionType
+from clc.storage.tunnel_log import (
+    RECORD_DTYPE,
+    UNKNOWN_COORDINATE,
+    TunnelLogWriter,
+    list_segments,
+    read_keys,
+    read_segment,
+)
+from clc.tools.logs import histogram_percentiles, latency_bins, main as logs_main, summarize
+
+BOT = CallerType.BOT.value
+ATTACKER = CallerType.ATTACKER.value
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    return str(tmp_path / "tunnel-log")
+
+
+def write_records(writer, count, start=1_700_000_000.0):
+    for i in range(count):
+        caller = BOT if i % 4 else ATTACKER
+        writer.log(
+            uuid.uuid4().bytes,
+            f"COORD_{i % 3}" if i % 5 else None,
+            caller,
+            200 if i % 5 else 404,
+            (i + 1) / 1000.0,
+            ProjectionType.DECEPTION if caller == ATTACKER else ProjectionType.GLOSSARY,
+            timestamp=start + i,
+        )
+
+
+class TestTunnelLogWriter:
+    def test_records_are_fixed_width_and_rotate(self, log_dir):
+        writer = TunnelLogWriter(log_dir, segment_records=4)
+        write_records(writer, 10)
+
+        segments = list_segments(log_dir)
+        assert len(segments) == 3
+        assert len(read_segment(segments[-1])) == 2
+
+        writer.close()
+        assert RECORD_DTYPE.itemsize == 48
+        records = np.concatenate([read_segment(segment) for segment in segments])
+        assert len(records) == 10
+        assert records["latency_us"].tolist() == [1000 * (i + 1) for i in range(10)]
+        assert records["coordinate"][0] == UNKNOWN_COORDINATE
+        assert read_keys(log_dir, writer.stream) == ["COORD_1", "COORD_2", "COORD_0"]
+
+    def test_unresolved_targets_are_not_interned(self, log_dir):
+        writer = TunnelLogWriter(log_dir)
+        writer.log(uuid.uuid4().bytes, "COORD_RANDOM", ATTACKER, 404, 0.001, intern=False)
+        writer.close()
+
+        assert read_segment(list_segments(log_dir)[0])["coordinate"][0] == UNKNOWN_COORDINATE
+        assert read_keys(log_dir, writer.stream) == []
+
+    def test_close_without_logging_is_safe(self, log_dir):
+        writer = TunnelLogWriter(log_dir)
+        writer.close()
+        writer.close()
+        assert list_segments(log_dir) == []
+
+    def test_reopening_after_fork_closes_inherited_keys_file(self, log_dir):
+        writer = TunnelLogWriter(log_dir)
+        writer.log(uuid.uuid4().bytes, "COORD_1", BOT, 200, 0.001)
+        inherited = writer._keys_file
+        writer._pid = -1
+
+        writer.log(uuid.uuid4().bytes, "COORD_1", BOT, 200, 0.001)
+        assert inherited.closed
+        assert not writer._keys_file.closed
+        writer.close()
+        writer.close()
+        assert writer._keys_file is None
+
+
+def test_latency_histogram_percentiles_are_close():
+    latency_us = np.arange(1, 100_001)
+    histogram = np.bincount(latency_bins(latency_us))
+    percentiles = histogram_percentiles(histogram)
+    for name, exact in (("p50", 50.0), ("p99", 99.0)):
+        assert exact <= percentiles[name] <= exact * 1.05
+
+
+class TestSummarize:
+    @pytest.fixture
+    def populated(self, log_dir):
+        for _ in range(2):
+            writer = TunnelLogWriter(log_dir, segment_records=16)
+            write_records(writer, 40)
+            writer.close()
+        return log_dir
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_aggregates_across_segments_and_streams(self, populated, workers):
+        report = summarize(populated, workers=workers).report()
+
+        assert report["records"] == 80
+        assert report["segments"] == 6
+        assert report["callers"] == {"SEO Bot": 60, "Unknown Caller": 20}
+        assert report["deception_rate"] == 0.25
+        assert report["responses"] == {"200": 64, "404": 16}
+        assert 20.0 <= report["latency_ms"]["p50"] <= 21.0
+        assert [entry["requests"] for entry in report["coordinates"]] == [22, 22, 20]
+        assert {entry["coordinate_key"] for entry in report["coordinates"]} == {
+            "COORD_0",
+            "COORD_1",
+            "COORD_2",
+        }
+
+    def test_time_window(self, populated):
+        summary = summarize(populated, since=1_700_000_010.0, until=1_700_000_020.0, workers=0)
+        assert summary.records == 20
+
+    def test_stats_command(self, populated, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            logs_main(["stats", populated, "--workers", "0", "--top", "1"])
+        assert exit_info.value.code == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["records"] == 80
+        assert len(report["coordinates"]) == 1
+
+
+def test_app_logs_tunnel_requests(registry_data, log_dir, monkeypatch):
+    monkeypatch.setenv("CLC_TUNNEL_LOG_DIR", log_dir)
+    app = create_app(registry_data=registry_data)
+    client = app.test_client()
+    bot = {"User-Agent": "Googlebot/2.1"}
+
+    client.post("/api/sync", json={"target": "COORD_X101"}, headers=bot)
+    client.post("/api/sync", json={"target": "COORD_NOPE"})
+    client.post("/api/sync/batch", json={"targets": ["COORD_X102", "COORD_NOPE"]}, headers=bot)
+    assert client.get("/api/tunnel-log").get_json()["records_written"] == 4
+    app.extensions["clc.tunnel_log"].close()
+
+    report = summarize(log_dir, workers=0).report()
+    assert report["responses"] == {"200": 2, "404": 2}
+    assert report["callers"] == {"SEO Bot": 3, "Unknown Caller": 1}
+    assert {entry["coordinate_key"] for entry in report["coordinates"]} == {
+        "COORD_X101",
+        "COORD_X102",
+    }
@@ -0,0 +1,124 @@
+import random
+
+import numpy as np
+import pytest
+
+from clc.enums import BitPosition
+from clc.exceptions import InvalidBitmaskException
+from clc.services.bitmask_engine import BitMaskEngine
+from clc.services.wide_bitset import (
+    WideBitSet,
+    apply_mask_many,
+    clear_mask_many,
+    count_set_bits_many,
+    has_any_mask_many,
+    has_bit_many,
+    has_mask_many,
+    pack_many,
+    set_mask_many,
+    unpack_many,
+)
+
+
+class TestWideBitSet:
+    @pytest.mark.parametrize("width", [128, 256, 512])
+    def test_bit_operations_across_words(self, width):
+        flags = WideBitSet(width=width)
+        for position in (0, 63, 64, width - 1):
+            flags = flags.set_bit(position)
+            assert flags.has_bit(position)
+
+        assert list(flags) == [0, 63, 64, width - 1]
+        assert flags.count_set_bits() == 4
+        assert not flags.clear_bit(64).has_bit(64)
+        assert flags.toggle_bit(65).has_bit(65)
+        assert (~flags).count_set_bits() == width - 4
+
+    def test_mask_operations_match_bitmask_engine_below_64_bits(self):
+        engine = BitMaskEngine()
+        rng = random.Random(0)
+        for _ in range(100):
+            flags, mask = rng.getrandbits(64), rng.getrandbits(64)
+            wide = WideBitSet(flags, 128)
+            assert int(wide.apply_mask(mask)) == engine.apply_mask(flags, mask)
+            assert wide.has_mask(mask) == engine.has_mask(flags, mask)
+            assert wide.has_any_mask(mask) == engine.has_any_mask(flags, mask)
+            assert int(wide.set_mask(mask)) == engine.set_mask(flags, mask)
+            assert int(wide.clear_mask(mask)) == engine.clear_mask(flags, mask)
+            assert wide.count_set_bits() == engine.count_set_bits(flags)
+
+    def test_masks_above_64_bits(self):
+        mask = WideBitSet.from_positions([BitPosition.IS_ACTIVE, 100, 200])
+        flags = WideBitSet.from_positions([0, 100, 200, 255])
+
+        assert flags.has_mask(mask)
+        assert not WideBitSet.from_positions([0, 100]).has_mask(mask)
+        assert WideBitSet.from_positions([200]).has_any_mask(mask)
+        assert flags & mask == mask
+        assert (flags | mask) == flags
+        assert list(flags.clear_mask(mask)) == [255]
+        assert 255 in flags and 300 not in flags
+
+    def test_packed_serialization(self):
+        flags = WideBitSet.from_positions([1, 70, 511], width=512)
+        data = flags.pack()
+
+        assert len(data) == 64
+        assert WideBitSet.unpack(data) == flags
+        assert flags.words().tolist()[:2] == [2, 1 << 6]
+        assert WideBitSet.from_words(flags.words(), 512) == flags
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda: WideBitSet(width=96),
+            lambda: WideBitSet(-1),
+            lambda: WideBitSet(1 << 128, 128),
+            lambda: WideBitSet(width=128).set_bit(128),
+            lambda: WideBitSet(width=128).apply_mask(-1),
+            lambda: WideBitSet.from_words([1, 2, 3], 128),
+        ],
+    )
+    def test_rejects_invalid_values(self, build):
+        with pytest.raises(InvalidBitmaskException):
+            build()
+
+
+class TestBatchOperations:
+    @pytest.fixture
+    def bitsets(self):
+        rng = random.Random(1)
+        return [WideBitSet(rng.getrandbits(256)) for _ in range(500)]
+
+    def test_round_trip(self, bitsets):
+        words = pack_many(bitsets)
+        assert words.shape == (500, 4)
+        assert words.dtype == np.dtype("<u8")
+        assert unpack_many(words) == bitsets
+
+    def test_batch_matches_scalar(self, bitsets):
+        words = pack_many(bitsets)
+        mask = WideBitSet.from_positions([3, 64, 130, 255])
+
+        assert has_mask_many(words, mask).tolist() == [b.has_mask(mask) for b in bitsets]
+        assert has_any_mask_many(words, mask).tolist() == [
+            b.has_any_mask(mask) for b in bitsets
+        ]
+        assert has_bit_many(words, 130).tolist() == [b.has_bit(130) for b in bitsets]
+        assert count_set_bits_many(words).tolist() == [b.count_set_bits() for b in bitsets]
+        for batch, scalar in (
+            (apply_mask_many, WideBitSet.apply_mask),
+            (set_mask_many, WideBitSet.set_mask),
+            (clear_mask_many, WideBitSet.clear_mask),
+        ):
+            assert unpack_many(batch(words, mask)) == [scalar(b, mask) for b in bitsets]
+
+    def test_pack_rejects_oversized_flags(self):
+        with pytest.raises(InvalidBitmaskException):
+            pack_many([1, 1 << 128], width=128)
+
+
+def test_bit_position_validity_by_width():
+    assert BitPosition.is_valid(63)
+    assert not BitPosition.is_valid(64)
+    assert BitPosition.is_valid(255, width=256)
@@ -0,0 +1,360 @@
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+import argparse
+import fnmatch
+import os
+import socket
+import socketserver
+import threading
+import time
+
+class RespError(Exception):
+    pass
+
+def encode_command(*args: Any) -> bytes:
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif isinstance(arg, int):
+            arg = str(arg).encode()
+        parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+    return b''.join(parts)
+
+def encode_reply(value: Any) -> bytes:
+    if value is None:
+        return b'$-1\r\n'
+    if isinstance(value, RespError):
+        return b'-%s\r\n' % str(value).encode()
+    if isinstance(value, bool) or isinstance(value, int):
+        return b':%d\r\n' % value
+    if isinstance(value, str):
+        return b'+%s\r\n' % value.encode()
+    if isinstance(value, bytes):
+        return b'$%d\r\n%s\r\n' % (len(value), value)
+    return b'*%d\r\n' % len(value) + b''.join(encode_reply(item) for item in value)
+
+def read_reply(stream: BinaryIO) -> Any:
+    line = stream.readline()
+    if not line.endswith(b'\r\n'):
+        raise ConnectionError('Connection closed by peer')
+    
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b'+':
+        return body.decode()
+    if prefix == b'-':
+        return RespError(body.decode())
+    if prefix == b':':
+        return int(body)
+    if prefix == b'$':
+        length = int(body)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError('Connection closed by peer')
+        return data[:-2]
+    if prefix == b'*':
+        length = int(body)
+        return None if length < 0 else [read_reply(stream) for _ in range(length)]
+    raise RespError(f'Unexpected reply type: {prefix!r}')
+
+class _Connection:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.reader = sock.makefile('rb')
+    
+    def close(self) -> None:
+        self.reader.close()
+        self.sock.close()
+
+class RespClient:
+    def __init__(self, url: str = 'redis://127.0.0.1:6379/0', timeout: float = 1.0, pool_size: int = 8):
+        parts = urlsplit(url)
+        self.url = url
+        self.timeout = timeout
+        if parts.scheme == 'unix':
+            self.family = socket.AF_UNIX
+            self.address: Union[str, Tuple[str, int]] = parts.path
+            self.db = 0
+        else:
+            self.family = socket.AF_INET
+            self.address = (parts.hostname or '127.0.0.1', parts.port or 6379)
+            self.db = int(parts.path.lstrip('/') or 0)
+        
+        self._idle: List[_Connection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+    
+    def execute(self, *args: Any) -> Any:
+        reply = self.pipeline([args])[0]
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+    
+    def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        payload = b''.join(encode_command(*command) for command in commands)
+        with self._slots:
+            for attempt in range(2):
+                conn, reused = self._checkout()
+                try:
+                    conn.sock.sendall(payload)
+                    replies = [read_reply(conn.reader) for _ in commands]
+                except (OSError, ConnectionError):
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                with self._lock:
+                    self._idle.append(conn)
+                return replies
+        raise ConnectionError(f'Could not reach {self.url}')
+    
+    def ping(self) -> bool:
+        return self.execute('PING') == 'PONG'
+    
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute('GET', key)
+    
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return self.execute('MGET', *keys) if keys else []
+    
+    def set(self, key: str, value: bytes, ttl_ms: Optional[int] = None) -> None:
+        self.mset({key: value}, ttl_ms)
+    
+    def mset(self, items: Dict[str, bytes], ttl_ms: Optional[int] = None) -> None:
+        expiry = ('PX', ttl_ms) if ttl_ms else ()
+        for reply in self.pipeline([('SET', key, value) + expiry for key, value in items.items()]):
+            if isinstance(reply, RespError):
+                raise reply
+    
+    def delete(self, *keys: str) -> int:
+        return self.execute('DEL', *keys) if keys else 0
+    
+    def scan_iter(self, match: str = '*', count: int = 500) -> Any:
+        cursor = b'0'
+        while True:
+            cursor, keys = self.execute('SCAN', cursor, 'MATCH', match, 'COUNT', count)
+            for key in keys:
+                yield key.decode()
+            if cursor == b'0':
+                return
+    
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+    
+    def _checkout(self) -> Tuple[_Connection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        
+        sock = socket.socket(self.family, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+            if self.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            sock.close()
+            raise
+        
+        conn = _Connection(sock)
+        if self.db:
+            conn.sock.sendall(encode_command('SELECT', self.db))
+            reply = read_reply(conn.reader)
+            if isinstance(reply, RespError):
+                conn.close()
+                raise reply
+        return conn, False
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            try:
+                command = read_reply(self.rfile)
+            except (ConnectionError, OSError, ValueError):
+                return
+            if not isinstance(command, list) or not command:
+                self.wfile.write(encode_reply(RespError('ERR Protocol error')))
+                return
+            
+            name = command[0].decode().upper()
+            if name == 'QUIT':
+                self.wfile.write(encode_reply('OK'))
+                return
+            self.wfile.write(encode_reply(self.server.store.dispatch(name, command[1:])))
+
+class RespMemoryStore:
+    def __init__(self):
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.lock = threading.Lock()
+    
+    def dispatch(self, name: str, args: List[bytes]) -> Any:
+        handler = getattr(self, f'cmd_{name.lower()}', None)
+        if handler is None:
+            return RespError(f"ERR unknown command '{name}'")
+        try:
+            with self.lock:
+                return handler(*args)
+        except (TypeError, ValueError, IndexError):
+            return RespError(f"ERR wrong arguments for '{name}' command")
+    
+    def cmd_ping(self, message: Optional[bytes] = None) -> Any:
+        return 'PONG' if message is None else message
+    
+    def cmd_echo(self, message: bytes) -> bytes:
+        return message
+    
+    def cmd_select(self, db: bytes) -> Any:
+        return 'OK' if int(db) == 0 else RespError('ERR DB index is out of range')
+    
+    def cmd_command(self, *args: bytes) -> List[Any]:
+        return []
+    
+    def cmd_get(self, key: bytes) -> Optional[bytes]:
+        return self._live(key)
+    
+    def cmd_mget(self, *keys: bytes) -> List[Optional[bytes]]:
+        if not keys:
+            raise ValueError
+        return [self._live(key) for key in keys]
+    
+    def cmd_set(self, key: bytes, value: bytes, *options: bytes) -> Any:
+        expires = None
+        only_new = only_existing = False
+        index = 0
+        while index < len(options):
+            option = options[index].upper()
+            if option in (b'EX', b'PX'):
+                amount = int(options[index + 1])
+                expires = time.monotonic() + (amount if option == b'EX' else amount / 1000.0)
+                index += 1
+            elif option == b'NX':
+                only_new = True
+            elif option == b'XX':
+                only_existing = True
+            else:
+                return RespError('ERR syntax error')
+            index += 1
+        
+        exists = self._live(key) is not None
+        if (only_new and exists) or (only_existing and not exists):
+            return None
+        self.data[key] = (value, expires)
+        return 'OK'
+    
+    def cmd_mset(self, *pairs: bytes) -> str:
+        if not pairs or len(pairs) % 2:
+            raise ValueError
+        for key, value in zip(pairs[::2], pairs[1::2]):
+            self.data[key] = (value, None)
+        return 'OK'
+    
+    def cmd_del(self, *keys: bytes) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+    
+    def cmd_exists(self, *keys: bytes) -> int:
+        return sum(self._live(key) is not None for key in keys)
+    
+    def cmd_pttl(self, key: bytes) -> int:
+        if self._live(key) is None:
+            return -2
+        expires = self.data[key][1]
+        return -1 if expires is None else int((expires - time.monotonic()) * 1000)
+    
+    def cmd_dbsize(self) -> int:
+        return sum(self._live(key) is not None for key in list(self.data))
+    
+    def cmd_flushdb(self, *args: bytes) -> str:
+        self.data.clear()
+        return 'OK'
+    
+    cmd_flushall = cmd_flushdb
+    
+    def cmd_scan(self, cursor: bytes, *options: bytes) -> List[Any]:
+        match, count = '*', 10
+        for option, value in zip(options[::2], options[1::2]):
+            if option.upper() == b'MATCH':
+                match = value.decode()
+            elif option.upper() == b'COUNT':
+                count = int(value)
+        
+        keys = sorted(self.data)
+        start = int(cursor)
+        page = keys[start:start + count]
+        following = start + count if start + count < len(keys) else 0
+        return [str(following).encode(), [
+            key for key in page
+            if self._live(key) is not None and fnmatch.fnmatchcase(key.decode(), match)
+        ]]
+    
+    def cmd_info(self, *sections: bytes) -> bytes:
+        return f'# Server\r\nredis_mode:standalone\r\nclc_memory_store:1\r\nkeys:{len(self.data)}\r\n'.encode()
+    
+    def _live(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _ThreadingUnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+class RespServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, unix_path: Optional[str] = None):
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            self.server = _ThreadingUnixServer(unix_path, _RespHandler)
+            self.url = f'unix://{unix_path}'
+        else:
+            self.server = _ThreadingTCPServer((host, port), _RespHandler)
+            self.url = f'redis://{host}:{self.server.server_address[1]}/0'
+        self.unix_path = unix_path
+        self.server.store = RespMemoryStore()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def store(self) -> RespMemoryStore:
+        return self.server.store
+    
+    def start(self) -> 'RespServer':
+        self._thread = threading.Thread(target=self.server.serve_forever, name='resp-server', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if self.unix_path and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
+    
+    def __enter__(self) -> 'RespServer':
+        return self.start()
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Minimal in-memory RESP server for the L2 cache tier')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=6380)
+    parser.add_argument('--unix', default=None)
+    args = parser.parse_args()
+    
+    server = RespServer(args.host, args.port, args.unix)
+    print(f'Serving {server.url}')
+    server.server.serve_forever()
@@ -1,10 +1,21 @@
 import os
+from functools import lru_cache
 from flask import Flask, request, jsonify
-from core.pipeline import Pipeline
 
 app = Flask(__name__)
 yaml_path = os.path.join(os.path.dirname(__file__), '..', 'master_registry.yaml')
-pipeline = Pipeline(yaml_path)
+
+@lru_cache(maxsize=None)
+def get_pipeline():
+    from core.pipeline import Pipeline
+    
+    cache_store = None
+    cache_url = os.getenv('CLC_CACHE_URL')
+    if cache_url:
+        from tiered_cache_store import TieredCacheStore
+        cache_store = TieredCacheStore.from_url(cache_url)
+        cache_store.warm()
+    return Pipeline(yaml_path, cache_store=cache_store)
 
 @app.route('/resolve', methods=['POST'])
 def resolve():
@@ -13,12 +24,26 @@ def resolve():
         ua = request.headers.get('User-Agent', '')
         token = request.headers.get('Authorization', '')
         
-        response = pipeline.execute(payload, ua, token)
+        response = get_pipeline().execute(payload, ua, token)
         return jsonify(response), response.get('status', 200)
     
     except Exception as e:
         return jsonify({'status': 500, 'data': None, 'mask': '0x0000'}), 500
 
+@app.route('/resolve/batch', methods=['POST'])
+def resolve_batch():
+    try:
+        payloads = request.get_json()
+        if not isinstance(payloads, list):
+            return jsonify({'status': 400, 'data': None, 'mask': '0x0000'}), 400
+        ua = request.headers.get('User-Agent', '')
+        token = request.headers.get('Authorization', '')
+        
+        return jsonify(get_pipeline().execute_batch(payloads, ua, token)), 200
+    
+    except Exception as e:
+        return jsonify({'status': 500, 'data': None, 'mask': '0x0000'}), 500
+
 @app.route('/', methods=['GET'])
 def index():
     return '''<!DOCTYPE html>
@@ -0,0 +1,261 @@
+from typing import Any, Dict, Optional, Tuple
+from multiprocessing import shared_memory, resource_tracker
+import fcntl
+import hashlib
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import time
+
+_MISS = object()
+
+class SharedCacheStore:
+    MAGIC = 0x434C4353
+    HEADER = struct.Struct('<IIIII')
+    HEADER_SIZE = 64
+    STATS_ROW = struct.Struct('<QQQQ')
+    SLOT_HEADER = struct.Struct('<QQHI')
+    SLOT_FIELDS = struct.Struct('<QHI')
+    SEQ = struct.Struct('<Q')
+    MAX_PROBE = 8
+    MAX_READ_RETRIES = 16
+    
+    def __init__(self, name: Optional[str] = None, slots: int = 4096, slot_size: int = 1024,
+                 stats_rows: int = 64, create: bool = True, ttl: int = 300):
+        self.ttl = ttl
+        
+        if create:
+            size = self.HEADER_SIZE + stats_rows * self.STATS_ROW.size + slots * slot_size
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.HEADER.pack_into(self.shm.buf, 0, self.MAGIC, 1, slots, slot_size, stats_rows)
+        else:
+            self.shm = self._attach(name)
+        
+        magic, _, self.slots, self.slot_size, self.stats_rows = self.HEADER.unpack_from(self.shm.buf, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f'{self.shm.name} is not a shared cache segment')
+        
+        self.buf = self.shm.buf
+        self.stats_offset = self.HEADER_SIZE
+        self.slots_offset = self.stats_offset + self.stats_rows * self.STATS_ROW.size
+        self.capacity = self.slot_size - self.SLOT_HEADER.size
+        self.lock_path = os.path.join(tempfile.gettempdir(), f'{self.shm.name.lstrip("/")}.lock')
+        self._lock_fd: Optional[int] = None
+        self._lock_pid = 0
+        self._row: Optional[int] = None
+        self._row_pid = 0
+    
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    
+    def key_from_payload(self, target: str, caller_mask: int) -> str:
+        combined = f"{target}:{caller_mask}"
+        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        self._count(0 if value is not _MISS else 1)
+        return default if value is _MISS else value
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.time() + ttl if ttl > 0 else 0.0
+        key_bytes = key.encode()
+        value_bytes = pickle.dumps((expires, value), protocol=pickle.HIGHEST_PROTOCOL)
+        if len(key_bytes) + len(value_bytes) > self.capacity:
+            return
+        
+        key_hash = self._hash(key_bytes)
+        with self._locked():
+            offset = self._find_write_slot(key_hash, key_bytes)
+            self._write_slot(offset, key_hash, key_bytes, value_bytes)
+        self._count(2)
+    
+    def clear(self) -> None:
+        empty = bytes(self.slot_size - self.SEQ.size)
+        with self._locked():
+            for index in range(self.slots):
+                offset = self.slots_offset + index * self.slot_size
+                seq = self.SEQ.unpack_from(self.buf, offset)[0]
+                self.SEQ.pack_into(self.buf, offset, seq + 1)
+                self.buf[offset + self.SEQ.size:offset + self.slot_size] = empty
+                self.SEQ.pack_into(self.buf, offset, seq + 2)
+    
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not _MISS
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISS)
+        if value is _MISS:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+    
+    def stats(self) -> Dict[str, Any]:
+        hits = misses = sets = 0
+        workers = {}
+        for row in range(self.stats_rows):
+            pid, row_hits, row_misses, row_sets = self.STATS_ROW.unpack_from(self.buf, self._row_offset(row))
+            if row and pid:
+                workers[pid] = {'hits': row_hits, 'misses': row_misses, 'sets': row_sets}
+            hits += row_hits
+            misses += row_misses
+            sets += row_sets
+        
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'sets': sets,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'workers': workers
+        }
+    
+    def close(self) -> None:
+        if self._lock_fd is not None and self._lock_pid == os.getpid():
+            os.close(self._lock_fd)
+        self._lock_fd = None
+        self.buf = None
+        self.shm.close()
+    
+    def unlink(self) -> None:
+        if sys.version_info < (3, 13):
+            resource_tracker.register(f'/{self.shm.name}', 'shared_memory')
+        self.shm.unlink()
+        if os.path.exists(self.lock_path):
+            os.unlink(self.lock_path)
+    
+    @staticmethod
+    def _attach(name: Optional[str]) -> shared_memory.SharedMemory:
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(f'/{shm.name}', 'shared_memory')
+        return shm
+    
+    def _hash(self, key_bytes: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), 'little') or 1
+    
+    def _slot_offset(self, key_hash: int, probe: int) -> int:
+        return self.slots_offset + ((key_hash + probe) % self.slots) * self.slot_size
+    
+    def _lookup(self, key: str) -> Any:
+        key_bytes = key.encode()
+        key_hash = self._hash(key_bytes)
+        
+        for probe in range(self.MAX_PROBE):
+            found, slot_hash, value = self._read_slot(self._slot_offset(key_hash, probe), key_hash, key_bytes)
+            if found:
+                expires, value = pickle.loads(value)
+                return _MISS if expires and expires <= time.time() else value
+            if not slot_hash:
+                return _MISS
+        return _MISS
+    
+    def _read_slot(self, offset: int, key_hash: int, key_bytes: bytes) -> Tuple[bool, int, bytes]:
+        buf = self.buf
+        for _ in range(self.MAX_READ_RETRIES):
+            seq, slot_hash, key_len, value_len = self.SLOT_HEADER.unpack_from(buf, offset)
+            if seq & 1:
+                continue
+            
+            if slot_hash != key_hash:
+                if seq == self.SEQ.unpack_from(buf, offset)[0]:
+                    return False, slot_hash, b''
+                continue
+            
+            start = offset + self.SLOT_HEADER.size
+            slot_key = bytes(buf[start:start + key_len])
+            value = bytes(buf[start + key_len:start + key_len + value_len])
+            if seq == self.SEQ.unpack_from(buf, offset)[0]:
+                return slot_key == key_bytes, slot_hash, value
+        return False, key_hash, b''
+    
+    def _find_write_slot(self, key_hash: int, key_bytes: bytes) -> int:
+        for probe in range(self.MAX_PROBE):
+            offset = self._slot_offset(key_hash, probe)
+            _, slot_hash, key_len, _ = self.SLOT_HEADER.unpack_from(self.buf, offset)
+            if not slot_hash:
+                return offset
+            start = offset + self.SLOT_HEADER.size
+            if slot_hash == key_hash and bytes(self.buf[start:start + key_len]) == key_bytes:
+                return offset
+        return self._slot_offset(key_hash, 0)
+    
+    def _write_slot(self, offset: int, key_hash: int, key_bytes: bytes, value_bytes: bytes) -> None:
+        seq = self.SEQ.unpack_from(self.buf, offset)[0]
+        self.SEQ.pack_into(self.buf, offset, seq + 1)
+        
+        start = offset + self.SLOT_HEADER.size
+        end = start + len(key_bytes)
+        self.buf[start:end] = key_bytes
+        self.buf[end:end + len(value_bytes)] = value_bytes
+        self.SLOT_FIELDS.pack_into(self.buf, offset + self.SEQ.size, key_hash, len(key_bytes), len(value_bytes))
+        
+        self.SEQ.pack_into(self.buf, offset, seq + 2)
+    
+    def _row_offset(self, row: int) -> int:
+        return self.stats_offset + row * self.STATS_ROW.size
+    
+    def _count(self, field: int) -> None:
+        row = self._stats_row()
+        if row is None:
+            return
+        offset = self._row_offset(row) + (field + 1) * self.SEQ.size
+        self.SEQ.pack_into(self.buf, offset, self.SEQ.unpack_from(self.buf, offset)[0] + 1)
+    
+    def _stats_row(self) -> Optional[int]:
+        pid = os.getpid()
+        if self._row_pid == pid:
+            return self._row
+        
+        self._row = None
+        self._row_pid = pid
+        with self._locked():
+            for row in range(1, self.stats_rows):
+                row_pid, hits, misses, sets = self.STATS_ROW.unpack_from(self.buf, self._row_offset(row))
+                if row_pid == pid:
+                    self._row = row
+                    break
+                if not row_pid or not self._alive(row_pid):
+                    self._retire(hits, misses, sets)
+                    self.STATS_ROW.pack_into(self.buf, self._row_offset(row), pid, 0, 0, 0)
+                    self._row = row
+                    break
+        return self._row
+    
+    def _retire(self, hits: int, misses: int, sets: int) -> None:
+        _, retired_hits, retired_misses, retired_sets = self.STATS_ROW.unpack_from(self.buf, self.stats_offset)
+        self.STATS_ROW.pack_into(self.buf, self.stats_offset, 0, retired_hits + hits,
+                                 retired_misses + misses, retired_sets + sets)
+    
+    def _alive(self, pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+    
+    def _locked(self) -> '_FileLock':
+        pid = os.getpid()
+        if self._lock_fd is None or self._lock_pid != pid:
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._lock_pid = pid
+        return _FileLock(self._lock_fd)
+
+class _FileLock:
+    def __init__(self, fd: int):
+        self.fd = fd
+    
+    def __enter__(self) -> None:
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+    
+    def __exit__(self, *exc: Any) -> None:
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
@@ -0,0 +1,52 @@
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The root modules import their dataclasses with ``from types import ...``,
+# which only works when ``types.py`` shadows the stdlib module. Graft them
+# onto the real ``types`` module so the root can sit on sys.path safely.
+_spec = importlib.util.spec_from_file_location("clc_root_types", os.path.join(ROOT, "types.py"))
+_root_types = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_root_types)
+for _name in ("Coordinate", "Mask", "Payload", "Context", "SwapPair", "Response"):
+    setattr(types, _name, getattr(_root_types, _name))
+
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+
+REGISTRY_DATA = {
+    "layer1_human_map": {
+        "COORD_X101": {
+            "label": "User_Profile_Name",
+            "description": "Display name for the user profile",
+            "schema_type": "Person",
+        },
+        "COORD_X102": {
+            "label": "Dashboard_Stats",
+            "description": "Aggregated dashboard statistics",
+            "schema_type": "Dataset",
+        },
+    },
+    "layer2_coordinate_registry": {
+        "COORD_X101": "1010.0101@",
+        "COORD_X102": "1020.0202@",
+    },
+    "layer3_bitmask_core": {
+        "COORD_X101": 0x0101,
+        "COORD_X102": 0x0202,
+    },
+}
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    path = tmp_path / "master_registry.yaml"
+    path.write_text(yaml.safe_dump(REGISTRY_DATA))
+    return str(path)
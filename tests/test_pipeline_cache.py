@@ -0,0 +1,53 @@
+import pytest
+
+import core.pipeline
+import pipeline
+
+
+@pytest.fixture(params=[pipeline.Pipeline, core.pipeline.Pipeline], ids=["flat", "core"])
+def make_pipeline(request, registry_path):
+    return lambda **kwargs: request.param(registry_path, **kwargs)
+
+
+def resolver_of(pipe):
+    return getattr(pipe, "type_resolver", None) or pipe.resolver
+
+
+def count_calls(monkeypatch, node):
+    calls = []
+    process = node.process
+    monkeypatch.setattr(node, "process", lambda data: calls.append(1) or process(data))
+    return calls
+
+
+def test_cache_hit_skips_downstream_nodes(make_pipeline, monkeypatch):
+    store = {}
+    pipe = make_pipeline(cache_store=store)
+    calls = count_calls(monkeypatch, resolver_of(pipe))
+
+    first = pipe.execute({"target": "COORD_X101", "payload": "a"}, "Googlebot/2.1")
+    second = pipe.execute({"target": "COORD_X101", "payload": "b"}, "Googlebot/2.1")
+
+    assert first == second
+    assert first["data"]["label"] == "User_Profile_Name"
+    assert len(calls) == 1
+    assert len(store) == 1
+
+
+def test_cache_is_keyed_by_caller_mask(make_pipeline):
+    pipe = make_pipeline()
+    public = pipe.execute({"target": "COORD_X101"}, "Mozilla/5.0")
+    private = pipe.execute({"target": "COORD_X101"}, "Mozilla/5.0", "Bearer token")
+
+    assert "label" in public["data"]
+    assert private["data"]["coord"] == "COORD_X101"
+    assert pipe.execute({"target": "COORD_X101"}, "Mozilla/5.0") == public
+
+
+def test_invalid_requests_are_not_cached(make_pipeline):
+    store = {}
+    pipe = make_pipeline(cache_store=store)
+
+    assert pipe.execute({"target": ""})["status"] == 400
+    assert pipe.execute({"target": "COORD_X101", "payload": object()})["status"] == 400
+    assert store == {}
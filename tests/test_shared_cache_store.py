@@ -0,0 +1,131 @@
+import multiprocessing
+import pickle
+import time
+import uuid
+
+import pytest
+
+from shared_cache_store import SharedCacheStore
+
+fork = multiprocessing.get_context("fork")
+
+
+@pytest.fixture
+def store():
+    store = SharedCacheStore(name=f"clc-test-{uuid.uuid4().hex[:8]}", slots=64, slot_size=256)
+    yield store
+    store.close()
+    store.unlink()
+
+
+def run_in_child(target, *args):
+    results = fork.Queue()
+    process = fork.Process(target=lambda: results.put(target(*args)))
+    process.start()
+    result = results.get(timeout=10)
+    process.join(timeout=10)
+    assert process.exitcode == 0
+    return result
+
+
+def test_get_set_across_processes(store):
+    store["parent"] = {"coord": "COORD_X101"}
+
+    def child(name):
+        worker = SharedCacheStore(name=name, create=False)
+        worker["child"] = [1, 2, 3]
+        value = worker.get("parent")
+        worker.close()
+        return value
+
+    assert run_in_child(child, store.name) == {"coord": "COORD_X101"}
+    assert store["child"] == [1, 2, 3]
+    assert SharedCacheStore(name=store.name, create=False).get("child") == [1, 2, 3]
+
+
+def test_entries_expire_after_ttl(store, monkeypatch):
+    store.set("short", "value", ttl=10)
+    store.set("forever", "value", ttl=0)
+    assert store.get("short") == "value"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert store.get("short", "expired") == "expired"
+    assert "short" not in store
+    assert store.get("forever") == "value"
+
+
+def test_reader_retries_when_a_write_lands_mid_read(store):
+    store["key"] = "old"
+    key_bytes = b"key"
+    key_hash = store._hash(key_bytes)
+    offset = store._slot_offset(key_hash, 0)
+    header = store.SLOT_HEADER
+    reads = []
+
+    class ConcurrentWriteHeader:
+        size = header.size
+
+        def unpack_from(self, buf, at):
+            fields = header.unpack_from(buf, at)
+            reads.append(fields[0])
+            if len(reads) == 1:
+                value = pickle.dumps((0.0, "new"))
+                store._write_slot(offset, key_hash, key_bytes, value)
+            return fields
+
+    store.SLOT_HEADER = ConcurrentWriteHeader()
+    assert store.get("key") == "new"
+    assert reads[1] == reads[0] + 2
+
+
+def test_reader_gives_up_on_a_stuck_write(store):
+    store["key"] = "value"
+    offset = store._slot_offset(store._hash(b"key"), 0)
+    seq = store.SEQ.unpack_from(store.buf, offset)[0]
+
+    store.SEQ.pack_into(store.buf, offset, seq + 1)
+    assert store.get("key", "miss") == "miss"
+
+    store.SEQ.pack_into(store.buf, offset, seq + 2)
+    assert store.get("key") == "value"
+
+
+def test_probe_overflow_overwrites_first_probe(store, monkeypatch):
+    monkeypatch.setattr(store, "_hash", lambda key_bytes: 7)
+    keys = [f"key-{i}" for i in range(store.MAX_PROBE + 1)]
+    for key in keys:
+        store[key] = key
+
+    assert keys[0] not in store
+    assert all(store.get(key) == key for key in keys[1:])
+
+
+def test_oversized_values_are_not_cached(store):
+    store["big"] = "x" * store.slot_size
+    assert "big" not in store
+    assert store.stats()["sets"] == 0
+
+
+def test_stats_aggregate_workers_and_retire_dead_ones():
+    store = SharedCacheStore(name=f"clc-test-{uuid.uuid4().hex[:8]}", slots=64, slot_size=256, stats_rows=2)
+
+    def child(name, key):
+        worker = SharedCacheStore(name=name, create=False)
+        worker.get(key)
+        worker[key] = key
+        worker.get(key)
+        worker.close()
+        return True
+
+    try:
+        for key in ("a", "b", "c"):
+            assert run_in_child(child, store.name, key)
+
+        stats = store.stats()
+        assert (stats["hits"], stats["misses"], stats["sets"]) == (3, 3, 3)
+        assert stats["hit_rate"] == 0.5
+        assert len(stats["workers"]) == 1
+    finally:
+        store.close()
+        store.unlink()
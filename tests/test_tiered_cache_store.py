@@ -0,0 +1,179 @@
+import pickle
+import socket
+import time
+
+import pytest
+
+from resp import RespClient, RespServer
+from tiered_cache_store import TieredCacheStore
+
+
+@pytest.fixture
+def server():
+    with RespServer() as server:
+        yield server
+
+
+@pytest.fixture
+def make_store(server):
+    stores = []
+
+    def make(**options):
+        store = TieredCacheStore.from_url(server.url, **options)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestRespClient:
+    def test_commands_round_trip(self, server):
+        client = RespClient(server.url)
+        assert client.ping()
+        client.mset({"a": b"1", "b": b"2"}, ttl_ms=60_000)
+        assert client.mget(["a", "missing", "b"]) == [b"1", None, b"2"]
+        assert sorted(client.scan_iter("*", count=1)) == ["a", "b"]
+        assert client.delete("a", "b") == 2
+        assert client.get("a") is None
+        client.close()
+
+    def test_values_expire(self, server):
+        client = RespClient(server.url)
+        client.set("short", b"x", ttl_ms=1)
+        time.sleep(0.01)
+        assert client.get("short") is None
+        client.close()
+
+    def test_unix_socket(self, tmp_path):
+        with RespServer(unix_path=str(tmp_path / "resp.sock")) as server:
+            client = RespClient(server.url)
+            client.set("key", b"value")
+            assert client.get("key") == b"value"
+            client.close()
+
+
+class TestTieredCacheStore:
+    def test_l1_then_l2_hits(self, make_store):
+        writer = make_store()
+        writer["key"] = {"status": 200, "data": {"label": "User_Profile_Name"}}
+        assert writer["key"]["status"] == 200
+        assert writer.stats()["l1"]["hits"] == 1
+
+        reader = make_store()
+        assert reader.get_many(["key", "missing"]) == {"key": writer["key"]}
+        assert reader["key"] == writer["key"]
+        stats = reader.stats()
+        assert (stats["l1"]["hits"], stats["l1"]["misses"]) == (1, 2)
+        assert (stats["l2"]["hits"], stats["l2"]["misses"]) == (1, 1)
+
+    def test_negative_entries_are_distinct_from_misses(self, make_store, server):
+        store = make_store(negative_ttl=30)
+        store.set_negative("unknown")
+
+        assert store.get("unknown", "miss") is None
+        assert store.get("absent", "miss") == "miss"
+        assert "unknown" in store and "absent" not in store
+        assert make_store().get("unknown", "miss") is None
+        assert 0 < server.store.cmd_pttl(b"clc:cache:unknown") <= 30_000
+
+    def test_l2_values_are_json_not_pickle(self, make_store, server):
+        store = make_store()
+        store["key"] = {"coord": "COORD_X101"}
+        assert server.store.cmd_get(b"clc:cache:key") == b'\x01{"coord":"COORD_X101"}'
+
+        client = RespClient(server.url)
+        client.set("clc:cache:pickled", b"\x01" + pickle.dumps({"coord": "x"}))
+        client.close()
+        assert make_store().get("pickled", "miss") == "miss"
+        assert make_store().stats()["l2"]["errors"] == 0
+
+    def test_warm_preloads_l1(self, make_store):
+        writer = make_store()
+        writer.set_many({f"key-{i}": i for i in range(10)})
+        writer.set_negative("unknown")
+
+        reader = make_store()
+        assert reader.warm(limit=5) == 5
+        assert reader.stats()["l1"]["entries"] == 5
+        assert make_store().warm() == 11
+
+    def test_l1_evicts_least_recently_used(self, make_store):
+        store = make_store(l1_size=2)
+        store.set_many({"a": 1, "b": 2})
+        store.get("a")
+        store["c"] = 3
+
+        assert list(store.l1) == ["a", "c"]
+        assert store.stats()["l1"]["evictions"] == 1
+
+    def test_falls_back_to_l1_when_l2_is_down(self, monkeypatch):
+        port = free_port()
+        store = TieredCacheStore.from_url(f"redis://127.0.0.1:{port}/0", retry_interval=5)
+        store["key"] = "value"
+
+        assert store["key"] == "value"
+        assert store.get("missing", "miss") == "miss"
+        stats = store.stats()
+        assert stats["l2"]["errors"] == 1
+        assert stats["l2"]["available"] is False
+
+        with RespServer(port=port) as server:
+            store.set("during-outage", "l1 only")
+            assert server.store.cmd_dbsize() == 0
+
+            now = time.monotonic()
+            monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+            store.set("after-retry", "both tiers")
+            assert server.store.cmd_get(b"clc:cache:after-retry") == b'\x01"both tiers"'
+            assert store.stats()["l2"]["available"] is True
+        store.close()
+
+
+def test_pipeline_uses_tiered_store_for_batches(registry_path, make_store):
+    from core.pipeline import Pipeline
+
+    store = make_store()
+    pipe = Pipeline(registry_path, cache_store=store)
+    payloads = [{"target": "COORD_X101"}, {"target": "COORD_UNKNOWN"}, {"target": ""}]
+
+    first = pipe.execute_batch(payloads, "Mozilla/5.0")
+    assert [response["status"] for response in first] == [200, 200, 400]
+    assert store.get("absent", "miss") == "miss"
+    assert store.get(pipe.cache._key({"target": "COORD_UNKNOWN", "mask": 0x0400}), "miss") is None
+
+    warm = Pipeline(registry_path, cache_store=make_store())
+    calls = []
+    process = warm.resolver.process
+    warm.resolver.process = lambda data: calls.append(data.get("resolved")) or process(data)
+
+    assert warm.execute_batch(payloads, "Mozilla/5.0") == first
+    assert calls == [False, None]
+    assert warm.cache.store.stats()["l2"]["hits"] == 2
+
+
+def test_universal_resolver_uses_tiered_store(registry_path, make_store, server):
+    from registry import MasterRegistry
+    from types import Mask, Response
+    from universal_resolver import UniversalResolver
+
+    registry = MasterRegistry(registry_path)
+    payload = {"target": "COORD_X101", "payload": {"label": "User_Profile_Name"}}
+
+    first = UniversalResolver(registry, cache=make_store()).resolve(payload, "Googlebot/2.1")
+    assert isinstance(first, Response)
+    assert server.store.cmd_dbsize() == 1
+
+    warm = UniversalResolver(registry, cache=make_store())
+    warm.transformer.transform = lambda *args: pytest.fail("cache miss")
+    cached = warm.resolve(payload, "Googlebot/2.1")
+    assert cached == first
+    assert cached.mask == Mask(first.mask.bits)
+    assert warm.cache.stats()["l2"]["hits"] == 1
@@ -0,0 +1,114 @@
+import threading
+from types import Mask
+
+import pytest
+
+import nodes_core
+from nodes.processing import TransformerNode
+from transformer import COMPILE_LIMIT, TRANSFORM_BIT, Transformer
+
+
+def tag(name):
+    return lambda data: data + [name]
+
+
+class TestTransformer:
+    def test_required_and_forbidden_bits(self):
+        transformer = Transformer()
+        transformer.add_rule(tag("bot"), required=0x0100)
+        transformer.add_rule(tag("anonymous"), forbidden=0x0200)
+
+        assert transformer.transform([], Mask(0x0100)) == ["bot", "anonymous"]
+        assert transformer.transform([], Mask(0x0300)) == ["bot"]
+        assert transformer.transform([], Mask(0x0200)) == []
+        assert transformer.relevant_bits == 0x0300
+
+    def test_priority_then_registration_order(self):
+        transformer = Transformer()
+        transformer.add_rule(tag("first"))
+        transformer.add_rule(tag("urgent"), priority=10)
+        transformer.add_rule(tag("second"))
+
+        assert transformer.transform([], Mask(0)) == ["urgent", "first", "second"]
+        assert [rule.order for rule in transformer.rules] == [0, 1, 2]
+
+    def test_register_transform_matches_exact_mask_with_transform_bit(self):
+        transformer = Transformer()
+        transformer.register_transform(0x0900, tag("exact"))
+
+        assert transformer.transform([], Mask(0x0900)) == ["exact"]
+        assert transformer.transform([], Mask(0x0100)) == []
+        assert transformer.transform([], Mask(0x0B00)) == []
+
+        transformer.register_transform(0x0900, tag("replaced"))
+        assert transformer.transform([], Mask(0x0900)) == ["replaced"]
+        assert len(transformer.rules) == 1
+
+    def test_rules_added_after_dispatch_are_picked_up(self):
+        transformer = Transformer()
+        transformer.add_rule(tag("a"), required=0x1)
+        assert transformer.dispatch(0x1)
+
+        transformer.add_rule(tag("b"), required=0x2)
+        assert transformer.transform([], Mask(0x3)) == ["a", "b"]
+
+    def test_wide_rule_sets_are_memoised_per_key(self):
+        transformer = Transformer()
+        for bit in range(COMPILE_LIMIT + 2):
+            transformer.add_rule(tag(bit), required=1 << bit)
+
+        assert transformer.transform([], Mask(0b101)) == [0, 2]
+        assert transformer.dispatch(0b101) is transformer.dispatch(0b101 | 1 << 20)
+
+    def test_transform_many_resolves_chain_once(self):
+        transformer = Transformer()
+        transformer.add_rule(lambda data: data * 2, required=0x1)
+        items = [1, 2, 3]
+
+        assert transformer.transform_many(items, Mask(0x1)) == [2, 4, 6]
+        assert transformer.transform_many(items, Mask(0x0)) == items
+
+    def test_transforms_view_is_read_only(self):
+        transformer = Transformer()
+        fn = tag("exact")
+        transformer.register_transform(0x0900, fn)
+
+        assert dict(transformer.transforms) == {0x0900: fn}
+        with pytest.raises(TypeError):
+            transformer.transforms[0x0A00] = fn
+
+    def test_dispatch_while_rules_change(self):
+        transformer = Transformer()
+        transformer.add_rule(tag("base"), required=0x1)
+        errors = []
+        stop = threading.Event()
+
+        def dispatch():
+            while not stop.is_set():
+                chain = transformer.dispatch(0x1)
+                if not chain or chain[0]([]) != ["base"]:
+                    errors.append(chain)
+
+        readers = [threading.Thread(target=dispatch) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for bit in range(1, 16):
+            transformer.add_rule(tag(bit), required=0x1 | 1 << bit)
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert transformer.transform([], Mask(0x1 | 1 << 15)) == ["base", 15]
+
+
+@pytest.mark.parametrize("node_class", [TransformerNode, nodes_core.TransformerNode])
+def test_transformer_nodes_apply_rules(node_class):
+    node = node_class()
+    node.add_rule(str.upper, required=TRANSFORM_BIT)
+    items = [{"mask": TRANSFORM_BIT, "payload": "a"}, {"mask": 0, "payload": "b"}]
+
+    assert node.process(dict(items[0]))["payload"] == "A"
+    assert [data["payload"] for data in node.process_batch(items)] == ["A", "b"]
+    with pytest.raises(TypeError):
+        node.transforms[TRANSFORM_BIT] = str.lower
@@ -0,0 +1,257 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+import time
+
+from resp import RespClient, RespError
+from types import Mask, Response
+
+_MISS = object()
+_NEGATIVE = b'\x00'
+_VALUE = b'\x01'
+_RESPONSE = b'\x02'
+
+class TieredCacheStore:
+    WARM_BATCH = 500
+    
+    def __init__(self, l2: Optional[RespClient] = None, ttl: int = 300, l1_ttl: Optional[int] = None,
+                 l1_size: int = 4096, negative_ttl: int = 30, prefix: str = 'clc:cache:',
+                 retry_interval: float = 5.0):
+        self.l2 = l2
+        self.ttl = ttl
+        self.l1_ttl = l1_ttl if l1_ttl is not None else ttl
+        self.l1_size = l1_size
+        self.negative_ttl = negative_ttl
+        self.prefix = prefix
+        self.retry_interval = retry_interval
+        
+        self.l1: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._l2_down_until = 0.0
+        self._stats = {
+            'l1': {'hits': 0, 'misses': 0, 'negative_hits': 0, 'evictions': 0, 'lookups': 0, 'latency': 0.0, 'latency_max': 0.0},
+            'l2': {'hits': 0, 'misses': 0, 'negative_hits': 0, 'errors': 0, 'lookups': 0, 'latency': 0.0, 'latency_max': 0.0}
+        }
+    
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 0.25, **options: Any) -> 'TieredCacheStore':
+        return cls(RespClient(url, timeout=timeout), **options)
+    
+    def key_from_payload(self, target: str, caller_mask: int) -> str:
+        combined = f"{target}:{caller_mask}"
+        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.get_many([key]).get(key, _MISS)
+        return default if value is _MISS else value
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        started = time.perf_counter()
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                value = self._l1_lookup(key, now)
+                if value is _MISS:
+                    missing.append(key)
+                else:
+                    found[key] = value
+        self._record('l1', started, hits=len(found), misses=len(missing),
+                     negative_hits=sum(value is None for value in found.values()))
+        
+        if missing:
+            found.update(self._l2_get_many(missing))
+        return found
+    
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+    
+    def set_many(self, items: Dict[str, Any]) -> None:
+        positive = {self.prefix + key: self._encode(value) for key, value in items.items() if value is not None}
+        negative = {self.prefix + key: _NEGATIVE for key, value in items.items() if value is None}
+        
+        with self._lock:
+            now = time.monotonic()
+            for key, value in items.items():
+                self._l1_store(key, value, now)
+        
+        if positive:
+            self._l2_call(lambda l2: l2.mset(positive, self.ttl * 1000))
+        if negative:
+            self._l2_call(lambda l2: l2.mset(negative, self.negative_ttl * 1000))
+    
+    def set_negative(self, key: str) -> None:
+        self.set_many({key: None})
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.l1.pop(key, None)
+        self._l2_call(lambda l2: l2.delete(self.prefix + key))
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.l1.clear()
+        self._l2_call(lambda l2: self._l2_clear(l2))
+    
+    def warm(self, limit: Optional[int] = None) -> int:
+        limit = self.l1_size if limit is None else min(limit, self.l1_size)
+        if limit <= 0:
+            return 0
+        
+        def load(l2: RespClient) -> int:
+            loaded = 0
+            batch: List[str] = []
+            for l2_key in l2.scan_iter(self.prefix + '*', count=self.WARM_BATCH):
+                batch.append(l2_key)
+                if len(batch) >= min(self.WARM_BATCH, limit - loaded):
+                    loaded += self._warm_batch(l2, batch)
+                    batch = []
+                if loaded >= limit:
+                    return loaded
+            return loaded + (self._warm_batch(l2, batch) if batch else 0)
+        
+        loaded = self._l2_call(load)
+        return loaded or 0
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISS) is not _MISS
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISS)
+        if value is _MISS:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+    
+    def stats(self) -> Dict[str, Any]:
+        tiers = {}
+        with self._lock:
+            for tier, counters in self._stats.items():
+                lookups = counters['hits'] + counters['misses']
+                tiers[tier] = {
+                    'hits': counters['hits'],
+                    'misses': counters['misses'],
+                    'negative_hits': counters['negative_hits'],
+                    'hit_rate': counters['hits'] / lookups if lookups else 0.0,
+                    'avg_latency_ms': counters['latency'] * 1000 / counters['lookups'] if counters['lookups'] else 0.0,
+                    'max_latency_ms': counters['latency_max'] * 1000
+                }
+            tiers['l1']['entries'] = len(self.l1)
+            tiers['l1']['evictions'] = self._stats['l1']['evictions']
+            tiers['l2']['errors'] = self._stats['l2']['errors']
+            tiers['l2']['available'] = self.l2 is not None and time.monotonic() >= self._l2_down_until
+        
+        requests = tiers['l1']['hits'] + tiers['l1']['misses']
+        hits = tiers['l1']['hits'] + tiers['l2']['hits']
+        tiers['hit_rate'] = hits / requests if requests else 0.0
+        return tiers
+    
+    def close(self) -> None:
+        if self.l2 is not None:
+            self.l2.close()
+    
+    def _l1_lookup(self, key: str, now: float) -> Any:
+        entry = self.l1.get(key)
+        if entry is None:
+            return _MISS
+        value, expires = entry
+        if expires <= now:
+            del self.l1[key]
+            return _MISS
+        self.l1.move_to_end(key)
+        return value
+    
+    def _l1_store(self, key: str, value: Any, now: float, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.negative_ttl if value is None else self.l1_ttl
+        self.l1[key] = (value, now + ttl)
+        self.l1.move_to_end(key)
+        while len(self.l1) > self.l1_size:
+            self.l1.popitem(last=False)
+            self._stats['l1']['evictions'] += 1
+    
+    def _l2_get_many(self, keys: List[str]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        values = self._l2_call(lambda l2: [
+            self._decode(blob) if blob else _MISS
+            for blob in l2.mget([self.prefix + key for key in keys])
+        ])
+        if values is None:
+            return {}
+        
+        found = {key: value for key, value in zip(keys, values) if value is not _MISS}
+        
+        with self._lock:
+            now = time.monotonic()
+            for key, value in found.items():
+                self._l1_store(key, value, now)
+        self._record('l2', started, hits=len(found), misses=len(keys) - len(found),
+                     negative_hits=sum(value is None for value in found.values()))
+        return found
+    
+    def _warm_batch(self, l2: RespClient, l2_keys: List[str]) -> int:
+        blobs = l2.mget(l2_keys)
+        loaded = 0
+        with self._lock:
+            now = time.monotonic()
+            for l2_key, blob in zip(l2_keys, blobs):
+                value = self._decode(blob) if blob else _MISS
+                if value is _MISS:
+                    continue
+                self._l1_store(l2_key[len(self.prefix):], value, now)
+                loaded += 1
+        return loaded
+    
+    def _l2_clear(self, l2: RespClient) -> None:
+        keys = list(l2.scan_iter(self.prefix + '*'))
+        for start in range(0, len(keys), self.WARM_BATCH):
+            l2.delete(*keys[start:start + self.WARM_BATCH])
+    
+    def _l2_call(self, call: Any) -> Any:
+        if self.l2 is None or time.monotonic() < self._l2_down_until:
+            return None
+        try:
+            return call(self.l2)
+        except (OSError, ConnectionError, RespError):
+            with self._lock:
+                self._stats['l2']['errors'] += 1
+            self._l2_down_until = time.monotonic() + self.retry_interval
+            return None
+    
+    def _encode(self, value: Any) -> bytes:
+        if isinstance(value, Response):
+            tag, value = _RESPONSE, [value.status_code, value.data, value.mask.bits]
+        else:
+            tag = _VALUE
+        return tag + json.dumps(value, separators=(',', ':')).encode()
+    
+    def _decode(self, blob: bytes) -> Any:
+        tag = blob[:1]
+        if tag == _NEGATIVE:
+            return None
+        if tag not in (_VALUE, _RESPONSE):
+            return _MISS
+        try:
+            value = json.loads(blob[1:])
+            if tag == _RESPONSE:
+                status_code, data, bits = value
+                return Response(status_code, data, Mask(bits))
+            return value
+        except (ValueError, TypeError):
+            return _MISS
+    
+    def _record(self, tier: str, started: float, hits: int, misses: int, negative_hits: int) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            counters = self._stats[tier]
+            counters['hits'] += hits
+            counters['misses'] += misses
+            counters['negative_hits'] += negative_hits
+            counters['lookups'] += 1
+            counters['latency'] += elapsed
+            counters['latency_max'] = max(counters['latency_max'], elapsed)
@@ -1,18 +1,136 @@
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from collections.abc import Mapping
+import itertools
 from types import Mask
 import time
 
+TRANSFORM_BIT = 0x0800
+MASK_BITS = 0xFFFF
+COMPILE_LIMIT = 12
+
+class TransformRule:
+    __slots__ = ('fn', 'required', 'forbidden', 'priority', 'order')
+    
+    def __init__(self, fn: Callable[[Any], Any], required: int, forbidden: int, priority: int, order: int):
+        self.fn = fn
+        self.required = required
+        self.forbidden = forbidden
+        self.priority = priority
+        self.order = order
+    
+    def matches(self, bits: int) -> bool:
+        return bits & self.required == self.required and not bits & self.forbidden
+
+class TransformView(Mapping):
+    __slots__ = ('_transforms',)
+    
+    def __init__(self, transforms: Dict[int, Callable[[Any], Any]]):
+        self._transforms = transforms
+    
+    def __getitem__(self, mask_bits: int) -> Callable[[Any], Any]:
+        return self._transforms[mask_bits]
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._transforms)
+    
+    def __len__(self) -> int:
+        return len(self._transforms)
+    
+    def __repr__(self) -> str:
+        return f'TransformView({self._transforms!r})'
+
+class _Compiled:
+    __slots__ = ('generation', 'relevant_bits', 'rules', 'table')
+    
+    def __init__(self, generation: int, relevant_bits: int, rules: Tuple[Tuple[Callable[[Any], Any], TransformRule], ...],
+                 table: Dict[int, Tuple[Callable[[Any], Any], ...]]):
+        self.generation = generation
+        self.relevant_bits = relevant_bits
+        self.rules = rules
+        self.table = table
+    
+    def match(self, key: int) -> Tuple[Callable[[Any], Any], ...]:
+        return tuple(fn for fn, rule in self.rules if rule.matches(key))
+
 class Transformer:
     def __init__(self):
-        self.transforms: Dict[int, Callable[[Any], Any]] = {}
+        self._transforms: Dict[int, Callable[[Any], Any]] = {}
+        self._exact: Dict[int, TransformRule] = {}
+        self.rules: List[TransformRule] = []
+        self._generations = itertools.count(1)
+        self._generation = 0
+        self._compiled = _Compiled(0, 0, (), {0: ()})
+    
+    @property
+    def transforms(self) -> TransformView:
+        return TransformView(self._transforms)
+    
+    @property
+    def relevant_bits(self) -> int:
+        return self._compiled.relevant_bits
     
     def register_transform(self, mask_bits: int, fn: Callable[[Any], Any]) -> None:
-        self.transforms[mask_bits] = fn
+        self._transforms[mask_bits] = fn
+        rule = self._exact.get(mask_bits)
+        if rule is None:
+            self._exact[mask_bits] = self.add_rule(fn, required=mask_bits | TRANSFORM_BIT, forbidden=MASK_BITS & ~mask_bits)
+        else:
+            rule.fn = fn
+            self._generation = next(self._generations)
+    
+    def add_rule(self, fn: Callable[[Any], Any], required: int = 0, forbidden: int = 0, priority: int = 0) -> TransformRule:
+        rule = TransformRule(fn, required, forbidden, priority, len(self.rules))
+        self.rules.append(rule)
+        self._generation = next(self._generations)
+        return rule
+    
+    def compile(self) -> None:
+        self._compile()
+    
+    def dispatch(self, bits: int) -> Tuple[Callable[[Any], Any], ...]:
+        compiled = self._compiled
+        if compiled.generation != self._generation:
+            compiled = self._compile()
+        
+        key = bits & compiled.relevant_bits
+        chain = compiled.table.get(key)
+        if chain is None:
+            chain = compiled.table[key] = compiled.match(key)
+        return chain
     
     def transform(self, data: Any, mask: Mask) -> Any:
-        if mask.bits & 0x0800:
-            transform = self.transforms.get(mask.bits)
-            if transform:
-                return transform(data)
+        for fn in self.dispatch(mask.bits):
+            data = fn(data)
         
         return data
+    
+    def transform_many(self, items: List[Any], mask: Mask) -> List[Any]:
+        chain = self.dispatch(mask.bits)
+        if not chain:
+            return list(items)
+        
+        results = []
+        for data in items:
+            for fn in chain:
+                data = fn(data)
+            results.append(data)
+        return results
+    
+    def _compile(self) -> _Compiled:
+        generation = self._generation
+        rules = sorted(self.rules, key=lambda rule: (-rule.priority, rule.order))
+        relevant_bits = 0
+        for rule in rules:
+            relevant_bits |= rule.required | rule.forbidden
+        
+        compiled = _Compiled(generation, relevant_bits, tuple((rule.fn, rule) for rule in rules), {})
+        if bin(relevant_bits).count('1') <= COMPILE_LIMIT:
+            key = relevant_bits
+            while True:
+                compiled.table[key] = compiled.match(key)
+                if key == 0:
+                    break
+                key = (key - 1) & relevant_bits
+        
+        self._compiled = compiled
+        return compiled
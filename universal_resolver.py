@@ -1,3 +1,4 @@
+from typing import Any, Optional
 from types import Payload, Context, Response, Mask
 from registry import MasterRegistry
 from mask_detector import MaskDetector
@@ -8,14 +9,14 @@ from transformer import Transformer
 from cache_store import CacheStore
 
 class UniversalResolver:
-    def __init__(self, registry: MasterRegistry):
+    def __init__(self, registry: MasterRegistry, cache: Optional[Any] = None):
         self.registry = registry
         self.detector = MaskDetector()
         self.vault = SwapVault()
         self.validator = Validator()
         self.sanitizer = Sanitizer()
         self.transformer = Transformer()
-        self.cache = CacheStore()
+        self.cache = cache if cache is not None else CacheStore()
         self._initialize_vault()
     
     def _initialize_vault(self) -> None:
@@ -44,7 +45,7 @@ class UniversalResolver:
         mask = self.detector.detect(user_agent, auth_token)
         context = Context(user_agent, auth_token, mask)
         
-        cache_key = self.cache.key_from_payload(payload.target, user_agent)
+        cache_key = self.cache.key_from_payload(payload.target, mask.bits)
         cached = self.cache.get(cache_key)
         if cached:
             return cached